@@ -0,0 +1,115 @@
+"""
+추론 해상도 벤치마크
+같은 영상을 여러 추론 해상도로 처리하여 프레임당 감지 지연과 히트 이벤트 일치율을 비교합니다.
+기준은 원본(카메라) 해상도 결과이며, 같은 종류의 이벤트가 허용 오차 안에 있으면 일치로 봅니다.
+
+사용법:
+    python -m benchmarks.inference_resolution --video "assets/boxing test mode.mp4" --heights 720 480 360
+"""
+import argparse
+import copy
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from core.config_manager import ConfigManager
+from core.judgment_records import HitEvent
+from core.pose_tracker import PoseTracker
+
+
+def run_video(
+    video_path: str,
+    rules: Dict[str, Any],
+    ui: Dict[str, Any],
+    resolution: Optional[Any],
+    max_frames: Optional[int] = None,
+) -> Tuple[List[float], List[HitEvent]]:
+    """영상을 한 해상도로 처리하고 (프레임별 지연 ms, 히트 이벤트)를 반환합니다.
+
+    영상 시간(CAP_PROP_POS_MSEC)을 now로 사용하므로 실행 속도와 무관하게 결과를 비교할 수 있습니다.
+    """
+    capture = cv2.VideoCapture(video_path)
+    if not capture.isOpened():
+        raise FileNotFoundError(f"영상을 열 수 없습니다: {video_path}")
+    width = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    rules = copy.deepcopy(rules)
+    inference_cfg = rules.setdefault("pose_inference", {})
+    inference_cfg["mode"] = "inline"  # 지연을 프레임 단위로 재기 위해 동기 추론
+    inference_cfg["inference_resolution"] = resolution
+    tracker = PoseTracker(width, height, rules, ui)
+
+    latencies: List[float] = []
+    events: List[HitEvent] = []
+    frame = None
+    try:
+        while max_frames is None or len(latencies) < max_frames:
+            ret, frame = capture.read(frame) if frame is not None else capture.read()
+            if not ret:
+                break
+            now = capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+            start = time.perf_counter()
+            hit_events, _, _ = tracker.process_frame(frame, now)
+            latencies.append((time.perf_counter() - start) * 1000.0)
+            events.extend(hit_events)
+    finally:
+        tracker.close()
+        capture.release()
+    return latencies, events
+
+
+def match_events(
+    reference: List[HitEvent],
+    candidate: List[HitEvent],
+    tolerance: float,
+) -> Tuple[int, int, int]:
+    """기준 이벤트와 후보 이벤트를 1:1로 짝지어 (일치, 누락, 추가) 개수를 반환합니다."""
+    used = [False] * len(candidate)
+    matched = 0
+    for ref in reference:
+        best_i, best_dt = -1, tolerance
+        for i, cand in enumerate(candidate):
+            if used[i] or cand.type != ref.type:
+                continue
+            dt = abs(cand.t_hit - ref.t_hit)
+            if dt <= best_dt:
+                best_i, best_dt = i, dt
+        if best_i >= 0:
+            used[best_i] = True
+            matched += 1
+    return matched, len(reference) - matched, len(candidate) - matched
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="추론 해상도별 감지 지연/히트 이벤트 일치율 비교")
+    parser.add_argument("--video", default="assets/boxing test mode.mp4")
+    parser.add_argument("--heights", type=int, nargs="+", default=[720, 480, 360, 240])
+    parser.add_argument("--max-frames", type=int, default=None)
+    parser.add_argument("--tolerance", type=float, default=0.1, help="이벤트 일치 허용 오차(초)")
+    args = parser.parse_args()
+
+    config = ConfigManager()
+    runs: List[Tuple[str, Optional[int]]] = [("native", None)] + [(f"{h}p", h) for h in args.heights]
+
+    reference: Optional[List[HitEvent]] = None
+    print(f"{'resolution':>10} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'events':>7} {'match':>6} {'miss':>5} {'extra':>6}")
+    for label, resolution in runs:
+        latencies, events = run_video(args.video, config.rules, config.ui, resolution, args.max_frames)
+        if not latencies:
+            print(f"{label:>10} (프레임 없음)")
+            continue
+        if reference is None:
+            reference = events
+        matched, missed, extra = match_events(reference, events, args.tolerance)
+        lat = np.asarray(latencies)
+        print(
+            f"{label:>10} {lat.mean():8.2f} {np.percentile(lat, 50):8.2f} {np.percentile(lat, 95):8.2f} "
+            f"{len(events):7d} {matched:6d} {missed:5d} {extra:6d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+포즈 운동학 마이크로벤치마크
+MediaPipe 추론을 제외한 프레임당 후처리 비용(랜드마크 픽셀 변환 + 잽 운동학 커널 + 판정 정책)을
+합성 랜드마크로 측정합니다. 목표는 프레임당 0.2ms 미만입니다.
+등록된 동작 감지기 전체(GestureRegistry)의 비용과 감지기별 소요 시간도 함께 출력합니다.
+mediapipe가 설치되어 있으면 PoseTracker._analyze_pose 전체(스무딩, 주먹 중심 포함)도 함께 측정합니다.
+
+사용법:
+    python -m benchmarks.pose_kinematics --frames 20000
+"""
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from core.config_manager import ConfigManager
+from core.gestures import GestureFrame, GestureRegistry
+from core.motion_history import MotionHistory
+from core.pose_kinematics import PoseKinematics, ReentryJabPolicy, VelocityJabPolicy
+from core.pose_landmarks import NUM_LANDMARKS, to_pixel_landmarks
+
+
+TARGET_US = 200.0
+
+
+def synthetic_landmarks(frames: int, seed: int = 0) -> np.ndarray:
+    """정규화 좌표 랜드마크 시퀀스 (frames, 33, 4)를 만듭니다. 손목이 주기적으로 앞뒤로 움직입니다."""
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(0.3, 0.7, size=(NUM_LANDMARKS, 4)).astype(np.float32)
+    base[:, 3] = 0.9
+    seq = np.repeat(base[None], frames, axis=0)
+    phase = np.sin(np.arange(frames, dtype=np.float32) * 0.3)
+    seq[:, 15:23, 0] += 0.15 * phase[:, None]
+    seq[:, 15:23, 1] -= 0.10 * phase[:, None]
+    seq[:, :, :2] += rng.normal(0.0, 0.002, size=(frames, NUM_LANDMARKS, 2)).astype(np.float32)
+    return seq
+
+
+def time_per_frame(step: Callable[[int], None], frames: int) -> List[float]:
+    """프레임별 실행 시간(µs) 목록을 반환합니다."""
+    samples = []
+    for i in range(frames):
+        start = time.perf_counter()
+        step(i)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def report(name: str, samples: List[float]) -> None:
+    arr = np.asarray(samples[len(samples) // 10:])  # 워밍업 10% 제외
+    mean = float(arr.mean())
+    p95 = float(np.percentile(arr, 95))
+    verdict = "OK" if p95 < TARGET_US else "초과"
+    print(f"{name:<28} mean {mean:7.1f}µs  p95 {p95:7.1f}µs  (목표 {TARGET_US:.0f}µs: {verdict})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="포즈 운동학 커널 마이크로벤치마크")
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    args = parser.parse_args()
+
+    config = ConfigManager()
+    rules = config.rules
+    ui = config.ui
+    thresholds = rules["action_thresholds"]
+    width, height = args.width, args.height
+
+    seq = synthetic_landmarks(args.frames)
+    frame_dt = 1.0 / 30.0
+    px = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+    hit_zone_ratio = ui.get("positions", {}).get("hit_zone", {}).get("pos_ratio", [0.5, 0.3])
+    hit_zone_radius = ui.get("styles", {}).get("hud", {}).get("hit_zone_radius", 100)
+    kin = PoseKinematics(
+        width,
+        (width * hit_zone_ratio[0], height * hit_zone_ratio[1]),
+        hit_zone_radius,
+        int(rules.get("spatial_judge_mode", 2)),
+    )
+    policies = {
+        "normal": VelocityJabPolicy(thresholds["action_refractory"], thresholds["action_v_thresh"]),
+        "test": ReentryJabPolicy(thresholds["action_refractory"]),
+    }
+
+    print(f"프레임 {args.frames}개, {width}x{height}")
+    for mode, policy in policies.items():
+        kin.reset()
+
+        def step(i: int) -> None:
+            to_pixel_landmarks(seq[i], width, height, out=px, mirror=True)
+            if kin.update(px, i * frame_dt, 300.0):
+                policy.detect(kin, i * frame_dt)
+
+        report(f"kernel + policy ({mode})", time_per_frame(step, args.frames))
+
+    # 등록된 모든 동작 감지기 (모션 기록 포함)
+    history = MotionHistory.from_config(rules.get("motion_history"))
+    registry = GestureRegistry.from_config(rules)
+    frame = GestureFrame(kin, history, {"shoulder_w": 300.0, "duck_line_y": height * 0.5}, width, height, landmarks=px)
+    kin.reset()
+
+    def step_gestures(i: int) -> None:
+        to_pixel_landmarks(seq[i], width, height, out=px, mirror=True)
+        history.push(px[:, :2], i * frame_dt)
+        if kin.update(px, i * frame_dt, 300.0):
+            frame.now = i * frame_dt
+            registry.detect(frame)
+
+    report("kernel + gestures", time_per_frame(step_gestures, args.frames))
+    print("  " + ", ".join(f"{name} {us:.1f}µs" for name, us in registry.timings_us.items()))
+
+    try:
+        from core.pose_tracker import PoseTracker
+    except ImportError as e:
+        print(f"PoseTracker 측정 생략 (mediapipe 없음: {e})")
+        return
+
+    rules["pose_inference"] = dict(rules.get("pose_inference", {}), mode="inline")
+    tracker = PoseTracker(width, height, rules, ui)
+    try:
+        def analyze(i: int) -> None:
+            tracker._analyze_pose(tracker._to_pixels(seq[i]), None, i * frame_dt)
+
+        report("PoseTracker._analyze_pose", time_per_frame(analyze, args.frames))
+    finally:
+        tracker.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+카메라 백엔드 모듈
+플랫폼에 맞는 OpenCV 캡처 백엔드를 고르고 픽셀 포맷/해상도/FPS/버퍼 크기를 협상합니다.
+마지막으로 동작한 장치와 포맷을 캐시 파일에 저장해, 다음 실행부터는 장치 탐색을 건너뜁니다.
+"""
+import glob
+import json
+import os
+import re
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+
+from core.logger import get_logger
+
+
+logger = get_logger()
+
+DEFAULT_CACHE_FILE = ".camera_cache.json"
+
+
+@dataclass
+class CameraProfile:
+    """협상이 끝난 카메라 설정"""
+    index: int
+    backend: int  # cv2.CAP_* API 번호
+    fourcc: str  # 실제 적용된 픽셀 포맷 (예: "MJPG", "YUYV", 알 수 없으면 "")
+    width: int
+    height: int
+    fps: float
+
+
+def platform_backends() -> List[int]:
+    """현재 플랫폼에서 시도할 캡처 백엔드 목록 (우선순위 순)"""
+    if sys.platform.startswith("linux"):
+        return [cv2.CAP_V4L2, cv2.CAP_ANY]
+    if sys.platform == "darwin":
+        return [cv2.CAP_AVFOUNDATION]
+    if sys.platform.startswith("win"):
+        return [cv2.CAP_MSMF, cv2.CAP_DSHOW]
+    return [cv2.CAP_ANY]
+
+
+def fourcc_to_str(value: float) -> str:
+    """CAP_PROP_FOURCC 값을 4글자 문자열로 변환합니다."""
+    code = int(value)
+    if code <= 0:
+        return ""
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00 ")
+
+
+def linux_capture_indices() -> List[int]:
+    """/dev/video* 중 영상 캡처 노드의 인덱스를 장치를 열지 않고 나열합니다.
+
+    UVC 카메라는 장치마다 메타데이터 노드를 하나 더 만들기 때문에,
+    sysfs의 index 값이 0인 노드(주 캡처 노드)만 남깁니다.
+    """
+    indices = []
+    for path in glob.glob("/dev/video*"):
+        match = re.fullmatch(r"/dev/video(\d+)", path)
+        if not match:
+            continue
+        index = int(match.group(1))
+        try:
+            with open(f"/sys/class/video4linux/video{index}/index", "r") as f:
+                if f.read().strip() != "0":
+                    continue
+        except OSError:
+            pass
+        indices.append(index)
+    return sorted(indices)
+
+
+class CameraBackend:
+    """카메라 장치 탐색, 포맷 협상, 결과 캐시를 담당하는 클래스"""
+
+    def __init__(self, camera_cfg: Optional[Dict[str, Any]] = None, cache_path: Optional[str] = None) -> None:
+        """
+        Args:
+            camera_cfg: rules.json의 "camera" 설정 (width, height, fps, formats, max_index, preferred_index, cache_file)
+            cache_path: 캐시 파일 경로 (없으면 설정값 또는 기본값 사용)
+        """
+        cfg = camera_cfg or {}
+        self.width = int(cfg.get("width", 1280))
+        self.height = int(cfg.get("height", 720))
+        self.fps = float(cfg.get("fps", 30))
+        self.formats: List[str] = list(cfg.get("formats", ["MJPG", "YUYV"]))
+        self.max_index = int(cfg.get("max_index", 4))
+        self.preferred_index: Optional[int] = cfg.get("preferred_index")
+        self.cache_path = cache_path or cfg.get("cache_file", DEFAULT_CACHE_FILE)
+        self.use_cache = bool(cfg.get("use_cache", True))
+
+    # ------------------------------------------------------------------ #
+    # 캐시
+    # ------------------------------------------------------------------ #
+    def load_cached_profile(self) -> Optional[CameraProfile]:
+        """캐시 파일에서 마지막으로 동작한 카메라 설정을 읽습니다."""
+        if not self.use_cache or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            requested = data.pop("requested", None)
+            profile = CameraProfile(**data)
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning(f"카메라 캐시를 읽지 못했습니다: {exc}")
+            return None
+        # 요청 해상도/FPS가 바뀌었으면 캐시를 쓰지 않고 다시 협상합니다.
+        if requested != [self.width, self.height, self.fps]:
+            return None
+        return profile
+
+    def save_profile(self, profile: CameraProfile) -> None:
+        """동작한 카메라 설정을 캐시 파일에 저장합니다."""
+        if not self.use_cache:
+            return
+        data = asdict(profile)
+        data["requested"] = [self.width, self.height, self.fps]
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except OSError as exc:
+            logger.warning(f"카메라 캐시를 저장하지 못했습니다: {exc}")
+
+    def clear_cache(self) -> None:
+        """캐시 파일을 삭제합니다."""
+        try:
+            os.remove(self.cache_path)
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------ #
+    # 장치 열기 / 협상
+    # ------------------------------------------------------------------ #
+    def candidate_indices(self) -> List[int]:
+        """탐색할 장치 인덱스 목록"""
+        if self.preferred_index is not None:
+            return [int(self.preferred_index)]
+        if sys.platform.startswith("linux"):
+            # /dev/video* 노드가 없으면 카메라가 없는 것이므로 장치를 열어 볼 필요가 없습니다.
+            return [i for i in linux_capture_indices() if i <= self.max_index]
+        # 외장 카메라가 보통 높은 인덱스를 받으므로 높은 번호부터 시도합니다.
+        return list(range(self.max_index, -1, -1))
+
+    def _apply_format(self, capture: cv2.VideoCapture, fourcc: str) -> bool:
+        """픽셀 포맷/해상도/FPS를 적용하고 프레임을 한 장 읽어 확인합니다."""
+        if fourcc:
+            capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        capture.set(cv2.CAP_PROP_FPS, self.fps)
+        # 드라이버 큐에 오래된 프레임이 쌓이지 않도록 버퍼를 1장으로 줄입니다 (지원하지 않는 백엔드는 무시).
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        ret, frame = capture.read()
+        return bool(ret) and frame is not None
+
+    def _read_profile(self, capture: cv2.VideoCapture, index: int, backend: int) -> CameraProfile:
+        return CameraProfile(
+            index=index,
+            backend=backend,
+            fourcc=fourcc_to_str(capture.get(cv2.CAP_PROP_FOURCC)),
+            width=int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            fps=float(capture.get(cv2.CAP_PROP_FPS)),
+        )
+
+    def open_profile(self, profile: CameraProfile) -> Optional[cv2.VideoCapture]:
+        """저장된 설정 그대로 장치를 엽니다. 실패하면 None."""
+        capture = cv2.VideoCapture(profile.index, profile.backend)
+        if capture.isOpened() and self._apply_format(capture, profile.fourcc):
+            return capture
+        capture.release()
+        return None
+
+    def negotiate(self, index: int, backend: int) -> Optional[Tuple[cv2.VideoCapture, CameraProfile]]:
+        """장치를 열고 선호 포맷 순서대로 협상합니다.
+
+        포맷을 하나씩 적용해 보고 실제로 적용된 포맷이 요청과 같으면 채택합니다.
+        어떤 포맷도 맞지 않으면 마지막으로 프레임을 읽은 상태(드라이버 기본 포맷)를 사용합니다.
+        """
+        capture = cv2.VideoCapture(index, backend)
+        if not capture.isOpened():
+            capture.release()
+            return None
+
+        fallback: Optional[CameraProfile] = None
+        for fourcc in self.formats:
+            if not self._apply_format(capture, fourcc):
+                continue
+            profile = self._read_profile(capture, index, backend)
+            if profile.fourcc == fourcc or not profile.fourcc:
+                return capture, profile
+            fallback = profile
+
+        if fallback is None:
+            if not self._apply_format(capture, ""):
+                capture.release()
+                return None
+            fallback = self._read_profile(capture, index, backend)
+        return capture, fallback
+
+    def probe(self) -> Tuple[Optional[cv2.VideoCapture], Optional[CameraProfile]]:
+        """후보 장치와 백엔드를 탐색해 처음 동작하는 조합을 반환합니다."""
+        logger.info("사용 가능한 카메라를 찾는 중...")
+        for backend in platform_backends():
+            for index in self.candidate_indices():
+                result = self.negotiate(index, backend)
+                if result is not None:
+                    return result
+        return None, None
+
+    def open(self) -> Tuple[Optional[cv2.VideoCapture], Optional[CameraProfile]]:
+        """캐시된 설정으로 먼저 열어 보고, 실패하면 장치를 탐색합니다."""
+        cached = self.load_cached_profile()
+        if cached is not None:
+            capture = self.open_profile(cached)
+            if capture is not None:
+                logger.info(f"캐시된 카메라 설정 사용 (인덱스 {cached.index}, {cached.fourcc or '기본 포맷'})")
+                return capture, self._read_profile(capture, cached.index, cached.backend)
+            logger.info("캐시된 카메라 설정으로 열 수 없어 다시 탐색합니다.")
+            self.clear_cache()
+
+        capture, profile = self.probe()
+        if capture is None or profile is None:
+            return None, None
+        self.save_profile(profile)
+        return capture, profile
@@ -0,0 +1,141 @@
+"""
+프레임 캡처 모듈
+카메라 읽기를 별도 스레드에서 수행하고, 가장 최근 프레임만 슬롯에 보관합니다.
+게임 루프(on_update)는 슬롯에서 최신 프레임을 가져가기만 하므로 카메라 지연에 막히지 않습니다.
+"""
+import threading
+import time
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+
+from core.frame_path import get_allocation_counter
+from core.logger import get_logger
+
+
+logger = get_logger()
+
+
+class CapturedFrame(NamedTuple):
+    """캡처된 프레임과 메타데이터"""
+    image: np.ndarray
+    timestamp: float  # 캡처 시각 (time.time() 기준)
+    seq: int  # 1부터 증가하는 프레임 순번
+
+
+class LatestFrameSlot:
+    """가장 최근 프레임 하나만 보관하는 슬롯 (읽히지 않은 이전 프레임은 버려짐)
+
+    삼중 버퍼로 동작합니다. 생산자는 publish()가 돌려준 버퍼에 다음 프레임을 쓰고,
+    소비자가 latest()로 가져간 프레임은 다음 latest() 호출 전까지 생산자가 건드리지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._published: Optional[CapturedFrame] = None
+        self._taken: Optional[CapturedFrame] = None
+        self._fresh: bool = False
+        self.published_count: int = 0
+        self.dropped_count: int = 0
+
+    def publish(self, frame: CapturedFrame) -> Optional[np.ndarray]:
+        """새 프레임을 게시합니다. 아직 읽히지 않은 프레임은 덮어씁니다.
+
+        Returns:
+            생산자가 다음 프레임에 재사용할 수 있는 버퍼 (없으면 None)
+        """
+        with self._lock:
+            if self._fresh:
+                self.dropped_count += 1
+            recycled = self._published
+            self._published = frame
+            self._fresh = True
+            self.published_count += 1
+        return recycled.image if recycled is not None else None
+
+    def latest(self) -> Optional[CapturedFrame]:
+        """가장 최근 프레임을 반환합니다. 대기하지 않습니다."""
+        with self._lock:
+            if self._fresh:
+                # 소비자가 들고 있던 이전 프레임 버퍼는 생산자 재사용용으로 돌려줍니다.
+                self._taken, self._published = self._published, self._taken
+                self._fresh = False
+            return self._taken
+
+
+class FrameCaptureThread:
+    """카메라를 별도 스레드에서 읽어 LatestFrameSlot에 게시하는 캡처 단계"""
+
+    def __init__(
+        self,
+        capture: Any,
+        slot: Optional[LatestFrameSlot] = None,
+        retry_interval: float = 0.01,
+    ) -> None:
+        """
+        Args:
+            capture: read()/release()를 제공하는 캡처 객체 (cv2.VideoCapture 등)
+            slot: 프레임을 게시할 슬롯 (없으면 새로 생성)
+            retry_interval: 읽기 실패 시 재시도 전 대기 시간(초)
+        """
+        self.capture = capture
+        self.slot = slot or LatestFrameSlot()
+        self.retry_interval = retry_interval
+
+        self.read_failures: int = 0
+        self.allocations = get_allocation_counter()
+        self._seq: int = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """캡처 스레드를 시작합니다."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="FrameCapture", daemon=True)
+        self._thread.start()
+        logger.info("프레임 캡처 스레드 시작")
+
+    def stop(self, timeout: float = 1.0, release: bool = True) -> None:
+        """캡처 스레드를 정지하고 필요하면 캡처 장치를 해제합니다."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning("프레임 캡처 스레드가 제시간에 종료되지 않았습니다.")
+            self._thread = None
+        if release and self.capture is not None:
+            self.capture.release()
+            self.capture = None
+
+    def latest(self) -> Optional[CapturedFrame]:
+        """슬롯의 최신 프레임을 반환합니다 (비차단)."""
+        return self.slot.latest()
+
+    def _run(self) -> None:
+        """카메라 읽기 루프. 슬롯이 돌려준 버퍼에 다음 프레임을 읽어 할당을 피합니다."""
+        buffer: Optional[np.ndarray] = None
+        while not self._stop_event.is_set():
+            ret, image = self.capture.read(buffer) if buffer is not None else self.capture.read()
+            timestamp = time.time()
+            if not ret or image is None:
+                if getattr(self.capture, "finished", False):
+                    # 반복하지 않는 영상 파일 등 더 읽을 프레임이 없는 소스
+                    logger.info("프레임 소스가 끝났습니다. 캡처 스레드를 종료합니다.")
+                    break
+                self.read_failures += 1
+                if self.read_failures == 1 or self.read_failures % 100 == 0:
+                    logger.warning(f"카메라 프레임을 읽지 못했습니다. (누적 {self.read_failures}회)")
+                self._stop_event.wait(self.retry_interval)
+                continue
+
+            if image is not buffer:
+                # 첫 프레임이거나 해상도가 바뀌어 캡처 장치가 새 버퍼를 할당한 경우
+                self.allocations.add(image.nbytes)
+            self._seq += 1
+            buffer = self.slot.publish(CapturedFrame(image, timestamp, self._seq))
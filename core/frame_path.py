@@ -0,0 +1,123 @@
+"""
+프레임 경로 모듈
+카메라 프레임(BGR)을 포즈 추론 입력(RGB)으로 변환합니다.
+버퍼를 미리 할당해 재사용하고, 프레임당 새로 할당한 바이트 수와 캡처→판정 지연을 집계합니다.
+"""
+import threading
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class AllocationCounter:
+    """프레임 경로에서 새로 할당한 버퍼 크기를 프레임 단위로 집계하는 클래스 (스레드 안전)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending_bytes: int = 0
+        self.last_frame_bytes: int = 0
+        self.total_bytes: int = 0
+        self.frames: int = 0
+
+    def add(self, nbytes: int) -> None:
+        """새로 할당한 바이트 수를 기록합니다."""
+        with self._lock:
+            self._pending_bytes += int(nbytes)
+            self.total_bytes += int(nbytes)
+
+    def end_frame(self) -> int:
+        """현재 프레임의 집계를 마감하고 해당 프레임에서 할당한 바이트 수를 반환합니다."""
+        with self._lock:
+            self.last_frame_bytes = self._pending_bytes
+            self._pending_bytes = 0
+            self.frames += 1
+            return self.last_frame_bytes
+
+
+_allocation_counter = AllocationCounter()
+
+
+def get_allocation_counter() -> AllocationCounter:
+    """프레임 경로 공용 할당 카운터를 반환하는 편의 함수"""
+    return _allocation_counter
+
+
+class LatencyMonitor:
+    """프레임 캡처 시각부터 판정까지 걸린 지연을 최근 구간에 대해 집계하는 클래스"""
+
+    def __init__(self, window: int = 120) -> None:
+        self._samples: deque = deque(maxlen=window)
+        self.last_ms: float = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        """한 프레임의 지연(ms)을 기록합니다."""
+        self.last_ms = float(latency_ms)
+        self._samples.append(self.last_ms)
+
+    @property
+    def mean_ms(self) -> float:
+        return sum(self._samples) / len(self._samples) if self._samples else 0.0
+
+    @property
+    def p95_ms(self) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+class FramePath:
+    """BGR 카메라 프레임을 재사용 버퍼를 통해 RGB 추론 입력으로 변환하는 클래스"""
+
+    def __init__(self, mirror_pixels: bool = False, counter: Optional[AllocationCounter] = None) -> None:
+        """
+        Args:
+            mirror_pixels: True면 픽셀을 좌우 반전합니다. False면 반전은 랜드마크 좌표에서 처리합니다.
+            counter: 할당 카운터 (없으면 공용 카운터 사용)
+        """
+        self.mirror_pixels = mirror_pixels
+        self.allocations = counter or get_allocation_counter()
+        self._buffers: Dict[str, np.ndarray] = {}
+
+    def buffer(self, name: str, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """이름별 재사용 버퍼를 반환합니다. 크기가 바뀐 경우에만 새로 할당합니다."""
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buf
+            self.allocations.add(buf.nbytes)
+        return buf
+
+    def to_rgb(
+        self,
+        frame: np.ndarray,
+        dst: Optional[np.ndarray] = None,
+        size: Optional[Tuple[int, int]] = None,
+        tag: str = "",
+    ) -> np.ndarray:
+        """
+        BGR 프레임을 RGB로 변환합니다.
+
+        Args:
+            frame: BGR 카메라 프레임 (수정하지 않음)
+            dst: 결과를 쓸 버퍼 (예: 워커 공유 메모리 슬롯). 없으면 내부 재사용 버퍼 사용
+            size: 추론 해상도 (width, height). 프레임과 다르면 변환 전에 한 번 축소합니다.
+            tag: 내부 버퍼 이름 접미사. 크기가 다른 입력(예: ROI)을 번갈아 변환할 때 버퍼를 따로 두어 재할당을 막습니다.
+
+        Returns:
+            RGB 프레임 (dst 또는 내부 버퍼)
+        """
+        if size is not None and (frame.shape[1], frame.shape[0]) != tuple(size):
+            resized = self.buffer("resize" + tag, (size[1], size[0]) + frame.shape[2:])
+            cv2.resize(frame, tuple(size), dst=resized, interpolation=cv2.INTER_LINEAR)
+            frame = resized
+        if dst is None:
+            dst = self.buffer("rgb" + tag, frame.shape)
+        if self.mirror_pixels:
+            mirrored = self.buffer("mirror" + tag, frame.shape)
+            cv2.flip(frame, 1, dst=mirrored)
+            frame = mirrored
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=dst)
+        return dst
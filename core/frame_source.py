@@ -0,0 +1,246 @@
+"""
+프레임 소스 모듈
+GameWindow가 의존하는 프레임 공급 인터페이스(FrameSource)와 구현체를 제공합니다.
+
+- 카메라: 캡처 스레드가 최신 프레임만 슬롯에 보관
+- 영상 파일: 실시간 재생(캡처 스레드 + 재생 속도 조절) 또는 최대 속도(호출마다 다음 프레임)
+- 합성 프레임: 카메라/영상 없이 결정적인 프레임을 생성
+"""
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+import cv2
+import numpy as np
+
+from core.frame_capture import CapturedFrame, FrameCaptureThread
+from core.logger import get_logger
+
+
+logger = get_logger()
+
+
+class FrameSource(ABC):
+    """프레임 공급 인터페이스. latest()는 대기하지 않고 가장 최근 프레임(또는 None)을 반환합니다."""
+
+    width: int = 1280
+    height: int = 720
+
+    def start(self) -> None:
+        """프레임 공급을 시작합니다."""
+
+    @abstractmethod
+    def latest(self) -> Optional[CapturedFrame]:
+        """가장 최근 프레임을 반환합니다 (비차단). 같은 프레임이면 seq가 그대로입니다."""
+
+    def stop(self) -> None:
+        """프레임 공급을 멈추고 자원을 해제합니다."""
+
+    @property
+    def finished(self) -> bool:
+        """더 이상 새 프레임이 없는지 여부 (반복하지 않는 영상이 끝난 경우)"""
+        return False
+
+
+# ---------------------------------------------------------------------- #
+# 프레임 리더 (read()/release()를 제공하는 캡처 호환 객체)
+# ---------------------------------------------------------------------- #
+class VideoFileReader:
+    """영상 파일 리더. realtime=True면 영상의 FPS에 맞춰 read()가 대기합니다."""
+
+    def __init__(self, path: str, realtime: bool = True, loop: bool = False) -> None:
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.capture = cv2.VideoCapture(path)
+        if not self.capture.isOpened():
+            raise FileNotFoundError(f"영상을 열 수 없습니다: {path}")
+        self.width = int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.fps = float(self.capture.get(cv2.CAP_PROP_FPS)) or 30.0
+        self.finished = False
+        self._start_time: Optional[float] = None
+        self._loop_offset = 0.0  # 반복 재생 시 누적된 영상 시간(초)
+        self.video_time = 0.0
+
+    def read(self, image: Optional[np.ndarray] = None):
+        if self.finished:
+            return False, None
+        ret, image = self.capture.read(image) if image is not None else self.capture.read()
+        if not ret and self.loop:
+            self._loop_offset = self.video_time + 1.0 / self.fps
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, image = self.capture.read(image) if image is not None else self.capture.read()
+        if not ret:
+            self.finished = True
+            return False, None
+
+        self.video_time = self._loop_offset + self.capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        if self.realtime:
+            if self._start_time is None:
+                self._start_time = time.perf_counter() - self.video_time
+            delay = self._start_time + self.video_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        return True, image
+
+    def release(self) -> None:
+        self.capture.release()
+
+
+class SyntheticFrameReader:
+    """카메라 없이 결정적인 테스트 프레임을 생성하는 리더 (세로 막대가 좌우로 왕복)"""
+
+    def __init__(
+        self,
+        width: int = 1280,
+        height: int = 720,
+        fps: float = 30.0,
+        realtime: bool = True,
+        max_frames: Optional[int] = None,
+    ) -> None:
+        self.width = int(width)
+        self.height = int(height)
+        self.fps = float(fps)
+        self.realtime = realtime
+        self.max_frames = max_frames
+        self.finished = False
+        self.video_time = 0.0
+        self._index = 0
+        self._start_time: Optional[float] = None
+        # 배경은 한 번만 만들어 두고 프레임마다 복사합니다.
+        gradient = np.linspace(0, 255, self.width, dtype=np.float32).astype(np.uint8)
+        self._background = np.repeat(gradient[None, :, None], 3, axis=2).repeat(self.height, axis=0)
+
+    def read(self, image: Optional[np.ndarray] = None):
+        if self.max_frames is not None and self._index >= self.max_frames:
+            self.finished = True
+            return False, None
+        if image is None or image.shape != self._background.shape:
+            image = np.empty_like(self._background)
+        np.copyto(image, self._background)
+
+        bar_w = max(1, self.width // 16)
+        span = self.width - bar_w
+        phase = (self._index % 120) / 60.0
+        x = int(span * (phase if phase <= 1.0 else 2.0 - phase))
+        image[:, x:x + bar_w] = (0, 0, 255)
+
+        self.video_time = self._index / self.fps
+        self._index += 1
+        if self.realtime:
+            if self._start_time is None:
+                self._start_time = time.perf_counter()
+            delay = self._start_time + self.video_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        return True, image
+
+    def release(self) -> None:
+        pass
+
+
+# ---------------------------------------------------------------------- #
+# FrameSource 구현
+# ---------------------------------------------------------------------- #
+class ThreadedFrameSource(FrameSource):
+    """캡처 스레드로 리더(카메라, 실시간 영상 등)를 읽어 최신 프레임만 공급하는 소스"""
+
+    def __init__(self, reader: Any, width: int, height: int) -> None:
+        self.reader = reader
+        self.width = int(width)
+        self.height = int(height)
+        self.capture_stage = FrameCaptureThread(reader)
+
+    def start(self) -> None:
+        self.capture_stage.start()
+
+    def latest(self) -> Optional[CapturedFrame]:
+        return self.capture_stage.latest()
+
+    def stop(self) -> None:
+        self.capture_stage.stop()
+
+    @property
+    def finished(self) -> bool:
+        return bool(getattr(self.reader, "finished", False))
+
+
+class SequentialFrameSource(FrameSource):
+    """latest()를 호출할 때마다 다음 프레임을 읽는 소스 (프레임 누락 없이 최대 속도로 재생)
+
+    타임스탬프는 시작 시각 + 영상 시간이므로 실행 속도와 관계없이 같은 입력에 같은 타임스탬프가 붙습니다.
+    """
+
+    def __init__(self, reader: Any, width: int, height: int) -> None:
+        self.reader = reader
+        self.width = int(width)
+        self.height = int(height)
+        self._buffer: Optional[np.ndarray] = None
+        self._last: Optional[CapturedFrame] = None
+        self._seq = 0
+        self._start_time = time.time()
+
+    def start(self) -> None:
+        self._start_time = time.time()
+
+    def latest(self) -> Optional[CapturedFrame]:
+        if self.finished:
+            return self._last
+        ret, image = self.reader.read(self._buffer)
+        if not ret or image is None:
+            return self._last
+        self._buffer = image
+        self._seq += 1
+        self._last = CapturedFrame(image, self._start_time + self.reader.video_time, self._seq)
+        return self._last
+
+    def stop(self) -> None:
+        if self.reader is not None:
+            self.reader.release()
+            self.reader = None
+
+    @property
+    def finished(self) -> bool:
+        return self.reader is None or bool(getattr(self.reader, "finished", False))
+
+
+def create_frame_source(
+    source_cfg: Optional[Dict[str, Any]],
+    camera_capture: Any = None,
+    camera_size: Optional[tuple] = None,
+) -> Optional[FrameSource]:
+    """설정에 따라 FrameSource를 생성합니다 (시작하지 않음).
+
+    Args:
+        source_cfg: rules.json의 "frame_source" 설정 (type, path, realtime, loop, width, height, fps, max_frames)
+        camera_capture: type이 camera일 때 사용할 이미 열린 캡처 객체
+        camera_size: 카메라 해상도 (width, height)
+    """
+    cfg = source_cfg or {}
+    source_type = cfg.get("type", "camera")
+    realtime = bool(cfg.get("realtime", True))
+
+    if source_type == "camera":
+        if camera_capture is None:
+            return None
+        width, height = camera_size or (1280, 720)
+        return ThreadedFrameSource(camera_capture, width, height)
+
+    if source_type == "video":
+        reader = VideoFileReader(cfg.get("path", "assets/boxing test mode.mp4"), realtime, bool(cfg.get("loop", False)))
+    elif source_type == "synthetic":
+        reader = SyntheticFrameReader(
+            int(cfg.get("width", 1280)),
+            int(cfg.get("height", 720)),
+            float(cfg.get("fps", 30)),
+            realtime,
+            cfg.get("max_frames"),
+        )
+    else:
+        raise ValueError(f"알 수 없는 프레임 소스: {source_type}")
+
+    logger.info(f"프레임 소스: {source_type} ({reader.width}x{reader.height}, {'실시간' if realtime else '최대 속도'})")
+    if realtime:
+        return ThreadedFrameSource(reader, reader.width, reader.height)
+    return SequentialFrameSource(reader, reader.width, reader.height)
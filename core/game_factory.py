@@ -10,8 +10,10 @@ import cv2
 import pygame
 
 from core.audio_manager import AudioManager
+from core.camera_backend import CameraBackend
 from core.pose_tracker import PoseTracker
 from core.config_manager import ConfigManager
+from core.frame_source import FrameSource, create_frame_source
 from core.logger import get_logger
 
 
@@ -27,19 +29,6 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
-def get_best_camera_index() -> int:
-    """사용 가능한 카메라 인덱스를 탐색하여 반환합니다."""
-    logger.info("사용 가능한 카메라를 찾는 중...")
-    for index in range(4, -1, -1):
-        cap = cv2.VideoCapture(index, cv2.CAP_AVFOUNDATION)
-        if cap.isOpened():
-            logger.info(f"카메라 발견: 인덱스 {index}")
-            cap.release()
-            return index
-    logger.warning("사용 가능한 카메라가 없습니다. 0번 인덱스로 시도합니다.")
-    return 0
-
-
 class GameFactory:
     """게임 컴포넌트 생성 및 의존성 주입"""
     
@@ -64,22 +53,43 @@ class GameFactory:
             return None
     
     @staticmethod
-    def create_camera() -> tuple[Optional[cv2.VideoCapture], int, int]:
-        """카메라를 초기화합니다."""
-        camera_index = get_best_camera_index()
-        capture = cv2.VideoCapture(camera_index, cv2.CAP_AVFOUNDATION)
+    def create_camera(camera_cfg: Optional[Dict[str, Any]] = None) -> tuple[Optional[cv2.VideoCapture], int, int]:
+        """카메라를 초기화합니다. 플랫폼별 백엔드와 포맷을 협상하고, 마지막으로 동작한 설정은 캐시합니다."""
+        capture, profile = CameraBackend(camera_cfg).open()
         
-        if capture is not None and capture.isOpened():
-            source_width = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)) or 1280
-            source_height = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 720
-            logger.info(f"카메라 초기화 성공 (인덱스: {camera_index}, {source_width}x{source_height})")
+        if capture is not None and profile is not None:
+            source_width = profile.width or 1280
+            source_height = profile.height or 720
+            logger.info(
+                f"카메라 초기화 성공 (인덱스: {profile.index}, {source_width}x{source_height}, "
+                f"{profile.fourcc or '기본 포맷'}, {profile.fps:.0f}fps)"
+            )
             return capture, source_width, source_height
         else:
-            logger.warning(f"카메라(인덱스 {camera_index})를 열 수 없습니다. 카메라 없이 실행합니다.")
-            if capture is not None:
-                capture.release()
+            logger.warning("사용 가능한 카메라가 없습니다. 카메라 없이 실행합니다.")
             return None, 1280, 720
     
+    @staticmethod
+    def create_frame_source(rules: Dict[str, Any]) -> tuple[Optional[FrameSource], int, int]:
+        """설정(rules.json "frame_source")에 따라 카메라/영상 파일/합성 프레임 소스를 생성하고 시작합니다."""
+        source_cfg = rules.get("frame_source", {})
+        capture = None
+        camera_size = (1280, 720)
+        if source_cfg.get("type", "camera") == "camera":
+            capture, width, height = GameFactory.create_camera(rules.get("camera"))
+            camera_size = (width, height)
+        
+        try:
+            frame_source = create_frame_source(source_cfg, capture, camera_size)
+        except (FileNotFoundError, ValueError) as exc:
+            logger.error(f"프레임 소스 생성 실패: {exc}")
+            return None, 1280, 720
+        
+        if frame_source is None:
+            return None, camera_size[0], camera_size[1]
+        frame_source.start()
+        return frame_source, frame_source.width, frame_source.height
+    
     @staticmethod
     def create_config_manager(config_dir: str = "config") -> ConfigManager:
         """설정 매니저를 생성합니다."""
@@ -4,8 +4,9 @@
 """
 import time
 from dataclasses import dataclass, field
-from typing import Deque, Optional
-from collections import deque
+from typing import Callable, Optional
+
+from core.judgment_records import Judgment, JudgmentJournal, NoteType
 
 
 @dataclass
@@ -19,7 +20,8 @@ class GameState:
     test_mode: bool = False
     last_judgement_type: Optional[str] = None
     last_judgement_time: float = 0.0
-    judge_log: Deque[str] = field(default_factory=lambda: deque(maxlen=10))
+    judge_log: JudgmentJournal = field(default_factory=lambda: JudgmentJournal(maxlen=10))  # HUD 표시용 최근 기록
+    judgement_listener: Optional[Callable[[Judgment], None]] = None  # 판정마다 호출 (개수 제한 없이 모든 기록이 필요할 때)
     status_text: str = "Ready!"
     countdown_start: Optional[float] = None
     finish_trigger_time: Optional[float] = None
@@ -46,9 +48,12 @@ class GameState:
             self.combo += 1
             self.max_combo = max(self.max_combo, self.combo)
     
-    def record_judgement(self, judgement: str, note_type: str, delta: float, now: float = 0.0) -> None:
+    def record_judgement(self, judgement: str, note_type: NoteType, delta: float, now: float = 0.0) -> None:
         """판정을 기록합니다."""
         self.last_judgement_type = judgement
         self.last_judgement_time = now if now > 0 else time.time()
-        self.judge_log.appendleft(f"{judgement} ({note_type}) Δ={delta:0.3f}")
+        record = Judgment(judgement, note_type, delta, self.last_judgement_time)
+        self.judge_log.record(record)
+        if self.judgement_listener is not None:
+            self.judgement_listener(record)
 
@@ -0,0 +1,355 @@
+"""
+동작(제스처) 감지 모듈
+잽, 훅, 어퍼컷, 더킹, 위빙 감지기를 등록해 두고, 프레임마다 한 번의 순회로 모두 평가합니다.
+각 감지기는 같은 프레임 데이터(운동학 커널 결과, 픽셀 랜드마크 배열, 모션 기록)를 입력으로 받는 작은 상태 기계이며,
+랜드마크를 다시 순회하지 않습니다. 새 동작은 GestureDetector를 상속하고 @register_gesture로 등록하면 됩니다.
+"""
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+
+from core.constants import DODGE_LINE_OFFSET, SCREEN_WIDTH
+from core.judgment_records import PHASE_ENTER, PHASE_EXIT, HitEvent, NoteType
+from core.logger import get_logger
+from core.motion_history import MotionHistory
+from core.pose_kinematics import WRIST_INDEX, PoseKinematics, ReentryJabPolicy, VelocityJabPolicy
+from core.pose_landmarks import NOSE
+
+
+logger = get_logger()
+
+GESTURE_DETECTORS: Dict[str, Type["GestureDetector"]] = {}
+
+
+def register_gesture(name: str) -> Callable[[Type["GestureDetector"]], Type["GestureDetector"]]:
+    """감지기 클래스를 이름으로 등록하는 데코레이터 (rules.json "gestures.enabled"에서 이 이름을 사용)"""
+    def decorator(cls: Type["GestureDetector"]) -> Type["GestureDetector"]:
+        cls.name = name
+        GESTURE_DETECTORS[name] = cls
+        return cls
+    return decorator
+
+
+@dataclass
+class GestureFrame:
+    """감지기에 전달되는 프레임 데이터 (PoseTracker가 하나를 만들어 프레임마다 갱신)"""
+    kinematics: PoseKinematics
+    history: MotionHistory
+    calib_data: Dict[str, Any]
+    width: int
+    height: int
+    landmarks: Optional[np.ndarray] = None  # 픽셀 좌표 (33, 4)
+    now: float = 0.0
+    test_mode: bool = False
+    _wrist_velocity: Optional[np.ndarray] = field(default=None, repr=False)
+    _wrist_velocity_t: Optional[float] = field(default=None, repr=False)
+
+    def wrist_velocity(self) -> Optional[np.ndarray]:
+        """모션 기록으로 구한 손목 속도 (2, 2) [화면 왼쪽 손, 화면 오른쪽 손], 어깨 너비/초
+
+        두 프레임 차분 대신 최근 샘플의 Savitzky-Golay 미분을 쓰므로 랜드마크 떨림에 덜 흔들립니다.
+        여러 감지기가 같은 프레임에서 호출해도 한 번만 계산합니다. 샘플이 부족하면 None
+        """
+        if self._wrist_velocity_t != self.now:
+            velocity = self.history.velocity(joints=WRIST_INDEX)
+            if velocity is not None:
+                velocity = velocity / max(float(self.calib_data["shoulder_w"]), 1e-6)
+            self._wrist_velocity = velocity
+            self._wrist_velocity_t = self.now
+        return self._wrist_velocity
+
+
+class GestureDetector(ABC):
+    """동작 감지기 기본 클래스"""
+
+    name = ""
+
+    def __init__(self, options: Dict[str, Any], config_rules: Dict[str, Any]) -> None:
+        """
+        Args:
+            options: rules.json "gestures.<name>" 설정
+            config_rules: 전체 rules 설정 (공용 임계값 참조용)
+        """
+        self.options = options
+
+    @abstractmethod
+    def detect(self, frame: GestureFrame) -> List[HitEvent]:
+        """이번 프레임에서 감지한 이벤트 목록을 반환합니다."""
+
+    def reset(self) -> None:
+        """상태를 초기화합니다 (포즈를 잃었을 때)."""
+
+    def active_hold(self) -> Optional[Tuple[NoteType, float]]:
+        """유지형 동작이 진행 중이면 (이벤트 타입, 시작 시각), 아니면 None"""
+        return None
+
+
+class HoldState:
+    """유지형 동작의 시작/유지/종료를 디바운스해 추적하는 상태 기계
+
+    조건이 enter_debounce_s 동안 이어져야 시작(enter)으로, 조건이 exit_debounce_s 동안 끊겨야 종료(exit)로 봅니다.
+    시작 시각은 디바운스가 끝난 시각이 아니라 조건이 처음 충족된 시각입니다.
+    """
+
+    def __init__(self, enter_debounce_s: float = 0.05, exit_debounce_s: float = 0.1) -> None:
+        self.enter_debounce_s = float(enter_debounce_s)
+        self.exit_debounce_s = float(exit_debounce_s)
+        self.active = False
+        self.started_at = 0.0
+        self._candidate_t: Optional[float] = None  # 비활성 상태에서 조건이 처음 충족된 시각
+        self._release_t: Optional[float] = None  # 활성 상태에서 조건이 처음 끊긴 시각
+
+    def reset(self) -> None:
+        self.active = False
+        self._candidate_t = None
+        self._release_t = None
+
+    def update(self, condition: bool, now: float) -> Optional[str]:
+        """조건을 갱신합니다. 상태가 바뀌면 PHASE_ENTER 또는 PHASE_EXIT을 반환합니다."""
+        if not self.active:
+            if not condition:
+                self._candidate_t = None
+                return None
+            if self._candidate_t is None:
+                self._candidate_t = now
+            if now - self._candidate_t >= self.enter_debounce_s:
+                self.active = True
+                self.started_at = self._candidate_t
+                self._candidate_t = None
+                self._release_t = None
+                return PHASE_ENTER
+            return None
+        if condition:
+            self._release_t = None
+            return None
+        if self._release_t is None:
+            self._release_t = now
+        if now - self._release_t >= self.exit_debounce_s:
+            self.active = False
+            return PHASE_EXIT
+        return None
+
+    @property
+    def duration(self) -> float:
+        """마지막(또는 진행 중인) 유지 구간 길이. 종료 시에는 조건이 끊긴 시각까지입니다."""
+        end = self._release_t if self._release_t is not None else self.started_at
+        return max(0.0, end - self.started_at)
+
+
+class GestureRegistry:
+    """활성화된 감지기들을 순서대로 평가하고 감지기별 소요 시간을 기록하는 클래스"""
+
+    def __init__(self, detectors: List[GestureDetector], timing_alpha: float = 0.05) -> None:
+        self.detectors = detectors
+        self.timing_alpha = timing_alpha
+        self.timings_us: Dict[str, float] = {d.name: 0.0 for d in detectors}  # 감지기별 평균 소요 시간 (지수 평균, µs)
+
+    @classmethod
+    def from_config(cls, config_rules: Dict[str, Any]) -> "GestureRegistry":
+        """rules.json "gestures" 설정의 enabled 순서대로 감지기를 만듭니다."""
+        cfg = config_rules.get("gestures", {})
+        detectors = []
+        for name in cfg.get("enabled", list(GESTURE_DETECTORS)):
+            detector_cls = GESTURE_DETECTORS.get(name)
+            if detector_cls is None:
+                logger.warning(f"알 수 없는 동작 감지기: {name}")
+                continue
+            detectors.append(detector_cls(cfg.get(name, {}), config_rules))
+        return cls(detectors)
+
+    def get(self, name: str) -> Optional[GestureDetector]:
+        return next((d for d in self.detectors if d.name == name), None)
+
+    def detect(self, frame: GestureFrame) -> List[HitEvent]:
+        """모든 감지기를 한 번씩 평가하고 이벤트를 모아 반환합니다."""
+        events: List[HitEvent] = []
+        alpha = self.timing_alpha
+        for detector in self.detectors:
+            start = time.perf_counter()
+            events.extend(detector.detect(frame))
+            elapsed_us = (time.perf_counter() - start) * 1e6
+            self.timings_us[detector.name] += alpha * (elapsed_us - self.timings_us[detector.name])
+        return events
+
+    def reset(self) -> None:
+        for detector in self.detectors:
+            detector.reset()
+
+    def active_holds(self) -> Dict[NoteType, float]:
+        """진행 중인 유지형 동작 {이벤트 타입: 시작 시각}"""
+        holds = {}
+        for detector in self.detectors:
+            hold = detector.active_hold()
+            if hold is not None:
+                holds[hold[0]] = hold[1]
+        return holds
+
+
+class _HandCooldown:
+    """손별 쿨타임 (0 = 화면 왼쪽 손, 1 = 화면 오른쪽 손)"""
+
+    def __init__(self, refractory: float) -> None:
+        self.refractory = float(refractory)
+        self.last_t = [0.0, 0.0]
+
+    def ready(self, hand: int, now: float) -> bool:
+        return now - self.last_t[hand] > self.refractory
+
+    def mark(self, hand: int, now: float) -> None:
+        self.last_t[hand] = now
+
+
+# ---------------------------------------------------------------------- #
+# 감지기
+# ---------------------------------------------------------------------- #
+@register_gesture("jab")
+class JabDetector(GestureDetector):
+    """잽: 일반 모드 = 반경 속도 + 히트존, 테스트 모드 = 히트존 재진입 (두 정책은 쿨타임 공유)"""
+
+    def __init__(self, options: Dict[str, Any], config_rules: Dict[str, Any]) -> None:
+        super().__init__(options, config_rules)
+        thresholds = config_rules.get("action_thresholds", {})
+        refractory = float(options.get("refractory", thresholds.get("action_refractory", 0.25)))
+        v_thresh = float(options.get("v_thresh", thresholds.get("action_v_thresh", 1.0)))
+        self.last_hit_t = [0.0, 0.0]  # [JAB_L, JAB_R]
+        self.policy = VelocityJabPolicy(refractory, v_thresh, self.last_hit_t)
+        self.test_policy = ReentryJabPolicy(refractory, self.last_hit_t)
+
+    def reset(self) -> None:
+        self.policy.reset()
+        self.test_policy.reset()
+
+    def detect(self, frame: GestureFrame) -> List[HitEvent]:
+        policy = self.test_policy if frame.test_mode else self.policy
+        return policy.detect(frame.kinematics, frame.now)
+
+
+@register_gesture("hook")
+class HookDetector(GestureDetector):
+    """훅: 팔꿈치를 굽힌 채 손목이 화면 중앙 쪽으로 빠르게 수평 이동 (속도는 모션 기록 기준)"""
+
+    def __init__(self, options: Dict[str, Any], config_rules: Dict[str, Any]) -> None:
+        super().__init__(options, config_rules)
+        self.v_thresh = float(options.get("v_thresh", 2.0))  # 어깨 너비/초
+        self.min_angle = float(options.get("min_angle", 60.0))
+        self.max_angle = float(options.get("max_angle", 130.0))
+        self.cooldown = _HandCooldown(options.get("refractory", 0.3))
+
+    def detect(self, frame: GestureFrame) -> List[HitEvent]:
+        velocity = frame.wrist_velocity()
+        if velocity is None:
+            return []
+        velocity = velocity.tolist()
+        angle = frame.kinematics.angle.tolist()
+        events = []
+        for hand, inward in ((0, 1.0), (1, -1.0)):
+            vx, vy = velocity[hand]
+            if (
+                inward * vx >= self.v_thresh
+                and abs(vx) > abs(vy)
+                and self.min_angle <= angle[hand] <= self.max_angle
+                and self.cooldown.ready(hand, frame.now)
+            ):
+                events.append(HitEvent((NoteType.HOOK_L, NoteType.HOOK_R)[hand], frame.now))
+                self.cooldown.mark(hand, frame.now)
+        return events
+
+
+@register_gesture("uppercut")
+class UppercutDetector(GestureDetector):
+    """어퍼컷: 팔꿈치를 굽힌 채 손목이 빠르게 위로 이동 (속도는 모션 기록 기준)"""
+
+    def __init__(self, options: Dict[str, Any], config_rules: Dict[str, Any]) -> None:
+        super().__init__(options, config_rules)
+        self.v_thresh = float(options.get("v_thresh", 2.0))  # 어깨 너비/초
+        self.max_angle = float(options.get("max_angle", 130.0))
+        self.cooldown = _HandCooldown(options.get("refractory", 0.3))
+
+    def detect(self, frame: GestureFrame) -> List[HitEvent]:
+        velocity = frame.wrist_velocity()
+        if velocity is None:
+            return []
+        velocity = velocity.tolist()
+        angle = frame.kinematics.angle.tolist()
+        events = []
+        for hand in (0, 1):
+            vx, vy = velocity[hand]
+            # 이미지 좌표는 y가 아래로 증가하므로 위로 이동 = vy < 0
+            if (
+                -vy >= self.v_thresh
+                and abs(vy) > abs(vx)
+                and angle[hand] <= self.max_angle
+                and self.cooldown.ready(hand, frame.now)
+            ):
+                events.append(HitEvent((NoteType.UPPERCUT_L, NoteType.UPPERCUT_R)[hand], frame.now))
+                self.cooldown.mark(hand, frame.now)
+        return events
+
+
+@register_gesture("duck")
+class DuckDetector(GestureDetector):
+    """더킹: 코가 캘리브레이션한 더킹 라인 아래로 내려간 구간을 하나의 유지형 동작으로 감지
+
+    시작 시 phase=PHASE_ENTER, 끝날 때 phase=PHASE_EXIT(유지 시간 포함) 이벤트를 하나씩 냅니다 (t_hit = 시작 시각).
+    라인 근처의 떨림으로 시작/종료가 반복되지 않도록, 한 번 시작하면 hysteresis_px만큼 더 올라와야 끊긴 것으로 봅니다.
+    """
+
+    def __init__(self, options: Dict[str, Any], config_rules: Dict[str, Any]) -> None:
+        super().__init__(options, config_rules)
+        self.hysteresis_px = float(options.get("hysteresis_px", 10.0))
+        self.hold = HoldState(options.get("enter_debounce_s", 0.05), options.get("exit_debounce_s", 0.1))
+
+    def reset(self) -> None:
+        self.hold.reset()
+
+    def active_hold(self) -> Optional[Tuple[NoteType, float]]:
+        return (NoteType.DUCK, self.hold.started_at) if self.hold.active else None
+
+    def detect(self, frame: GestureFrame) -> List[HitEvent]:
+        line = frame.calib_data["duck_line_y"]
+        if self.hold.active:
+            line -= self.hysteresis_px
+        phase = self.hold.update(bool(frame.landmarks[NOSE, 1] > line), frame.now)
+        if phase == PHASE_ENTER:
+            return [HitEvent(NoteType.DUCK, self.hold.started_at, PHASE_ENTER)]
+        if phase == PHASE_EXIT:
+            return [HitEvent(NoteType.DUCK, self.hold.started_at, PHASE_EXIT, self.hold.duration)]
+        return []
+
+
+@register_gesture("weave")
+class WeaveDetector(GestureDetector):
+    """위빙: 코가 중앙선에서 위빙 라인 쪽 영역으로 들어가는 순간 WEAVE 이벤트
+
+    판정 영역은 WeaveJudgmentStrategy와 같습니다 (화면 기준 WEAVE_L = 중앙선 ~ 오른쪽 라인, WEAVE_R = 왼쪽 라인 ~ 중앙선).
+    중앙선 근처의 떨림으로 이벤트가 반복되지 않도록 deadband(화면 너비 비율)만큼 벗어나야 진입으로 봅니다.
+    """
+
+    def __init__(self, options: Dict[str, Any], config_rules: Dict[str, Any]) -> None:
+        super().__init__(options, config_rules)
+        self.line_ratio = float(options.get("line_ratio", DODGE_LINE_OFFSET / SCREEN_WIDTH))
+        self.deadband_ratio = float(options.get("deadband_ratio", 0.04))
+        self.region: Optional[NoteType] = None
+
+    def reset(self) -> None:
+        self.region = None
+
+    def detect(self, frame: GestureFrame) -> List[HitEvent]:
+        offset = frame.landmarks[NOSE, 0] - frame.width / 2
+        line = self.line_ratio * frame.width
+        deadband = self.deadband_ratio * frame.width
+        if deadband <= offset < line:
+            region = NoteType.WEAVE_L
+        elif -line < offset <= -deadband:
+            region = NoteType.WEAVE_R
+        elif abs(offset) < deadband / 2 or abs(offset) >= line:
+            region = None
+        else:
+            region = self.region  # 경계 부근(히스테리시스 구간)에서는 이전 상태 유지
+        if region == self.region:
+            return []
+        self.region = region
+        return [HitEvent(region, frame.now)] if region else []
@@ -0,0 +1,146 @@
+"""
+추론 거버너 모듈
+최근 추론 지연과 CPU 사용률을 측정해 포즈 모델 복잡도(0/1/2)와 추론 FPS를 자동으로 조절합니다.
+예산(기본: 단일 코어 70%, 설계 문서 QR-1.4)을 넘으면 먼저 복잡도를, 그다음 추론 FPS를 낮추고,
+여유가 생기면 역순으로 복구합니다.
+"""
+from collections import deque
+from typing import Any, Dict, Optional
+
+from core.logger import get_logger
+
+
+logger = get_logger()
+
+
+class InferenceGovernor:
+    """포즈 추론 부하를 CPU 예산 안으로 유지하는 클래스"""
+
+    def __init__(self, cfg: Optional[Dict[str, Any]] = None, initial_complexity: int = 2) -> None:
+        """
+        Args:
+            cfg: rules.json의 "pose_inference.governor" 설정
+            initial_complexity: 시작 모델 복잡도 (최대 복잡도로도 사용)
+        """
+        cfg = cfg or {}
+        self.enabled = bool(cfg.get("enabled", True))
+        self.cpu_budget = float(cfg.get("cpu_budget", 0.7))  # 단일 코어 대비 비율
+        self.max_latency_ms = float(cfg.get("max_latency_ms", 100.0))  # QR-1.2
+        self.recover_ratio = float(cfg.get("recover_ratio", 0.6))  # 예산의 이 비율 아래면 여유로 판단
+        self.window_s = float(cfg.get("window_s", 2.0))
+        self.cooldown_s = float(cfg.get("cooldown_s", 3.0))
+        self.min_complexity = int(cfg.get("min_complexity", 0))
+        self.max_complexity = int(cfg.get("max_complexity", initial_complexity))
+        self.max_fps = float(cfg.get("max_fps", 30.0))
+        self.min_fps = float(cfg.get("min_fps", 10.0))
+        self.fps_step = float(cfg.get("fps_step", 0.75))
+
+        self.complexity = max(self.min_complexity, min(self.max_complexity, int(initial_complexity)))
+        self.target_fps = self.max_fps
+
+        # (완료 시각, 지연 ms, CPU ms)
+        self._samples: deque = deque()
+        self._last_change: float = 0.0
+        self._last_infer: Optional[float] = None
+        # 복구 직후 다시 예산을 넘으면(진동) 다음 복구까지의 대기 시간을 두 배로 늘립니다.
+        self._last_recover: Optional[float] = None
+        self._recover_backoff: float = 1.0
+
+    # ------------------------------------------------------------------ #
+    # 추론 간격
+    # ------------------------------------------------------------------ #
+    def should_infer(self, now: float) -> bool:
+        """목표 추론 FPS에 따라 이번 프레임을 추론할지 결정합니다."""
+        if not self.enabled or self._last_infer is None:
+            self._last_infer = now
+            return True
+        # 카메라 FPS와 정확히 맞물리지 않도록 간격에 약간의 여유(10%)를 둡니다.
+        if now - self._last_infer >= 0.9 / self.target_fps:
+            self._last_infer = now
+            return True
+        return False
+
+    # ------------------------------------------------------------------ #
+    # 측정
+    # ------------------------------------------------------------------ #
+    def record(self, now: float, latency_ms: float, cpu_ms: float) -> None:
+        """추론 한 번의 지연과 CPU 시간을 기록합니다."""
+        self._samples.append((now, float(latency_ms), float(cpu_ms)))
+        while self._samples and now - self._samples[0][0] > self.window_s:
+            self._samples.popleft()
+
+    @property
+    def cpu_usage(self) -> float:
+        """최근 구간의 추론 CPU 사용률 (단일 코어 = 1.0)"""
+        if len(self._samples) < 2:
+            return 0.0
+        span = max(self._samples[-1][0] - self._samples[0][0], 1e-3)
+        # 첫 샘플은 구간 시작점이므로 CPU 합계에서 제외합니다.
+        return sum(s[2] for s in list(self._samples)[1:]) / 1000.0 / span
+
+    @property
+    def mean_latency_ms(self) -> float:
+        if not self._samples:
+            return 0.0
+        return sum(s[1] for s in self._samples) / len(self._samples)
+
+    # ------------------------------------------------------------------ #
+    # 조절
+    # ------------------------------------------------------------------ #
+    def update(self, now: float) -> Optional[int]:
+        """예산을 확인해 복잡도/FPS를 조절합니다.
+
+        Returns:
+            모델 복잡도가 바뀌었으면 새 복잡도, 아니면 None
+        """
+        if not self.enabled or now - self._last_change < self.cooldown_s:
+            return None
+        # 구간이 충분히 채워지기 전에는 판단하지 않습니다.
+        if not self._samples or now - self._samples[0][0] < self.window_s * 0.5:
+            return None
+
+        cpu = self.cpu_usage
+        latency = self.mean_latency_ms
+        over = cpu > self.cpu_budget or latency > self.max_latency_ms
+        headroom = (
+            cpu < self.cpu_budget * self.recover_ratio
+            and latency < self.max_latency_ms * self.recover_ratio
+            and now - self._last_change >= self.cooldown_s * self._recover_backoff
+        )
+
+        new_complexity: Optional[int] = None
+        if over:
+            if self._last_recover is not None and now - self._last_recover < self.cooldown_s * 2:
+                self._recover_backoff = min(self._recover_backoff * 2.0, 16.0)
+            else:
+                self._recover_backoff = 1.0
+            self._last_recover = None
+            # 정확도(복잡도)를 먼저 낮추고, 더 낮출 수 없으면 추론 FPS를 낮춥니다.
+            if self.complexity > self.min_complexity:
+                new_complexity = self.complexity - 1
+            elif self.target_fps > self.min_fps:
+                self.target_fps = max(self.min_fps, self.target_fps * self.fps_step)
+            else:
+                return None
+        elif headroom:
+            # 복구는 역순: FPS를 먼저 되돌리고, 그다음 복잡도를 올립니다.
+            if self.target_fps < self.max_fps:
+                self.target_fps = min(self.max_fps, self.target_fps / self.fps_step)
+            elif self.complexity < self.max_complexity:
+                new_complexity = self.complexity + 1
+            else:
+                return None
+            self._last_recover = now
+        else:
+            return None
+
+        if new_complexity is not None:
+            self.complexity = new_complexity
+        self._last_change = now
+        # 설정이 바뀌었으므로 이전 측정값은 버립니다.
+        self._samples.clear()
+        logger.info(
+            f"추론 거버너: CPU {cpu * 100:.0f}% / 지연 {latency:.0f}ms -> "
+            f"complexity={self.complexity}, fps={self.target_fps:.1f}"
+        )
+        return new_complexity
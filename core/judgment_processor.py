@@ -2,13 +2,20 @@
 판정 처리 모듈
 노트 판정 로직을 통합 관리합니다.
 """
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from core.judgment_records import PHASE_ENTER, PHASE_EXIT, HitEvent, NoteType
 from core.note import Note
+from core.note_index import NoteIndex
 from core.score_manager import ScoreManager
-from core.hit_effect import HitEffectSystem
-from core.judgment_logic import JudgmentLogic
-from core.constants import JUDGMENT_WINDOW
+from core.judgment_strategy import JudgmentStrategyTable
+
+if TYPE_CHECKING:
+    from core.hit_effect import HitEffectSystem
+
+
+# 테스트 모드에서 매칭 과정을 로그로 남기는 이벤트 타입
+_LOGGED_TYPES = (NoteType.JAB_L, NoteType.JAB_R)
 
 
 class JudgmentProcessor:
@@ -18,7 +25,7 @@ class JudgmentProcessor:
         self,
         judge_timing: Dict[str, float],
         score_manager: ScoreManager,
-        hit_effect_system: HitEffectSystem,
+        hit_effect_system: "HitEffectSystem",
         audio_manager,
         pose_tracker,
         window_width: int,
@@ -29,7 +36,9 @@ class JudgmentProcessor:
         hit_zone_camera: Tuple[int, int],
         test_mode: bool = False,
         x_scale: float = 1.0,
-        y_scale: float = 1.0
+        y_scale: float = 1.0,
+        note_index: Optional[NoteIndex] = None,
+        config_rules: Optional[Dict[str, Any]] = None
     ):
         self.judge_timing = judge_timing
         self.score_manager = score_manager
@@ -45,13 +54,42 @@ class JudgmentProcessor:
         self.test_mode = test_mode
         self.x_scale = x_scale
         self.y_scale = y_scale
+        # NoteManager의 타입별 시각 인덱스. 없으면 호출마다 active_notes로 임시 인덱스를 만듭니다.
+        self.note_index = note_index
+        
+        # 이벤트와 매칭할 노트를 찾는 최대 시간 창 (판정 전략별 매칭 창의 기본값)
+        self.match_window = max(
+            self.judge_timing.get("perfect", 0.2),
+            self.judge_timing.get("great", 0.35),
+            self.judge_timing.get("good", 0.5)
+        ) + 0.1
         
-        self.judgment_logic = JudgmentLogic()
+        # 노트 타입 → 판정 전략 (rules.json의 bomb_penalty 등을 읽고, 화면 기하를 캐시)
+        self.strategies = JudgmentStrategyTable(self, config_rules)
+        # 이번 프레임에 판정된(히트/미스) 노트. 판정 스케줄러가 꺼내 NoteManager에서 제거합니다.
+        self.judged: List[Note] = []
+        # 시작/종료 이벤트로 추적한 진행 중인 유지형 동작 {이벤트 타입: 시작 시각}.
+        # 동작 감지기의 유지 상태를 볼 수 없을 때(이벤트만 기록된 리플레이) 판정 스케줄러가 대신 씁니다.
+        self.event_holds: Dict[NoteType, float] = {}
+    
+    def set_viewport(self, window_width: int, window_height: int, x_scale: float, y_scale: float) -> None:
+        """창 크기가 바뀌면 판정 전략이 캐시한 기하를 다시 계산합니다."""
+        viewport = (window_width, window_height, x_scale, y_scale)
+        if viewport == (self.window_width, self.window_height, self.x_scale, self.y_scale):
+            return
+        self.window_width, self.window_height, self.x_scale, self.y_scale = viewport
+        self.strategies.invalidate()
+    
+    def _index(self, active_notes: List[Note]) -> NoteIndex:
+        """판정에 사용할 노트 인덱스를 반환합니다."""
+        if self.note_index is not None:
+            return self.note_index
+        return NoteIndex.from_notes(active_notes)
     
     def process_hit_events(
         self,
         game_time: float,
-        hit_events: List[Dict[str, Any]],
+        hit_events: List[HitEvent],
         active_notes: List[Note],
         song_start_time: Optional[float],
         timing_offset: float,
@@ -59,174 +97,70 @@ class JudgmentProcessor:
     ) -> None:
         """
         히트 이벤트를 처리하고 노트와 매칭합니다.
+        이벤트 시각(t_hit)은 프레임 캡처 시각이므로 추론/전달 지연은 이미 빠져 있습니다.
         
         Args:
             game_time: 게임 시간
             hit_events: 히트 이벤트 리스트
             active_notes: 활성 노트 리스트
             song_start_time: 곡 시작 시간
-            timing_offset: 타이밍 오프셋
+            timing_offset: 타이밍 오프셋 (캡처 이전 구간의 고정 지연만 보정)
             now: 현재 시간
         """
         if not hit_events:
             return
         
+        index = self._index(active_notes)
         for event in hit_events:
-            # 이미 사용된 이벤트는 건너뛰기
-            if event.get("used", False):
+            # 유지형 동작: 유지 상태를 기록하고, 종료 알림은 건너뛰기 (유지형 동작은 시작 이벤트로 매칭)
+            if event.phase == PHASE_ENTER:
+                self.event_holds[event.type] = event.t_hit
+            elif event.phase == PHASE_EXIT:
+                self.event_holds.pop(event.type, None)
                 continue
             
-            note_type = event.get("type")
-            event_time = event.get("t_hit", now)
+            note_type = event.type
+            event_time = event.t_hit
             
-            # 이벤트 시간을 게임 시간으로 변환
+            # 이벤트(캡처) 시간을 게임 시간으로 변환
             if song_start_time:
                 adjusted_time = (event_time - song_start_time) + timing_offset
             else:
                 adjusted_time = 0.0
-                if self.test_mode and note_type in ["JAB_L", "JAB_R"]:
+                if self.test_mode and note_type in _LOGGED_TYPES:
                     from core.logger import get_logger
                     logger = get_logger()
-                    logger.warning(f"song_start_time is None for {note_type}, adjusted_time=0.0")
+                    logger.warning(f"song_start_time is None for {note_type.name}, adjusted_time=0.0")
                 continue
             
-            # 노트 매칭
-            candidate = self._find_best_matching_note(note_type, adjusted_time, active_notes)
+            # 노트 매칭: 이 이벤트로 맞출 수 있는 노트 타입(예: JAB_L → JAB_L, 왼쪽 레인 BOMB) 중 가장 가까운 노트
+            # 매칭 창은 노트 타입별 전략의 창입니다 (위빙은 JUDGMENT_WINDOW).
+            candidate = None
+            delta = self.match_window
+            for candidate_type in self.strategies.note_types_for_event(note_type):
+                strategy = self.strategies.for_note(candidate_type)
+                note = index.nearest(candidate_type, adjusted_time, min(delta, strategy.match_window))
+                if note is not None and strategy.accepts(note, event):
+                    candidate, delta = note, abs(adjusted_time - note.t)
             if not candidate:
-                if self.test_mode and note_type in ["JAB_L", "JAB_R"]:
+                if self.test_mode and note_type in _LOGGED_TYPES:
                     self._log_matching_failure(note_type, adjusted_time, active_notes)
                 continue
             
-            # 판정 등급 결정
-            delta = abs(adjusted_time - candidate.t)
-            judgement = self._determine_judgement(delta)
-            if judgement is None:
-                if self.test_mode and note_type in ["JAB_L", "JAB_R"]:
+            # 판정 (노트 타입별 전략)
+            if not self.strategies.for_note(candidate.kind).on_event(candidate, event, adjusted_time - candidate.t, now):
+                if self.test_mode and note_type in _LOGGED_TYPES:
                     from core.logger import get_logger
                     logger = get_logger()
-                    logger.debug(f"No judgement for {note_type}: delta={delta:.3f}, thresholds={self.judge_timing}")
+                    logger.debug(f"No judgement for {note_type.name}: delta={delta:.3f}, thresholds={self.judge_timing}")
                 continue
             
-            # 판정 등록
-            self._register_hit(candidate, judgement, delta, now)
-            
-            if self.test_mode and note_type in ["JAB_L", "JAB_R"]:
+            if self.test_mode and note_type in _LOGGED_TYPES:
                 from core.logger import get_logger
                 logger = get_logger()
-                logger.info(f"{note_type} -> {judgement} (delta={delta:.3f}s)")
-            
-            # 이벤트 소비
-            event["used"] = True
-    
-    def process_weave_judgments(
-        self,
-        game_time: float,
-        active_notes: List[Note],
-        now: float
-    ) -> None:
-        """
-        위빙 노트에 대한 판정을 처리합니다.
-        
-        Args:
-            game_time: 게임 시간
-            active_notes: 활성 노트 리스트
-            now: 현재 시간
-        """
-        if not self.pose_tracker:
-            return
-        
-        # 위빙 타입 노트만 필터링
-        weave_notes = [
-            note for note in active_notes
-            if note.typ in ["WEAVE_L", "WEAVE_R"] and not note.hit and not note.missed
-        ]
-        
-        for note in weave_notes:
-            # 시간 판정
-            time_diff = abs(game_time - note.t)
-            if time_diff > JUDGMENT_WINDOW:
-                continue
-            
-            # JudgmentLogic을 사용하여 판정
-            judgment = self.judgment_logic.check_hit(
-                note,
-                self.pose_tracker,
-                game_time,
-                self.window_width,
-                self.window_height,
-                self.x_scale
-            )
-            
-            if judgment == 'HIT':
-                delta = time_diff
-                judgement = self._determine_judgement(delta)
-                if judgement:
-                    self._register_hit(note, judgement, delta, now)
-            elif judgment == 'MISS':
-                self._register_miss(note, now)
+                logger.info(f"{note_type.name} -> {candidate.judge_result} (delta={delta:.3f}s)")
     
-    def process_misses(
-        self,
-        game_time: float,
-        active_notes: List[Note],
-        now: float
-    ) -> None:
-        """
-        미스 판정을 처리합니다.
-        
-        Args:
-            game_time: 게임 시간
-            active_notes: 활성 노트 리스트
-            now: 현재 시간
-        """
-        # MISS 판정 창을 good 창보다 약간 더 크게 설정 (1.2배)
-        miss_window = self.judge_timing.get("good", 0.5) * 1.2
-        
-        for note in active_notes:
-            if note.hit or note.missed:
-                continue
-            # 위빙 노트는 별도 처리하므로 제외
-            if note.typ in ["WEAVE_L", "WEAVE_R"]:
-                continue
-            if game_time > note.t + miss_window:
-                self._register_miss(note, now)
-    
-    def _find_best_matching_note(
-        self,
-        note_type: Optional[str],
-        adjusted_time: float,
-        active_notes: List[Note]
-    ) -> Optional[Note]:
-        """이벤트 시간에 가장 가까운 미판정 노트를 찾습니다."""
-        if note_type is None:
-            return None
-        
-        candidates = [
-            note for note in active_notes 
-            if note.typ == note_type and not note.hit and not note.missed
-        ]
-        
-        if not candidates:
-            return None
-        
-        # 판정 창 내의 노트만 필터링
-        max_window = max(
-            self.judge_timing.get("perfect", 0.2),
-            self.judge_timing.get("great", 0.35),
-            self.judge_timing.get("good", 0.5)
-        ) + 0.1
-        
-        valid_candidates = [
-            note for note in candidates 
-            if abs(note.t - adjusted_time) <= max_window
-        ]
-        
-        if not valid_candidates:
-            return None
-        
-        return min(valid_candidates, key=lambda note: abs(note.t - adjusted_time))
-    
-    def _determine_judgement(self, delta: float) -> Optional[str]:
+    def determine_judgement(self, delta: float) -> Optional[str]:
         """시간 차이에 따라 판정 등급을 결정합니다."""
         thresholds = [
             ("PERFECT", self.judge_timing.get("perfect", 0.2)),
@@ -238,13 +172,14 @@ class JudgmentProcessor:
                 return judge
         return None
     
-    def _register_hit(self, note: Note, judgement: str, delta: float, now: float) -> None:
+    def register_hit(self, note: Note, judgement: str, delta: float, now: float) -> None:
         """히트 판정을 등록합니다."""
         note.hit = True
         note.judge_result = judgement
+        self.judged.append(note)
         
         # 점수 및 콤보 업데이트
-        self.score_manager.register_hit(judgement, note.typ, delta, now)
+        self.score_manager.register_hit(judgement, note.kind, delta, now)
         
         # 히트 이펙트 생성
         hit_zone_arcade = self.coord_converter(self.hit_zone_camera)
@@ -263,13 +198,41 @@ class JudgmentProcessor:
             sfx_key = judgement if judgement in self.score_manager.score_values else "MISS"
             self.audio_manager.play_sfx(sfx_key)
     
-    def _register_miss(self, note: Note, now: float) -> None:
+    def register_penalty(self, note: Note, label: str, points: int, now: float) -> None:
+        """치면 안 되는 노트(폭탄)를 친 경우: 감점하고 콤보를 끊습니다."""
+        note.hit = True
+        note.judge_result = label
+        self.judged.append(note)
+        
+        self.score_manager.register_penalty(label, note.kind, points, now)
+        
+        hit_zone_arcade = self.coord_converter(self.hit_zone_camera)
+        color_bgr = self.config_colors.get("judgement", {}).get(label, (255, 255, 255))
+        self.hit_effect_system.spawn_effect(
+            hit_zone_arcade[0],
+            hit_zone_arcade[1],
+            label,
+            self.color_converter(tuple(color_bgr)),
+            now,
+        )
+        
+        if self.audio_manager:
+            self.audio_manager.play_sfx(label)
+    
+    def retire_note(self, note: Note, result: str) -> None:
+        """점수/콤보 변화 없이 노트를 판정 완료로 처리합니다 (예: 피한 폭탄)."""
+        note.hit = True
+        note.judge_result = result
+        self.judged.append(note)
+    
+    def register_miss(self, note: Note, now: float) -> None:
         """미스 판정을 등록합니다."""
         note.missed = True
         note.judge_result = "MISS"
+        self.judged.append(note)
         
         # 점수 및 콤보 업데이트
-        self.score_manager.register_miss(note.typ, now)
+        self.score_manager.register_miss(note.kind, now)
         
         # 미스 이펙트 생성
         note_pos_arcade = self.coord_converter((note.x, note.y))
@@ -289,7 +252,7 @@ class JudgmentProcessor:
     
     def _log_matching_failure(
         self,
-        note_type: str,
+        note_type: NoteType,
         adjusted_time: float,
         active_notes: List[Note]
     ) -> None:
@@ -299,17 +262,12 @@ class JudgmentProcessor:
         
         candidates_all = [
             n for n in active_notes 
-            if n.typ == note_type and not n.hit and not n.missed
+            if n.kind == note_type and not n.hit and not n.missed
         ]
-        logger.debug(f"No candidate for {note_type}: adjusted_time={adjusted_time:.2f}, all_candidates={len(candidates_all)}")
+        logger.debug(f"No candidate for {note_type.name}: adjusted_time={adjusted_time:.2f}, all_candidates={len(candidates_all)}")
         
         if candidates_all:
             closest = min(candidates_all, key=lambda n: abs(n.t - adjusted_time))
             delta_closest = abs(closest.t - adjusted_time)
-            max_window = max(
-                self.judge_timing.get("perfect", 0.2),
-                self.judge_timing.get("great", 0.35),
-                self.judge_timing.get("good", 0.5)
-            ) + 0.1
-            logger.debug(f"Closest note: t={closest.t:.2f}, delta={delta_closest:.2f}, max_window={max_window:.2f}")
+            logger.debug(f"Closest note: t={closest.t:.2f}, delta={delta_closest:.2f}, max_window={self.match_window:.2f}")
 
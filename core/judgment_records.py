@@ -0,0 +1,89 @@
+"""
+판정 레코드 모듈
+히트 이벤트, 판정 결과, 노트 타입을 dict/문자열 대신 고정 필드 레코드로 표현합니다.
+
+- NoteType: 노트/이벤트 타입 정수 열거형. 판정 경로(노트 인덱스, 전략 테이블, 이벤트 매칭)는 이 값으로 비교합니다.
+  비트맵과 설정(색상, 라벨)은 타입 이름 문자열을 쓰므로 Note.typ(문자열)은 그대로 두고 Note.kind에 열거값을 둡니다.
+- HitEvent: 동작 감지기가 내는 이벤트. 불변이므로 소비 여부는 이벤트에 쓰지 않고 판정하는 쪽이 추적합니다.
+- Judgment / JudgmentJournal: 판정 기록. 화면 표시용 문자열은 그릴 때만 만들고, 새 기록은 누적 순번으로 찾습니다.
+"""
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Iterator, List, NamedTuple, Optional
+
+
+class NoteType(IntEnum):
+    """노트/히트 이벤트 타입"""
+    UNKNOWN = 0
+    JAB_L = 1
+    JAB_R = 2
+    WEAVE_L = 3
+    WEAVE_R = 4
+    HOOK_L = 5
+    HOOK_R = 6
+    UPPERCUT_L = 7
+    UPPERCUT_R = 8
+    DUCK = 9
+    BOMB = 10
+
+    @classmethod
+    def parse(cls, name: Optional[str]) -> "NoteType":
+        """타입 이름(비트맵/설정 문자열)을 열거값으로 바꿉니다. 모르는 이름은 UNKNOWN."""
+        return cls.__members__.get(name, cls.UNKNOWN) if name else cls.UNKNOWN
+
+
+# 유지형 동작 이벤트의 단계
+PHASE_ENTER = "enter"
+PHASE_EXIT = "exit"
+
+
+class HitEvent(NamedTuple):
+    """동작 감지 이벤트"""
+    type: NoteType
+    t_hit: float  # 동작 시각 (프레임 캡처 시각 기준, 잽은 프레임 사이 보간 시각)
+    phase: Optional[str] = None  # 유지형 동작: PHASE_ENTER / PHASE_EXIT (t_hit = 시작 시각)
+    duration: float = 0.0  # 유지형 동작 종료 시 유지 시간
+
+
+class Judgment(NamedTuple):
+    """판정 결과 기록"""
+    result: str  # PERFECT / GREAT / GOOD / MISS / BOMB! ...
+    note_type: NoteType
+    delta: float
+    t: float  # 판정 시각
+
+    def __str__(self) -> str:
+        return f"{self.result} ({self.note_type.name}) Δ={self.delta:0.3f}"
+
+
+class JudgmentJournal:
+    """최근 판정 기록 (최신순 고정 길이) + 누적 기록 수
+
+    소비자는 마지막으로 읽은 누적 수(total)를 기억해 두고 since()로 그 뒤의 기록만 가져갑니다.
+    """
+
+    def __init__(self, maxlen: int = 10) -> None:
+        self._entries: Deque[Judgment] = deque(maxlen=maxlen)
+        self.total = 0  # 지금까지 기록된 판정 수 (clear 전까지 증가만 함)
+
+    def record(self, judgment: Judgment) -> None:
+        self._entries.appendleft(judgment)
+        self.total += 1
+
+    def since(self, total: int) -> List[Judgment]:
+        """누적 수가 total이었던 이후의 기록 (오래된 순, 최대 maxlen개)"""
+        count = min(self.total - total, len(self._entries))
+        if count <= 0:
+            return []
+        return [self._entries[i] for i in range(count - 1, -1, -1)]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total = 0
+
+    def __iter__(self) -> Iterator[Judgment]:
+        """최신순"""
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
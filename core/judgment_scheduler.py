@@ -0,0 +1,81 @@
+"""
+판정 스케줄러 모듈
+프레임마다 히트 이벤트 매칭, 위빙/유지 동작 판정, 미스 처리를 한 번에 수행합니다.
+판정 창이 열린 노트(판정 시각이 지금 + 판정 창 이전인 미판정 노트)만 시각 순서로 한 번 훑으며
+노트 타입별 판정 전략(core.judgment_strategy)으로 보내고, 판정된 노트는 그 자리에서 NoteManager에서 제거합니다.
+화면에 떠 있는 노트 수와 관계없이 프레임당 비용은 판정 창 안의 노트 수에만 비례합니다.
+"""
+import heapq
+import time
+from operator import attrgetter
+from typing import List, Optional
+
+from core.constants import JUDGMENT_WINDOW
+from core.judgment_processor import JudgmentProcessor
+from core.judgment_records import HitEvent
+from core.judgment_strategy import JudgeContext
+from core.note_manager import NoteManager
+
+
+_note_time = attrgetter("t")
+
+
+class JudgmentScheduler:
+    """프레임 단위 판정 패스를 수행하는 클래스"""
+
+    def __init__(self, processor: JudgmentProcessor, note_manager: NoteManager, ema_alpha: float = 0.1) -> None:
+        """
+        Args:
+            processor: 판정 등록(점수/이펙트/사운드)을 담당하는 JudgmentProcessor
+            note_manager: 활성 노트와 시각 인덱스를 가진 NoteManager
+            ema_alpha: 판정 시간 이동 평균 계수
+        """
+        self.processor = processor
+        self.note_manager = note_manager
+        self.ema_alpha = ema_alpha
+        self.lookahead = JUDGMENT_WINDOW  # 지금보다 이만큼 뒤의 노트까지 판정 창이 열려 있음
+        self.context = JudgeContext()
+        self.last_ms = 0.0
+        self.mean_ms = 0.0
+        self.last_judged = 0  # 이번 프레임에 판정된 노트 수
+
+    def update(
+        self,
+        game_time: float,
+        hit_events: List[HitEvent],
+        song_start_time: Optional[float],
+        timing_offset: float,
+        now: float,
+    ) -> None:
+        """한 프레임의 판정을 수행합니다."""
+        start = time.perf_counter()
+        processor = self.processor
+        notes = self.note_manager.get_active_notes()
+
+        # 1. 히트 이벤트 → 가장 가까운 노트 (이분 탐색)
+        processor.process_hit_events(game_time, hit_events, notes, song_start_time, timing_offset, now)
+
+        # 2. 판정 창이 열린 노트를 시각 순서로 한 번 훑으며 타입별 전략으로 판정
+        ctx = self.context
+        ctx.game_time = game_time
+        ctx.now = now
+        ctx.holds = processor.pose_tracker.gestures.active_holds() if processor.pose_tracker else processor.event_holds
+        strategies = processor.strategies
+        index = self.note_manager.index
+        t_max = game_time + self.lookahead
+        for note in heapq.merge(*(index.until(typ, t_max) for typ in index.types()), key=_note_time):
+            if note.hit or note.missed:
+                continue
+            strategy = strategies.for_note(note.kind)
+            if note.t < game_time - strategy.miss_after:
+                strategy.expire(note, ctx)
+            else:
+                strategy.update(note, ctx)
+
+        # 3. 판정된 노트만 제거
+        self.last_judged = len(processor.judged)
+        self.note_manager.retire(processor.judged)
+        processor.judged.clear()
+
+        self.last_ms = (time.perf_counter() - start) * 1000.0
+        self.mean_ms += self.ema_alpha * (self.last_ms - self.mean_ms)
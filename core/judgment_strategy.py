@@ -1,120 +1,223 @@
 """
 판정 전략 모듈
-판정 로직을 전략 패턴으로 분리합니다.
+노트 타입별 판정 로직을 전략 객체로 분리하고, 노트 타입 → 전략 객체 테이블로 찾아 씁니다.
+
+새 노트 타입은 전략 클래스를 만들고 @register_strategy(NoteType.타입, ...)로 등록하면 되며,
+JudgmentProcessor/JudgmentScheduler는 노트마다 테이블 조회 한 번으로 전략을 찾습니다 (Note.kind 정수 키, 문자열 비교 없음).
+화면 크기에 따라 달라지는 판정 기하(위빙 라인 위치 등)는 전략 객체가 계산해 두고, 창 크기가 바뀔 때만 다시 계산합니다.
 """
-from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
+from core.constants import DODGE_LINE_OFFSET, JUDGMENT_WINDOW
+from core.judgment_records import HitEvent, NoteType
 from core.note import Note
 
+if TYPE_CHECKING:
+    from core.judgment_processor import JudgmentProcessor
 
-class JudgmentStrategy(ABC):
-    """판정 로직을 위한 추상 전략 클래스"""
-    
-    @abstractmethod
-    def judge(
-        self,
-        note: Note,
-        event: Dict,
-        game_time: float,
-        judge_timing: Dict[str, float]
-    ) -> Optional[str]:
-        """
-        노트와 이벤트를 기반으로 판정을 수행합니다.
-        
-        Args:
-            note: 판정할 노트
-            event: 히트 이벤트
-            game_time: 게임 시간
-            judge_timing: 판정 타이밍 설정
-            
-        Returns:
-            판정 결과 (PERFECT, GREAT, GOOD, MISS) 또는 None
+
+# 등록된 판정 전략 (노트 타입 → 전략 클래스)
+JUDGMENT_STRATEGIES: Dict[NoteType, Type["JudgmentStrategy"]] = {}
+
+
+def register_strategy(*note_types: NoteType):
+    """판정 전략 클래스를 노트 타입에 등록하는 데코레이터"""
+    def decorator(cls: Type["JudgmentStrategy"]) -> Type["JudgmentStrategy"]:
+        for note_type in note_types:
+            JUDGMENT_STRATEGIES[note_type] = cls
+        return cls
+    return decorator
+
+
+@dataclass
+class JudgeContext:
+    """한 프레임의 판정 입력 (스케줄러가 프레임마다 갱신해 모든 전략에 전달)"""
+    game_time: float = 0.0
+    now: float = 0.0
+    holds: Dict[NoteType, float] = field(default_factory=dict)  # 유지 중인 동작 타입 → 시작 시각 (캡처 시각)
+
+
+class JudgmentStrategy:
+    """노트 타입별 판정 전략의 기본 클래스: 히트 이벤트로만 판정하고, 판정 창이 지나면 미스"""
+
+    def __init__(self, processor: "JudgmentProcessor", config_rules: Dict[str, Any]) -> None:
+        self.processor = processor
+        # 히트 이벤트와 이 노트를 매칭할 최대 시간 차이
+        self.match_window = processor.match_window
+        # 노트 시각 이후 이 시간이 지나도록 판정되지 않으면 expire (MISS 창은 good 창의 1.2배)
+        self.miss_after = processor.judge_timing.get("good", 0.5) * 1.2
+
+    def event_types(self, note_type: NoteType) -> Tuple[NoteType, ...]:
+        """이 타입의 노트를 맞출 수 있는 히트 이벤트 타입"""
+        return (note_type,)
+
+    def accepts(self, note: Note, event: HitEvent) -> bool:
+        """이벤트가 이 노트에 해당하는지 (시간 외의 조건)"""
+        return True
+
+    def on_event(self, note: Note, event: HitEvent, offset: float, now: float) -> bool:
+        """이벤트와 매칭된 노트를 판정합니다. 이벤트를 소비했으면 True.
+
+        offset은 이벤트 시각 - 노트 시각 (게임 시간, 늦으면 양수)입니다.
         """
-        pass
-
-
-class JabJudgmentStrategy(JudgmentStrategy):
-    """JAB 판정 전략"""
-    
-    def judge(
-        self,
-        note: Note,
-        event: Dict,
-        game_time: float,
-        judge_timing: Dict[str, float]
-    ) -> Optional[str]:
-        """JAB 노트에 대한 판정을 수행합니다."""
-        if note.typ not in ["JAB_L", "JAB_R"]:
-            return None
-        
-        # 이벤트 시간과 노트 시간의 차이 계산
-        event_time = event.get("t_hit", game_time)
-        delta = abs(game_time - note.t)
-        
-        # 판정 창 확인
-        thresholds = [
-            ("PERFECT", judge_timing.get("perfect", 0.2)),
-            ("GREAT", judge_timing.get("great", 0.35)),
-            ("GOOD", judge_timing.get("good", 0.5)),
-        ]
-        
-        for judge, window in thresholds:
-            if delta <= window:
-                return judge
-        
-        return None
+        delta = abs(offset)
+        judgement = self.processor.determine_judgement(delta)
+        if judgement is None:
+            return False
+        self.processor.register_hit(note, judgement, delta, now)
+        return True
+
+    def update(self, note: Note, ctx: JudgeContext) -> None:
+        """판정 창이 열려 있는 동안 매 프레임 호출됩니다 (위치/유지 기반 판정)."""
+
+    def expire(self, note: Note, ctx: JudgeContext) -> None:
+        """판정되지 않은 채 판정 창이 지났을 때"""
+        self.processor.register_miss(note, ctx.now)
+
+    def invalidate(self) -> None:
+        """창 크기가 바뀌었을 때 캐시한 판정 기하를 다시 계산합니다."""
+
+
+@register_strategy(
+    NoteType.JAB_L, NoteType.JAB_R, NoteType.HOOK_L, NoteType.HOOK_R, NoteType.UPPERCUT_L, NoteType.UPPERCUT_R
+)
+class PunchJudgmentStrategy(JudgmentStrategy):
+    """펀치: 같은 타입의 히트 이벤트 시각과 노트 시각의 차이로 판정"""
+
+
+@register_strategy(NoteType.DUCK)
+class HoldJudgmentStrategy(JudgmentStrategy):
+    """유지형 동작(더킹): 노트 시각에 유지 중인지와 유지 시작 시각으로 판정
+
+    - 노트 시각 전에 시작: 시작 이벤트로는 판정하지 않고, 노트 시각이 지날 때 아직 유지 중이면 시간 차이 0으로 판정합니다.
+      노트 시각 전에 풀었으면 판정되지 않고 판정 창이 지나 MISS가 됩니다.
+    - 노트 시각 뒤에 시작: 시작 이벤트에서 늦은 만큼을 시간 차이로 판정합니다.
+    """
 
+    def on_event(self, note: Note, event: HitEvent, offset: float, now: float) -> bool:
+        if offset < 0:
+            # 이른 시작: 노트 시각까지 유지하는지 update에서 확인 (이벤트는 이 노트의 유지 시작으로 소비)
+            return True
+        judgement = self.processor.determine_judgement(offset)
+        if judgement is None:
+            return False
+        self.processor.register_hit(note, judgement, offset, now)
+        return True
 
+    def update(self, note: Note, ctx: JudgeContext) -> None:
+        started_at = ctx.holds.get(note.kind)
+        if started_at is None:
+            return
+        # 유지 시작 시각(캡처 시각)을 게임 시간으로 변환
+        started = ctx.game_time - (ctx.now - started_at)
+        if started <= note.t <= ctx.game_time:
+            judgement = self.processor.determine_judgement(0.0)
+            if judgement:
+                self.processor.register_hit(note, judgement, 0.0, ctx.now)
+
+
+@register_strategy(NoteType.WEAVE_L, NoteType.WEAVE_R)
 class WeaveJudgmentStrategy(JudgmentStrategy):
-    """WEAVE 판정 전략"""
-    
-    def __init__(self, judgment_logic, pose_tracker, window_width: int, window_height: int):
-        self.judgment_logic = judgment_logic
-        self.pose_tracker = pose_tracker
-        self.window_width = window_width
-        self.window_height = window_height
-    
-    def judge(
-        self,
-        note: Note,
-        event: Dict,
-        game_time: float,
-        judge_timing: Dict[str, float]
-    ) -> Optional[str]:
-        """WEAVE 노트에 대한 판정을 수행합니다."""
-        if note.typ not in ["WEAVE_L", "WEAVE_R"]:
-            return None
-        
-        from core.constants import JUDGMENT_WINDOW
-        
-        # 시간 판정
-        time_diff = abs(game_time - note.t)
-        if time_diff > JUDGMENT_WINDOW:
+    """위빙: 판정 창 안에서 코 위치가 위빙 영역에 있는지로 판정
+
+    WEAVE_L = 중앙선 ~ 오른쪽 라인, WEAVE_R = 왼쪽 라인 ~ 중앙선 (화면 기준, 라인 간격 DODGE_LINE_OFFSET * x_scale).
+    화면 좌표의 라인 위치를 카메라 좌표로 한 번 변환해 두고, 프레임마다 코의 카메라 x와 바로 비교합니다.
+    """
+
+    def __init__(self, processor: "JudgmentProcessor", config_rules: Dict[str, Any]) -> None:
+        super().__init__(processor, config_rules)
+        # 이벤트로 맞추든 코 위치로 맞추든 같은 위빙 판정 창을 씁니다.
+        self.match_window = JUDGMENT_WINDOW
+        self.miss_after = JUDGMENT_WINDOW
+        self.regions: Dict[NoteType, Tuple[float, float]] = {}
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        processor = self.processor
+        pose_width = getattr(processor.pose_tracker, "width", 0) or 0
+        scale = processor.window_width / pose_width if pose_width > 0 else 1.0
+        center = processor.window_width / 2 / scale
+        offset = DODGE_LINE_OFFSET * processor.x_scale / scale
+        self.regions = {NoteType.WEAVE_L: (center, center + offset), NoteType.WEAVE_R: (center - offset, center)}
+
+    def update(self, note: Note, ctx: JudgeContext) -> None:
+        pose_tracker = self.processor.pose_tracker
+        time_diff = abs(ctx.game_time - note.t)
+        if pose_tracker is None or time_diff > JUDGMENT_WINDOW:
+            return
+        nose = self._nose(pose_tracker, ctx.now)
+        low, high = self.regions[note.kind]
+        if nose is not None and low < nose[0] < high:
+            judgement = self.processor.determine_judgement(time_diff)
+            if judgement:
+                self.processor.register_hit(note, judgement, time_diff, ctx.now)
+        else:
+            self.processor.register_miss(note, ctx.now)
+
+    @staticmethod
+    def _nose(pose_tracker: Any, now: float) -> Optional[Tuple[float, float]]:
+        """판정 시각으로 예측한 코 위치 (예측할 수 없으면 스무딩된 위치)"""
+        landmarks = pose_tracker.get_smoothed_landmarks()
+        if not landmarks or not landmarks.get("nose"):
             return None
-        
-        # JudgmentLogic을 사용하여 위치 판정
-        judgment = self.judgment_logic.check_hit(
-            note,
-            self.pose_tracker,
-            game_time,
-            self.window_width,
-            self.window_height
-        )
-        
-        if judgment == 'HIT':
-            # 시간 차이에 따라 판정 등급 결정
-            thresholds = [
-                ("PERFECT", judge_timing.get("perfect", 0.2)),
-                ("GREAT", judge_timing.get("great", 0.35)),
-                ("GOOD", judge_timing.get("good", 0.5)),
-            ]
-            for judge, window in thresholds:
-                if time_diff <= window:
-                    return judge
-            return "GOOD"  # 기본값
-        elif judgment == 'MISS':
-            return "MISS"
-        
-        return None
+        predicted = pose_tracker.predict(now)
+        return predicted["nose"] if predicted else landmarks["nose"]
+
+
+@register_strategy(NoteType.BOMB)
+class BombJudgmentStrategy(JudgmentStrategy):
+    """폭탄: 같은 레인의 잽으로 치면 감점(BOMB!)과 콤보 초기화, 치지 않고 보내면 아무 일도 없음"""
+
+    LANE_EVENTS = {"L": NoteType.JAB_L, "R": NoteType.JAB_R}
+
+    def __init__(self, processor: "JudgmentProcessor", config_rules: Dict[str, Any]) -> None:
+        super().__init__(processor, config_rules)
+        self.penalty = int(config_rules.get("bomb_penalty", -500))
+
+    def event_types(self, note_type: NoteType) -> Tuple[NoteType, ...]:
+        return tuple(self.LANE_EVENTS.values())
+
+    def accepts(self, note: Note, event: HitEvent) -> bool:
+        return self.LANE_EVENTS.get(note.lane) == event.type
+
+    def on_event(self, note: Note, event: HitEvent, offset: float, now: float) -> bool:
+        if self.processor.determine_judgement(abs(offset)) is None:
+            return False
+        self.processor.register_penalty(note, "BOMB!", self.penalty, now)
+        return True
+
+    def expire(self, note: Note, ctx: JudgeContext) -> None:
+        self.processor.retire_note(note, "AVOID")
+
+
+class JudgmentStrategyTable:
+    """노트 타입 → 전략 객체 테이블 (전략 클래스마다 객체 하나를 만들어 그 클래스의 타입들이 공유)"""
+
+    def __init__(self, processor: "JudgmentProcessor", config_rules: Optional[Dict[str, Any]] = None) -> None:
+        config_rules = config_rules or {}
+        instances: Dict[Type[JudgmentStrategy], JudgmentStrategy] = {}
+        self.by_note_type: Dict[NoteType, JudgmentStrategy] = {}
+        for note_type, cls in JUDGMENT_STRATEGIES.items():
+            if cls not in instances:
+                instances[cls] = cls(processor, config_rules)
+            self.by_note_type[note_type] = instances[cls]
+        # 등록되지 않은 타입은 이벤트로만 판정
+        self.default = JudgmentStrategy(processor, config_rules)
+        self.strategies: List[JudgmentStrategy] = list(instances.values()) + [self.default]
+
+        # 히트 이벤트 타입 → 그 이벤트로 맞출 수 있는 노트 타입
+        self.by_event_type: Dict[NoteType, Tuple[NoteType, ...]] = {}
+        for note_type, strategy in self.by_note_type.items():
+            for event_type in strategy.event_types(note_type):
+                self.by_event_type[event_type] = self.by_event_type.get(event_type, ()) + (note_type,)
+
+    def for_note(self, note_type: NoteType) -> JudgmentStrategy:
+        return self.by_note_type.get(note_type, self.default)
+
+    def note_types_for_event(self, event_type: NoteType) -> Tuple[NoteType, ...]:
+        return self.by_event_type.get(event_type, (event_type,))
 
+    def invalidate(self) -> None:
+        for strategy in self.strategies:
+            strategy.invalidate()
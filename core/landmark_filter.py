@@ -0,0 +1,119 @@
+"""
+랜드마크 필터 모듈
+픽셀 좌표 랜드마크 배열 전체를 한 번에 평활화하는 필터 뱅크를 제공합니다.
+랜드마크마다 독립된 필터 상태를 가지며, 모든 연산은 미리 할당된 배열 위에서 제자리(in place)로 수행됩니다.
+
+- none: 평활화 없음
+- ema: 고정 계수 지수 이동 평균 (value += alpha * (raw - value))
+- one_euro: 속도에 따라 차단 주파수가 바뀌는 One Euro 필터
+  (천천히 움직이면 강하게 평활화해 떨림을 줄이고, 빠르게 움직이면 약하게 평활화해 지연을 줄임)
+"""
+import math
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+FILTER_TYPES = ("none", "ema", "one_euro")
+
+
+class LandmarkFilterBank:
+    """(N, D) 랜드마크 배열의 점마다 독립된 필터를 적용하는 클래스"""
+
+    def __init__(
+        self,
+        shape: tuple,
+        filter_type: str = "one_euro",
+        ema_alpha: float = 0.7,
+        min_cutoff: float = 1.0,
+        beta: float = 0.02,
+        d_cutoff: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            shape: 필터링할 배열 모양 (점 개수, 차원)
+            filter_type: "none", "ema", "one_euro"
+            ema_alpha: EMA 계수 (1.0 = 평활화 없음)
+            min_cutoff: One Euro 최소 차단 주파수 (Hz). 낮을수록 정지 상태 떨림이 줄어듦
+            beta: One Euro 속도 계수 (픽셀/초 당 Hz). 클수록 빠른 동작의 지연이 줄어듦
+            d_cutoff: One Euro 속도 추정용 차단 주파수 (Hz)
+        """
+        if filter_type not in FILTER_TYPES:
+            raise ValueError(f"알 수 없는 랜드마크 필터: {filter_type} (지원: {', '.join(FILTER_TYPES)})")
+        self.filter_type = filter_type
+        self.ema_alpha = float(ema_alpha)
+        self.min_cutoff = float(min_cutoff)
+        self.beta = float(beta)
+        self.d_cutoff = float(d_cutoff)
+
+        self.value = np.zeros(shape, dtype=np.float32)  # 필터 출력 (점마다 현재 평활화 값)
+        self._dx = np.zeros(shape, dtype=np.float32)  # One Euro: 평활화된 속도
+        self._raw_dx = np.zeros(shape, dtype=np.float32)
+        self._delta = np.zeros(shape, dtype=np.float32)
+        self._speed = np.zeros(shape[0], dtype=np.float32)
+        self._alpha = np.zeros(shape[0], dtype=np.float32)
+        self._prev_t: Optional[float] = None
+        self.initialized = False
+
+    @classmethod
+    def from_config(cls, cfg: Optional[Dict[str, Any]], shape: tuple) -> "LandmarkFilterBank":
+        """rules.json의 "landmark_filter" 설정으로 필터 뱅크를 만듭니다."""
+        cfg = cfg or {}
+        return cls(
+            shape,
+            filter_type=cfg.get("type", "one_euro"),
+            ema_alpha=cfg.get("ema_alpha", 0.7),
+            min_cutoff=cfg.get("min_cutoff", 1.0),
+            beta=cfg.get("beta", 0.02),
+            d_cutoff=cfg.get("d_cutoff", 1.0),
+        )
+
+    def reset(self) -> None:
+        """필터 상태를 지웁니다. 다음 입력이 그대로 출력됩니다."""
+        self.initialized = False
+        self._prev_t = None
+        self._dx.fill(0.0)
+
+    def update(self, raw: np.ndarray, t: float) -> np.ndarray:
+        """새 측정값으로 필터를 갱신하고 평활화된 배열(self.value)을 반환합니다.
+
+        Args:
+            raw: 측정 배열 (shape과 같은 모양)
+            t: 측정 시각 (초). One Euro만 사용합니다.
+        """
+        if not self.initialized or self.filter_type == "none":
+            np.copyto(self.value, raw)
+            self._prev_t = t
+            self.initialized = True
+            return self.value
+
+        np.subtract(raw, self.value, out=self._delta)
+        if self.filter_type == "ema":
+            self._delta *= self.ema_alpha
+            self.value += self._delta
+            return self.value
+
+        # One Euro: 속도를 먼저 평활화하고, 점마다 속도 크기에 따라 차단 주파수를 정합니다.
+        dt = max(t - self._prev_t, 1e-6)
+        self._prev_t = t
+        np.divide(self._delta, dt, out=self._raw_dx)
+        self._raw_dx -= self._dx
+        self._raw_dx *= self._smoothing_factor(self.d_cutoff, dt)
+        self._dx += self._raw_dx
+
+        np.hypot(self._dx[:, 0], self._dx[:, 1], out=self._speed)
+        # cutoff = min_cutoff + beta * |dx|,  alpha = 1 / (1 + tau / dt),  tau = 1 / (2π cutoff)
+        self._speed *= self.beta
+        self._speed += self.min_cutoff
+        np.multiply(self._speed, 2.0 * math.pi * dt, out=self._alpha)
+        np.add(self._alpha, 1.0, out=self._speed)
+        np.divide(self._alpha, self._speed, out=self._alpha)
+
+        self._delta *= self._alpha[:, None]
+        self.value += self._delta
+        return self.value
+
+    @staticmethod
+    def _smoothing_factor(cutoff: float, dt: float) -> float:
+        r = 2.0 * math.pi * cutoff * dt
+        return r / (r + 1.0)
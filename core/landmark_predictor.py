@@ -0,0 +1,141 @@
+"""
+랜드마크 예측 모듈
+선택한 랜드마크(코, 손)의 위치를 칼만 필터로 추적하고, 임의의 시각(그리기 시각, 판정 시각)으로 외삽합니다.
+포즈 결과는 캡처 후 파이프라인 지연(60~100ms)만큼 늦게 도착하므로, 캡처 시각의 측정값으로 상태를 갱신하고
+현재 시각까지 예측해 그 지연을 숨깁니다.
+
+모델은 축별 등속(constant_velocity: 위치, 속도) 또는 등가속(constant_acceleration: 위치, 속도, 가속도)입니다.
+모든 점과 축이 같은 전이/잡음 모델을 쓰고 같은 시각에 측정되므로, 공분산과 칼만 이득은 하나만 계산해 공유합니다.
+"""
+from collections import deque
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+MODELS = {"constant_velocity": 2, "constant_acceleration": 3}
+
+
+class LandmarkPredictor:
+    """K개 점의 (x, y)를 추적하는 칼만 예측기"""
+
+    def __init__(self, num_points: int, cfg: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Args:
+            num_points: 추적할 점 개수
+            cfg: rules.json의 "landmark_predictor" 설정
+        """
+        cfg = cfg or {}
+        model = cfg.get("model", "constant_velocity")
+        if model not in MODELS:
+            raise ValueError(f"알 수 없는 예측 모델: {model} (지원: {', '.join(MODELS)})")
+        self.model = model
+        self.order = MODELS[model]
+        self.enabled = bool(cfg.get("enabled", True))
+        self.process_noise = float(cfg.get("process_noise", 1.0e6))  # 모델이 설명하지 못하는 움직임의 세기 (픽셀² / s^(2·order-1))
+        self.measurement_noise = float(cfg.get("measurement_noise", 4.0))  # 측정 잡음 표준편차 (픽셀)
+        self.max_horizon_s = float(cfg.get("max_horizon_s", 0.1))  # 이보다 먼 시각으로는 외삽하지 않음
+        self.reset_gap_s = float(cfg.get("reset_gap_s", 0.5))  # 측정 간격이 이보다 길면 추적을 새로 시작
+
+        self.num_points = num_points
+        # 상태: (차수, K*2). 행 = 위치/속도/가속도, 열 = 점별 x, y
+        self.state = np.zeros((self.order, num_points * 2), dtype=np.float64)
+        self.cov = np.eye(self.order, dtype=np.float64)
+        self._out = np.zeros((num_points, 2), dtype=np.float32)
+        self._innovation = np.zeros(num_points * 2, dtype=np.float64)
+        self.last_t: Optional[float] = None
+        self.initialized = False
+
+        # 잔차(예측 위치와 실제 측정의 거리, 픽셀) 기록
+        self.residuals: deque = deque(maxlen=int(cfg.get("residual_window", 120)))
+        self.last_residual_px = 0.0
+
+    def reset(self) -> None:
+        """추적 상태를 지웁니다 (포즈를 잃었을 때)."""
+        self.initialized = False
+        self.last_t = None
+
+    # ------------------------------------------------------------------ #
+    # 모델 행렬
+    # ------------------------------------------------------------------ #
+    def _transition(self, dt: float) -> np.ndarray:
+        F = np.eye(self.order)
+        F[0, 1] = dt
+        if self.order == 3:
+            F[1, 2] = dt
+            F[0, 2] = 0.5 * dt * dt
+        return F
+
+    def _process_cov(self, dt: float) -> np.ndarray:
+        """연속 백색 잡음(등속: 가속도, 등가속: 저크)을 이산화한 공정 잡음 공분산"""
+        q = self.process_noise
+        if self.order == 2:
+            return q * np.array([
+                [dt ** 3 / 3, dt ** 2 / 2],
+                [dt ** 2 / 2, dt],
+            ])
+        return q * np.array([
+            [dt ** 5 / 20, dt ** 4 / 8, dt ** 3 / 6],
+            [dt ** 4 / 8, dt ** 3 / 3, dt ** 2 / 2],
+            [dt ** 3 / 6, dt ** 2 / 2, dt],
+        ])
+
+    # ------------------------------------------------------------------ #
+    # 갱신 / 예측
+    # ------------------------------------------------------------------ #
+    def update(self, points: np.ndarray, t: float) -> None:
+        """시각 t(캡처 시각)에 측정한 점 위치 (K, 2)로 상태를 갱신합니다."""
+        if not self.enabled:
+            return
+        z = points.reshape(-1)
+        if not self.initialized or self.last_t is None or t - self.last_t > self.reset_gap_s:
+            self.state.fill(0.0)
+            self.state[0] = z
+            # 위치는 측정 잡음만큼, 속도/가속도는 크게 불확실한 상태로 시작
+            self.cov = np.diag([self.measurement_noise ** 2] + [1.0e6] * (self.order - 1))
+            self.last_t = t
+            self.initialized = True
+            return
+
+        dt = t - self.last_t
+        if dt <= 0.0:
+            return
+        self.last_t = t
+
+        # 예측
+        F = self._transition(dt)
+        self.state = F @ self.state
+        self.cov = F @ self.cov @ F.T + self._process_cov(dt)
+
+        # 잔차 (예측 위치 - 측정) 기록
+        np.subtract(z, self.state[0], out=self._innovation)
+        residual = self._innovation.reshape(-1, 2)
+        self.last_residual_px = float(np.hypot(residual[:, 0], residual[:, 1]).mean())
+        self.residuals.append(self.last_residual_px)
+
+        # 보정 (H = [1, 0, ...] 이므로 이득은 공분산의 첫 열)
+        s = self.cov[0, 0] + self.measurement_noise ** 2
+        gain = self.cov[:, 0] / s
+        self.state += np.outer(gain, self._innovation)
+        self.cov = self.cov - np.outer(gain, self.cov[0])
+
+    def predict(self, t: float) -> Optional[np.ndarray]:
+        """시각 t의 점 위치 (K, 2)를 예측합니다. 추적 중이 아니면 None.
+
+        반환 배열은 내부 버퍼이므로 다음 호출 전에 사용(또는 복사)해야 합니다.
+        """
+        if not self.enabled or not self.initialized:
+            return None
+        dt = min(max(t - self.last_t, 0.0), self.max_horizon_s)
+        pos = self.state[0] + dt * self.state[1]
+        if self.order == 3:
+            pos += 0.5 * dt * dt * self.state[2]
+        self._out[:] = pos.reshape(-1, 2)
+        return self._out
+
+    @property
+    def mean_residual_px(self) -> float:
+        """최근 구간의 평균 잔차 (픽셀)"""
+        if not self.residuals:
+            return 0.0
+        return sum(self.residuals) / len(self.residuals)
@@ -0,0 +1,153 @@
+"""
+모션 기록 모듈
+모든 랜드마크의 최근 위치를 시각과 함께 미리 할당된 원형 NumPy 버퍼에 저장합니다.
+관절마다 deque를 따로 두지 않고, 구간 조회와 (Savitzky-Golay) 속도/가속도를 모든 관절에 대해 한 번에 계산합니다.
+더 긴 시간 맥락이 필요한 동작 규칙은 이 버퍼를 조회해서 작성합니다.
+"""
+import math
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.pose_landmarks import NUM_LANDMARKS
+
+
+class MotionHistory:
+    """(시각, 관절 위치) 원형 버퍼"""
+
+    def __init__(
+        self,
+        capacity: int = 32,
+        num_points: int = NUM_LANDMARKS,
+        dims: int = 2,
+        savgol_window: int = 7,
+        savgol_order: int = 2,
+    ) -> None:
+        """
+        Args:
+            capacity: 보관할 최대 프레임 수
+            num_points: 관절 수
+            dims: 좌표 차원 (x, y)
+            savgol_window: 미분 계산에 쓰는 기본 샘플 수
+            savgol_order: 미분 계산에 쓰는 기본 다항식 차수
+        """
+        self.capacity = max(2, int(capacity))
+        self.savgol_window = max(2, min(int(savgol_window), self.capacity))
+        self.savgol_order = max(1, int(savgol_order))
+        self.times = np.zeros(self.capacity, dtype=np.float64)
+        self.points = np.zeros((self.capacity, num_points, dims), dtype=np.float32)
+        self._head = 0  # 다음에 쓸 위치
+        self._count = 0
+        self._arange = np.arange(self.capacity)
+
+    @classmethod
+    def from_config(cls, cfg: Optional[Dict[str, Any]], num_points: int = NUM_LANDMARKS) -> "MotionHistory":
+        """rules.json의 "motion_history" 설정으로 버퍼를 만듭니다."""
+        cfg = cfg or {}
+        return cls(
+            capacity=cfg.get("length", 32),
+            num_points=num_points,
+            savgol_window=cfg.get("savgol_window", 7),
+            savgol_order=cfg.get("savgol_order", 2),
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        """기록을 모두 지웁니다 (포즈를 잃었을 때)."""
+        self._head = 0
+        self._count = 0
+
+    def push(self, points: np.ndarray, t: float) -> None:
+        """한 프레임의 관절 위치 (num_points, dims)를 기록합니다."""
+        np.copyto(self.points[self._head], points)
+        self.times[self._head] = t
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    # ------------------------------------------------------------------ #
+    # 조회
+    # ------------------------------------------------------------------ #
+    def _indices(self, n: int) -> np.ndarray:
+        """최근 n개 샘플의 버퍼 인덱스 (오래된 것부터)"""
+        return (self._head - n + self._arange[:n]) % self.capacity
+
+    def latest(self, k: int = 0) -> Optional[np.ndarray]:
+        """k번째 최근 프레임의 관절 위치 (0 = 가장 최근). 버퍼 뷰를 반환합니다."""
+        if k >= self._count:
+            return None
+        return self.points[(self._head - 1 - k) % self.capacity]
+
+    def latest_time(self, k: int = 0) -> Optional[float]:
+        if k >= self._count:
+            return None
+        return float(self.times[(self._head - 1 - k) % self.capacity])
+
+    def window(self, n: int, joints: Optional[Sequence[int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """최근 n개 샘플 (시각 (n,), 위치 (n, J, dims))을 오래된 것부터 반환합니다 (사본)."""
+        idx = self._indices(min(int(n), self._count))
+        pts = self.points[idx]
+        if joints is not None:
+            pts = pts[:, joints]
+        return self.times[idx], pts
+
+    def window_since(self, t0: float, joints: Optional[Sequence[int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """시각 t0 이후의 샘플 (시각, 위치)을 오래된 것부터 반환합니다."""
+        idx = self._indices(self._count)
+        n = int(np.count_nonzero(self.times[idx] >= t0))
+        return self.window(n, joints)
+
+    # ------------------------------------------------------------------ #
+    # 미분 (Savitzky-Golay)
+    # ------------------------------------------------------------------ #
+    def derivative(
+        self,
+        deriv: int = 1,
+        window: Optional[int] = None,
+        order: Optional[int] = None,
+        joints: Optional[Sequence[int]] = None,
+    ) -> Optional[np.ndarray]:
+        """가장 최근 시각에서의 위치 미분 (J, dims)을 계산합니다.
+
+        최근 window개 샘플에 order차 다항식을 최소제곱으로 맞추고(Savitzky-Golay), 그 미분값을 사용합니다.
+        프레임 간격이 일정하지 않아도 실제 시각으로 맞추며, 모든 관절/축을 한 번의 행렬 곱으로 계산합니다.
+
+        Args:
+            deriv: 1 = 속도 (픽셀/초), 2 = 가속도 (픽셀/초²)
+            window: 사용할 샘플 수 (기본 savgol_window)
+            order: 다항식 차수 (기본 savgol_order, 최소 deriv)
+            joints: 계산할 관절 인덱스 (기본 전체)
+
+        Returns:
+            미분 배열. 샘플이 부족하면 None
+        """
+        order = max(deriv, self.savgol_order if order is None else int(order))
+        n = min(self.savgol_window if window is None else int(window), self._count)
+        if n < order + 1:
+            # 샘플이 부족하면 차수를 낮춰서라도 계산합니다.
+            order = n - 1
+            if order < deriv:
+                return None
+        times, pts = self.window(n, joints)
+        # 시간축을 구간 길이로 정규화해 정규방정식(작은 (order+1)² 행렬)의 조건수를 낮춥니다.
+        tt = times - times[-1]
+        span = max(-float(tt[0]), 1e-6)
+        vander = (tt / span)[:, None] ** np.arange(order + 1)
+        try:
+            # (n,) 가장 최근 시각(tt = 0)에서의 deriv차 계수
+            coef = np.linalg.solve(vander.T @ vander, vander.T)[deriv] / span ** deriv
+        except np.linalg.LinAlgError:
+            # 같은 시각의 샘플이 겹쳐 다항식을 맞출 수 없음
+            return None
+        flat = pts.reshape(n, -1)
+        out = (coef @ flat) * math.factorial(deriv)
+        return out.reshape(pts.shape[1:]).astype(np.float32, copy=False)
+
+    def velocity(self, **kwargs: Any) -> Optional[np.ndarray]:
+        """가장 최근 시각의 관절 속도 (J, dims), 픽셀/초"""
+        return self.derivative(1, **kwargs)
+
+    def acceleration(self, **kwargs: Any) -> Optional[np.ndarray]:
+        """가장 최근 시각의 관절 가속도 (J, dims), 픽셀/초²"""
+        return self.derivative(2, **kwargs)
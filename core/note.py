@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import Callable, Dict, Optional, Tuple
 
-import arcade
 import numpy as np
 
+from core.judgment_records import NoteType
+
 
 class Note:
     """리듬 노트의 Arcade 버전."""
@@ -23,6 +24,7 @@ class Note:
     ) -> None:
         self.t = item["t"]
         self.typ = item["type"]
+        self.kind = NoteType.parse(self.typ)  # 타입 비교/조회용 정수 타입 (typ은 설정 조회용 이름)
         self.lane = item.get("lane", "C")
         self.pre_spawn = pre_spawn_time
 
@@ -59,18 +61,18 @@ class Note:
     def _initial_position(self, width: int, height: int) -> Tuple[int, int]:
         target_x = int(width * 0.5)
         target_y = int(height * 0.6)
-        if self.typ == "JAB_L":
+        if self.kind == NoteType.JAB_L:
             return -100, target_y
-        if self.typ == "JAB_R":
+        if self.kind == NoteType.JAB_R:
             return width + 100, target_y
-        if self.typ == "DUCK":
+        if self.kind == NoteType.DUCK:
             return target_x, -100
-        if self.typ == "BOMB":
+        if self.kind == NoteType.BOMB:
             return (-100 if self.lane == "L" else width + 100, target_y)
-        if self.typ == "WEAVE_L":
+        if self.kind == NoteType.WEAVE_L:
             # 위빙 L: 왼쪽 레인에서 시작하여 중앙으로 이동
             return -100, -100
-        if self.typ == "WEAVE_R":
+        if self.kind == NoteType.WEAVE_R:
             # 위빙 R: 오른쪽 레인에서 시작하여 중앙으로 이동
             return width + 100, -100
         return target_x, target_y
@@ -85,7 +87,7 @@ class Note:
         prog = self.get_progress(now, start_time)
         target_x, target_y = dynamic_hit_zone
 
-        if self.typ == "DUCK":
+        if self.kind == NoteType.DUCK:
             self.x = int((1 - prog) * self.x0 + prog * target_x)
             self.y = int((1 - prog) * self.y0 + prog * self.duck_line_y)
         else:
@@ -102,6 +104,8 @@ class Note:
     ) -> None:
         if self.hit and not self.missed:
             return
+        # 판정/재생(core.replay)만 하는 경우 Arcade 없이 쓸 수 있도록 그릴 때만 가져옵니다.
+        import arcade
 
         color_rgb = color_converter(self.color_bgr)
         outline_rgb = color_converter(self.outline_bgr)
@@ -110,7 +114,7 @@ class Note:
         # 스케일 적용 (평균 스케일 사용)
         scale = (scale_x + scale_y) / 2.0
 
-        if self.typ == "DUCK":
+        if self.kind == NoteType.DUCK:
             width = (self.duck_half_width * 2) * scale_x
             height = (self.duck_half_height * 2) * scale_y
             thickness = self.duck_outline_thickness * scale
@@ -125,7 +129,7 @@ class Note:
         if not self.label:
             return
 
-        font_size = (self.label_font_size_circle if self.typ != "DUCK" else self.label_font_size_duck) * scale
+        font_size = (self.label_font_size_circle if self.kind != NoteType.DUCK else self.label_font_size_duck) * scale
         arcade.draw_text(
             self.label,
             center_x,
@@ -139,6 +143,8 @@ class Note:
 
     @staticmethod
     def _draw_rect(center_x: float, center_y: float, width: float, height: float, color) -> None:
+        import arcade
+
         half_w = width / 2
         half_h = height / 2
         points = [
@@ -151,6 +157,8 @@ class Note:
 
     @staticmethod
     def _draw_rect_outline(center_x: float, center_y: float, width: float, height: float, color, thickness: int) -> None:
+        import arcade
+
         half_w = width / 2
         half_h = height / 2
         points = [
@@ -0,0 +1,134 @@
+"""
+노트 인덱스 모듈
+활성 노트를 타입(NoteType)별로 판정 시각(t) 순서의 리스트에 보관해, 판정 후보 찾기를 이분 탐색으로 처리합니다.
+NoteManager가 노트를 스폰할 때 추가하고, 판정된(히트/미스) 노트는 앞쪽부터 커서를 전진시켜 정리합니다.
+"""
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from core.judgment_records import NoteType
+from core.note import Note
+
+
+class NoteIndex:
+    """타입별로 t 순서로 정렬된 노트 인덱스"""
+
+    COMPACT_MIN = 32  # 판정된 앞부분이 이 개수를 넘고 리스트의 절반 이상이면 잘라냅니다.
+
+    def __init__(self) -> None:
+        self._times: Dict[NoteType, List[float]] = {}
+        self._notes: Dict[NoteType, List[Note]] = {}
+        self._head: Dict[NoteType, int] = {}  # 타입별 첫 미판정 노트 위치 (그 앞은 모두 판정됨)
+
+    @classmethod
+    def from_notes(cls, notes: Iterable[Note]) -> "NoteIndex":
+        """노트 목록으로 인덱스를 만듭니다."""
+        index = cls()
+        for note in notes:
+            index.add(note)
+        return index
+
+    def clear(self) -> None:
+        self._times.clear()
+        self._notes.clear()
+        self._head.clear()
+
+    def types(self) -> List[NoteType]:
+        """인덱스에 있는 노트 타입 목록"""
+        return list(self._notes)
+
+    def add(self, note: Note) -> None:
+        """노트를 추가합니다. 비트맵 순서대로 스폰되면 리스트 끝에 붙습니다."""
+        times = self._times.get(note.kind)
+        if times is None:
+            self._times[note.kind] = [note.t]
+            self._notes[note.kind] = [note]
+            self._head[note.kind] = 0
+            return
+        notes = self._notes[note.kind]
+        if not times or note.t >= times[-1]:
+            times.append(note.t)
+            notes.append(note)
+            return
+        pos = bisect_left(times, note.t, self._head[note.kind])
+        times.insert(pos, note.t)
+        notes.insert(pos, note)
+
+    # ------------------------------------------------------------------ #
+    # 조회
+    # ------------------------------------------------------------------ #
+    def nearest(self, typ: NoteType, t: float, max_window: float) -> Optional[Note]:
+        """시각 t에 가장 가까운 미판정 노트 (|note.t - t| <= max_window). 없으면 None."""
+        times = self._times.get(typ)
+        if not times:
+            return None
+        notes = self._notes[typ]
+        head = self._head[typ]
+        right = bisect_left(times, t, head)
+        left = right - 1
+        best: Optional[Note] = None
+        best_delta = max_window
+        # 양쪽으로 판정된 노트를 건너뛰며 창 안에서 가장 가까운 노트를 찾습니다.
+        while left >= head and t - times[left] <= best_delta:
+            if not notes[left].hit and not notes[left].missed:
+                best, best_delta = notes[left], t - times[left]
+                break
+            left -= 1
+        while right < len(times) and times[right] - t <= best_delta:
+            if not notes[right].hit and not notes[right].missed:
+                if best is None or times[right] - t < best_delta:
+                    best = notes[right]
+                break
+            right += 1
+        return best
+
+    def window(self, typ: NoteType, t0: float, t1: float) -> Iterator[Note]:
+        """t0 <= note.t <= t1인 미판정 노트 (t 순서)"""
+        times = self._times.get(typ)
+        if not times:
+            return
+        notes = self._notes[typ]
+        for i in range(bisect_left(times, t0, self._head[typ]), len(times)):
+            if times[i] > t1:
+                break
+            if not notes[i].hit and not notes[i].missed:
+                yield notes[i]
+
+    def until(self, typ: NoteType, t_max: float) -> Iterator[Note]:
+        """note.t <= t_max인 미판정 노트 (t 순서, 커서부터)"""
+        times = self._times.get(typ)
+        if not times:
+            return
+        notes = self._notes[typ]
+        for i in range(self._head[typ], len(times)):
+            if times[i] > t_max:
+                break
+            if not notes[i].hit and not notes[i].missed:
+                yield notes[i]
+
+    def expired(self, typ: NoteType, t_limit: float) -> Iterator[Note]:
+        """note.t < t_limit인 미판정 노트 (t 순서). 커서부터 시작하므로 이미 지나간 구간은 다시 보지 않습니다."""
+        times = self._times.get(typ)
+        if not times:
+            return
+        notes = self._notes[typ]
+        for i in range(self._head[typ], len(times)):
+            if times[i] >= t_limit:
+                break
+            if not notes[i].hit and not notes[i].missed:
+                yield notes[i]
+
+    # ------------------------------------------------------------------ #
+    # 정리
+    # ------------------------------------------------------------------ #
+    def compact(self) -> None:
+        """판정된 노트를 앞에서부터 건너뛰도록 커서를 전진시키고, 충분히 쌓이면 잘라냅니다."""
+        for typ, notes in self._notes.items():
+            head = self._head[typ]
+            while head < len(notes) and (notes[head].hit or notes[head].missed):
+                head += 1
+            if head >= self.COMPACT_MIN and head * 2 >= len(notes):
+                del notes[:head]
+                del self._times[typ][:head]
+                head = 0
+            self._head[typ] = head
@@ -5,6 +5,7 @@
 from typing import Dict, List, Optional, Tuple
 
 from core.note import Note
+from core.note_index import NoteIndex
 
 
 class NoteManager:
@@ -29,6 +30,8 @@ class NoteManager:
         self.config_note_styles = config_note_styles or {}
         
         self.active_notes: List[Note] = []
+        # 판정용 타입별 시각 인덱스 (스폰 시 추가, 정리 시 커서 전진)
+        self.index = NoteIndex()
     
     def spawn_note(
         self,
@@ -61,6 +64,7 @@ class NoteManager:
             self.config_note_styles,
         )
         self.active_notes.append(note)
+        self.index.add(note)
         return note
     
     def update_notes(self, now: float, song_start_time: Optional[float], hit_zone_camera: Tuple[int, int]) -> None:
@@ -76,6 +80,15 @@ class NoteManager:
             note for note in self.active_notes 
             if not note.hit and not note.missed
         ]
+        self.index.compact()
+    
+    def retire(self, notes: List[Note]) -> None:
+        """판정된 노트만 제거합니다. 노트마다 list.remove를 하지 않고 id 집합으로 한 번에 걸러 냅니다."""
+        if not notes:
+            return
+        retired = {id(note) for note in notes}
+        self.active_notes = [note for note in self.active_notes if id(note) not in retired]
+        self.index.compact()
     
     def get_active_notes(self) -> List[Note]:
         """활성 노트 리스트를 반환합니다."""
@@ -0,0 +1,287 @@
+"""
+포즈 추론 백엔드 모듈
+PoseTracker가 메인 프로세스에서 포즈를 추론할 때 쓰는 백엔드 인터페이스와 구현을 제공합니다.
+
+- LegacyPoseBackend: mp.solutions.pose.Pose.process (동기). submit이 추론이 끝날 때까지 블록합니다.
+- TasksPoseBackend: MediaPipe Tasks PoseLandmarker (LIVE_STREAM). submit은 프레임을 넘기고 바로 반환하며,
+  결과는 MediaPipe 스레드의 콜백이 최신 결과 슬롯에 넣습니다. 추론 중에 들어온 프레임은 런타임이 버립니다.
+
+두 백엔드 모두 결과를 워커 프로세스와 같은 PoseResult(정규화 (33, 4) 랜드마크)로 돌려주므로
+PoseTracker는 submit/poll만으로 세 가지 추론 경로를 같은 방식으로 다룹니다.
+
+Tasks 백엔드의 .task 모델 파일은 저장소에 포함되어 있지 않습니다. 처음 한 번 내려받으세요:
+    python -m core.pose_backend --download
+"""
+import argparse
+import os
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.logger import get_logger
+from core.pose_landmarks import NUM_LANDMARKS, landmarks_to_array
+from core.pose_worker import PoseResult
+
+
+logger = get_logger()
+
+# 제출 기록 필드 (Tasks 백엔드의 _pending 배열 열)
+_PENDING_TS_MS = 0  # detect_async에 넘긴 타임스탬프 (ms)
+_PENDING_FRAME_SEQ = 1
+_PENDING_TIMESTAMP = 2  # 프레임 캡처 시각
+_PENDING_SUBMITTED = 3  # 제출 시각 (perf_counter)
+
+# PoseLandmarker 모델 파일 이름 → 내려받을 주소 (MediaPipe 공식 모델 저장소)
+_MODEL_BASE_URL = "https://storage.googleapis.com/mediapipe-models/pose_landmarker"
+TASKS_MODEL_URLS = {
+    f"pose_landmarker_{variant}.task": f"{_MODEL_BASE_URL}/pose_landmarker_{variant}/float16/latest/pose_landmarker_{variant}.task"
+    for variant in ("lite", "full", "heavy")
+}
+DOWNLOAD_HINT = "python -m core.pose_backend --download"
+
+
+class PoseBackend(ABC):
+    """메인 프로세스 포즈 추론 백엔드 인터페이스"""
+
+    #: 결과가 submit과 별개로 도착하는지 여부 (True면 프레임이 없어도 poll해야 함)
+    is_async = False
+
+    @abstractmethod
+    def submit(self, rgb: np.ndarray, timestamp: float) -> int:
+        """RGB 프레임 (H, W, 3) uint8을 캡처 시각과 함께 추론에 넘기고 프레임 순번을 반환합니다."""
+
+    @abstractmethod
+    def poll(self) -> Optional[PoseResult]:
+        """아직 가져가지 않은 새 결과가 있으면 반환합니다 (대기 없음)."""
+
+    @abstractmethod
+    def reconfigure(self, pose_options: Dict[str, Any]) -> None:
+        """모델 복잡도 등 포즈 옵션을 바꿉니다."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """추론 자원을 해제합니다."""
+
+
+class LegacyPoseBackend(PoseBackend):
+    """mp.solutions.pose 동기 백엔드 (기존 인라인 경로)"""
+
+    def __init__(self, pose_options: Dict[str, Any]) -> None:
+        import mediapipe as mp
+
+        self._mp_pose = mp.solutions.pose
+        self.pose = self._mp_pose.Pose(**pose_options)
+        self._landmarks = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+        self._frame_seq = 0
+        self._result: Optional[PoseResult] = None
+
+    def submit(self, rgb: np.ndarray, timestamp: float) -> int:
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        res = self.pose.process(rgb)
+        inference_ms = (time.perf_counter() - start) * 1000.0
+        cpu_ms = (time.process_time() - cpu_start) * 1000.0
+        self._frame_seq += 1
+        landmarks = None
+        if res.pose_landmarks is not None:
+            landmarks = landmarks_to_array(res.pose_landmarks, self._landmarks)
+        self._result = PoseResult(self._frame_seq, timestamp, landmarks, None, inference_ms, cpu_ms)
+        return self._frame_seq
+
+    def poll(self) -> Optional[PoseResult]:
+        result, self._result = self._result, None
+        return result
+
+    def reconfigure(self, pose_options: Dict[str, Any]) -> None:
+        self.pose.close()
+        self.pose = self._mp_pose.Pose(**pose_options)
+
+    def close(self) -> None:
+        self.pose.close()
+
+
+class TasksPoseBackend(PoseBackend):
+    """MediaPipe Tasks PoseLandmarker LIVE_STREAM 백엔드
+
+    콜백은 MediaPipe 스레드에서 호출됩니다. 결과마다 새 PoseResult를 만들어 `_latest` 참조 하나만 바꾸고,
+    메인 스레드는 그 참조를 읽어 마지막으로 가져간 frame_seq보다 새 결과인지만 확인합니다.
+    참조 대입/읽기는 원자적이므로 락이 필요 없고, 읽는 쪽이 슬롯을 비우지 않으므로 덮어쓰기 경합도 없습니다.
+    """
+
+    is_async = True
+    PENDING_SIZE = 8  # 결과를 기다리는 제출 기록 수 (LIVE_STREAM은 1~2프레임만 파이프라인에 둡니다)
+
+    def __init__(self, model_paths: Sequence[str], pose_options: Dict[str, Any]) -> None:
+        """
+        Args:
+            model_paths: model_complexity 0/1/2에 대응하는 .task 모델 경로 (lite, full, heavy)
+            pose_options: PoseTracker의 포즈 옵션 (model_complexity, min_*_confidence)
+
+        Raises:
+            ImportError: Tasks API가 없는 MediaPipe 버전
+            FileNotFoundError: 모델 파일이 없음
+        """
+        import mediapipe as mp
+        from mediapipe.tasks import python as mp_tasks
+        from mediapipe.tasks.python import vision
+
+        self._mp = mp
+        self._mp_tasks = mp_tasks
+        self._vision = vision
+        self.model_paths = list(model_paths)
+        self._pending = np.full((self.PENDING_SIZE, 4), -1.0, dtype=np.float64)
+        self._frame_seq = 0
+        self._last_ts_ms = -1
+        self._latest: Optional[PoseResult] = None
+        self._taken_seq = 0
+        self._last_callback = None  # 마지막 콜백 시각 (perf_counter)
+        self.landmarker = self._create(pose_options)
+
+    def _model_path(self, complexity: int) -> str:
+        if not self.model_paths:
+            raise FileNotFoundError("rules.json pose_inference.tasks.model_paths가 비어 있습니다")
+        path = self.model_paths[max(0, min(int(complexity), len(self.model_paths) - 1))]
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"PoseLandmarker 모델 파일이 없습니다: {os.path.abspath(path)} ({DOWNLOAD_HINT} 로 내려받을 수 있습니다)"
+            )
+        return path
+
+    def _create(self, pose_options: Dict[str, Any]) -> Any:
+        vision = self._vision
+        options = vision.PoseLandmarkerOptions(
+            base_options=self._mp_tasks.BaseOptions(
+                model_asset_path=self._model_path(pose_options.get("model_complexity", 1))
+            ),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_poses=1,
+            min_pose_detection_confidence=pose_options.get("min_detection_confidence", 0.5),
+            min_pose_presence_confidence=pose_options.get("min_detection_confidence", 0.5),
+            min_tracking_confidence=pose_options.get("min_tracking_confidence", 0.5),
+            output_segmentation_masks=False,
+            result_callback=self._on_result,
+        )
+        return vision.PoseLandmarker.create_from_options(options)
+
+    def submit(self, rgb: np.ndarray, timestamp: float) -> int:
+        # detect_async는 엄격히 증가하는 정수 ms 타임스탬프만 받습니다.
+        ts_ms = max(int(timestamp * 1000.0), self._last_ts_ms + 1)
+        self._last_ts_ms = ts_ms
+        self._frame_seq += 1
+        row = self._pending[self._frame_seq % self.PENDING_SIZE]
+        row[_PENDING_TS_MS] = ts_ms
+        row[_PENDING_FRAME_SEQ] = self._frame_seq
+        row[_PENDING_TIMESTAMP] = timestamp
+        row[_PENDING_SUBMITTED] = time.perf_counter()
+        # mp.Image는 픽셀을 복사하므로 FramePath가 rgb 버퍼를 다음 프레임에 재사용해도 됩니다.
+        image = self._mp.Image(image_format=self._mp.ImageFormat.SRGB, data=rgb)
+        self.landmarker.detect_async(image, ts_ms)
+        return self._frame_seq
+
+    def _on_result(self, result: Any, output_image: Any, timestamp_ms: int) -> None:
+        """MediaPipe 스레드에서 호출되는 결과 콜백"""
+        now = time.perf_counter()
+        rows = np.flatnonzero(self._pending[:, _PENDING_TS_MS] == timestamp_ms)
+        if rows.size == 0:
+            return  # 제출 기록이 이미 덮어써진 오래된 결과
+        row = self._pending[rows[0]]
+        frame_seq = int(row[_PENDING_FRAME_SEQ])
+        latency_ms = (now - row[_PENDING_SUBMITTED]) * 1000.0
+        # 추론은 MediaPipe 내부 스레드에서 실행되어 호출 단위 CPU 시간을 잴 수 없습니다.
+        # 파이프라인이 겹치는 구간을 빼기 위해 지연과 직전 결과 이후 경과 시간 중 작은 값을 추론 시간으로 봅니다.
+        busy_ms = latency_ms
+        if self._last_callback is not None:
+            busy_ms = min(busy_ms, (now - self._last_callback) * 1000.0)
+        self._last_callback = now
+
+        landmarks = None
+        if result.pose_landmarks:
+            landmarks = np.empty((NUM_LANDMARKS, 4), dtype=np.float32)
+            for i, lm in enumerate(result.pose_landmarks[0]):
+                landmarks[i, 0] = lm.x
+                landmarks[i, 1] = lm.y
+                landmarks[i, 2] = lm.z
+                landmarks[i, 3] = lm.visibility if lm.visibility is not None else 0.0
+        self._latest = PoseResult(frame_seq, float(row[_PENDING_TIMESTAMP]), landmarks, None, latency_ms, busy_ms)
+
+    def poll(self) -> Optional[PoseResult]:
+        result = self._latest
+        if result is None or result.frame_seq <= self._taken_seq:
+            return None
+        self._taken_seq = result.frame_seq
+        return result
+
+    def reconfigure(self, pose_options: Dict[str, Any]) -> None:
+        self.landmarker.close()
+        self._last_callback = None
+        self.landmarker = self._create(pose_options)
+
+    def close(self) -> None:
+        self.landmarker.close()
+
+
+def create_pose_backend(
+    mode: str,
+    pose_options: Dict[str, Any],
+    tasks_cfg: Optional[Dict[str, Any]] = None,
+) -> PoseBackend:
+    """추론 모드에 맞는 메인 프로세스 백엔드를 만듭니다.
+
+    "tasks" 모드에서 Tasks API나 모델 파일을 쓸 수 없으면 기존 동기 백엔드로 대체합니다.
+    """
+    if mode == "tasks":
+        tasks_cfg = tasks_cfg or {}
+        try:
+            return TasksPoseBackend(tasks_cfg.get("model_paths", []), pose_options)
+        except (ImportError, AttributeError, FileNotFoundError, IndexError, RuntimeError) as e:
+            logger.warning(f"PoseLandmarker(LIVE_STREAM) 백엔드를 사용할 수 없습니다: {e}. 기존 동기 백엔드를 사용합니다.")
+    return LegacyPoseBackend(pose_options)
+
+
+def download_tasks_models(model_paths: Sequence[str], overwrite: bool = False) -> List[str]:
+    """Tasks 백엔드의 모델 파일을 TASKS_MODEL_URLS에서 내려받습니다.
+
+    이미 있는 파일은 overwrite가 아니면 건너뜁니다. 받는 도중 끊겨도 반쯤 받은 파일이 남지 않도록 임시 파일에 받은 뒤 옮깁니다.
+
+    Returns:
+        내려받은 경로 목록
+
+    Raises:
+        KeyError: 주소를 모르는 파일 이름
+    """
+    downloaded = []
+    for path in model_paths:
+        if os.path.exists(path) and not overwrite:
+            continue
+        url = TASKS_MODEL_URLS[os.path.basename(path)]
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        partial = path + ".part"
+        logger.info(f"PoseLandmarker 모델 내려받는 중: {url} -> {path}")
+        urllib.request.urlretrieve(url, partial)
+        os.replace(partial, path)
+        downloaded.append(path)
+    return downloaded
+
+
+def main() -> None:
+    from core.config_manager import ConfigManager
+
+    parser = argparse.ArgumentParser(description="MediaPipe Tasks 포즈 백엔드 도구")
+    parser.add_argument("--download", action="store_true", help="rules.json의 tasks.model_paths 모델 파일을 내려받기")
+    parser.add_argument("--overwrite", action="store_true", help="이미 있는 파일도 다시 받기")
+    parser.add_argument("--config", default="config")
+    args = parser.parse_args()
+
+    model_paths = ConfigManager(args.config).rules.get("pose_inference", {}).get("tasks", {}).get("model_paths", [])
+    if args.download:
+        downloaded = download_tasks_models(model_paths, args.overwrite)
+        print(f"내려받은 모델 {len(downloaded)}개")
+    for path in model_paths:
+        print(f"{'있음' if os.path.exists(path) else '없음'}  {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+포즈 운동학 모듈
+픽셀 좌표 랜드마크 배열에서 양손의 반경 속도, 팔꿈치 각도, 주먹 중심점, 히트존 포함 여부를
+한 번의 NumPy 연산으로 계산하는 커널과, 그 위에서 잽을 판정하는 정책(일반/테스트 모드)을 제공합니다.
+
+손 순서는 판정 기준입니다: 0 = JAB_L (화면 왼쪽에 보이는 손 = 사용자의 오른손),
+1 = JAB_R (화면 오른쪽에 보이는 손 = 사용자의 왼손).
+"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+import numpy as np
+
+from core.judgment_records import HitEvent, NoteType
+from core.pose_landmarks import (
+    LEFT_ELBOW, LEFT_INDEX, LEFT_PINKY, LEFT_SHOULDER, LEFT_THUMB, LEFT_WRIST,
+    RIGHT_ELBOW, RIGHT_INDEX, RIGHT_PINKY, RIGHT_SHOULDER, RIGHT_THUMB, RIGHT_WRIST,
+)
+
+
+JAB_TYPES = (NoteType.JAB_L, NoteType.JAB_R)
+
+SHOULDER_INDEX = np.array([RIGHT_SHOULDER, LEFT_SHOULDER], dtype=np.intp)
+ELBOW_INDEX = np.array([RIGHT_ELBOW, LEFT_ELBOW], dtype=np.intp)
+WRIST_INDEX = np.array([RIGHT_WRIST, LEFT_WRIST], dtype=np.intp)
+# spatial_judge_mode 2: 손목 + 새끼/검지/엄지 4점의 평균을 주먹 중심으로 사용
+HAND_INDEX = np.array(
+    [
+        [RIGHT_WRIST, RIGHT_PINKY, RIGHT_INDEX, RIGHT_THUMB],
+        [LEFT_WRIST, LEFT_PINKY, LEFT_INDEX, LEFT_THUMB],
+    ],
+    dtype=np.intp,
+)
+
+
+class PoseKinematics:
+    """양손의 운동학 값을 프레임마다 계산하는 커널 (모든 버퍼는 미리 할당되어 재사용됨)"""
+
+    def __init__(
+        self,
+        width: int,
+        hit_zone: tuple,
+        hit_zone_radius: float,
+        spatial_judge_mode: int = 2,
+    ) -> None:
+        """
+        Args:
+            width: 카메라 좌표계 너비 (화면 좌/우 구분 기준 x = width // 2)
+            hit_zone: 히트존 중심 (x, y) 카메라 좌표
+            hit_zone_radius: 히트존 반지름 (픽셀)
+            spatial_judge_mode: 1 = 손목만, 2 = 손 랜드마크 4점 평균
+        """
+        self.center_x = float(width // 2)
+        self.hit_zone = np.array(hit_zone, dtype=np.float32)
+        self.hit_zone_radius = float(hit_zone_radius)
+        self.spatial_judge_mode = int(spatial_judge_mode)
+
+        # 결과 (손 순서: 0 = JAB_L, 1 = JAB_R)
+        self.speed = np.zeros(2, dtype=np.float32)  # 어깨 기준 반경 속도 (어깨 너비/초)
+        self.angle = np.zeros(2, dtype=np.float32)  # 팔꿈치 각도 (도)
+        self.fist = np.zeros((2, 2), dtype=np.float32)  # 주먹 중심점 (x, y)
+        self.dist = np.zeros(2, dtype=np.float32)  # 주먹 중심과 히트존 중심 사이 거리 (픽셀)
+        self.in_zone = np.zeros(2, dtype=bool)  # 주먹 중심이 히트존 안에 있는지
+        self.on_side = np.zeros(2, dtype=bool)  # 손목이 해당 잽 쪽 화면 절반에 있는지
+        self.valid = False  # 이전 프레임이 있어 속도를 계산했는지
+        # 직전 프레임 값 (프레임 사이 경계 통과 시각 보간용)
+        self.prev_speed = np.zeros(2, dtype=np.float32)
+        self.prev_dist = np.zeros(2, dtype=np.float32)
+        self.t: float = 0.0
+        self.prev_t: float = 0.0
+
+        # 작업 버퍼
+        self._shoulder = np.zeros((2, 2), dtype=np.float32)
+        self._elbow = np.zeros((2, 2), dtype=np.float32)
+        self._wrist = np.zeros((2, 2), dtype=np.float32)
+        self._prev_wrist = np.zeros((2, 2), dtype=np.float32)
+        self._hand = np.zeros((2, 4, 2), dtype=np.float32)
+        self._v1 = np.zeros((2, 2), dtype=np.float32)
+        self._v2 = np.zeros((2, 2), dtype=np.float32)
+        self._r_now = np.zeros(2, dtype=np.float32)
+        self._r_prev = np.zeros(2, dtype=np.float32)
+        self._has_prev = False
+
+    def reset(self) -> None:
+        """이전 프레임 기록을 지웁니다 (포즈를 잃었을 때)."""
+        self._has_prev = False
+        self.valid = False
+
+    def update(self, landmarks: np.ndarray, t: float, shoulder_width: float) -> bool:
+        """랜드마크 배열로 양손의 운동학 값을 갱신합니다.
+
+        Args:
+            landmarks: 픽셀 좌표 (33, 4) 배열
+            t: 프레임 시각 (초)
+            shoulder_width: 캘리브레이션된 어깨 너비 (픽셀)
+
+        Returns:
+            속도까지 유효한지 여부 (첫 프레임이면 False)
+        """
+        if self._has_prev:
+            np.copyto(self.prev_speed, self.speed)
+            np.copyto(self.prev_dist, self.dist)
+            self.prev_t = self.t
+        self.t = t
+
+        pts = landmarks[:, :2]
+        np.take(pts, SHOULDER_INDEX, axis=0, out=self._shoulder)
+        np.take(pts, ELBOW_INDEX, axis=0, out=self._elbow)
+        np.take(pts, WRIST_INDEX, axis=0, out=self._wrist)
+
+        # 주먹 중심점
+        if self.spatial_judge_mode == 1:
+            np.copyto(self.fist, self._wrist)
+        else:
+            np.take(pts, HAND_INDEX, axis=0, out=self._hand)
+            np.mean(self._hand, axis=1, out=self.fist)
+
+        # 히트존 포함 여부 / 화면 좌우
+        np.subtract(self.fist, self.hit_zone, out=self._v1)
+        np.hypot(self._v1[:, 0], self._v1[:, 1], out=self.dist)
+        np.less_equal(self.dist, self.hit_zone_radius, out=self.in_zone)
+        self.on_side[0] = self._wrist[0, 0] < self.center_x
+        self.on_side[1] = self._wrist[1, 0] > self.center_x
+
+        # 팔꿈치 각도: (어깨 - 팔꿈치)와 (손목 - 팔꿈치) 사이 각
+        np.subtract(self._shoulder, self._elbow, out=self._v1)
+        np.subtract(self._wrist, self._elbow, out=self._v2)
+        dot = self._v1[:, 0] * self._v2[:, 0] + self._v1[:, 1] * self._v2[:, 1]
+        denom = np.hypot(self._v1[:, 0], self._v1[:, 1]) * np.hypot(self._v2[:, 0], self._v2[:, 1]) + 1e-6
+        np.degrees(np.arccos(np.clip(dot / denom, -1.0, 1.0)), out=self.angle)
+
+        # 어깨 기준 반경 속도 (현재 어깨 위치 기준으로 이전 손목과 비교)
+        sw = max(float(shoulder_width), 1e-6)
+        np.subtract(self._wrist, self._shoulder, out=self._v1)
+        np.hypot(self._v1[:, 0], self._v1[:, 1], out=self._r_now)
+        if self._has_prev:
+            np.subtract(self._prev_wrist, self._shoulder, out=self._v2)
+            np.hypot(self._v2[:, 0], self._v2[:, 1], out=self._r_prev)
+            dt = max(1e-6, t - self.prev_t)
+            np.subtract(self._r_now, self._r_prev, out=self.speed)
+            self.speed /= sw * dt
+            self.valid = True
+        else:
+            self.speed[:] = 0.0
+            self.valid = False
+
+        np.copyto(self._prev_wrist, self._wrist)
+        self._has_prev = True
+        return self.valid
+
+    def crossing_time(self, prev_value: float, value: float, threshold: float, rising: bool = True) -> float:
+        """직전 프레임과 현재 프레임 사이에서 값이 threshold를 지난 시각을 선형 보간합니다.
+
+        rising=True면 아래에서 위로(>=), False면 위에서 아래로(<=) 지나는 시각입니다.
+        직전 프레임에서 이미 조건을 만족했으면 직전 프레임 시각을 반환합니다.
+        """
+        already = prev_value >= threshold if rising else prev_value <= threshold
+        if already or value == prev_value:
+            return self.prev_t
+        frac = (threshold - prev_value) / (value - prev_value)
+        return self.prev_t + min(max(frac, 0.0), 1.0) * (self.t - self.prev_t)
+
+
+class JabPolicy(ABC):
+    """운동학 커널 결과로 잽을 판정하는 정책의 기본 클래스"""
+
+    def __init__(self, refractory: float, last_hit_t: Optional[List[float]] = None) -> None:
+        """
+        Args:
+            refractory: 같은 손의 연속 잽 사이 최소 간격 (초)
+            last_hit_t: 손별 마지막 잽 시각. 여러 정책이 같은 리스트를 넘기면 모드를 바꿔도 쿨타임이 이어집니다.
+        """
+        self.refractory = float(refractory)
+        self.last_hit_t = last_hit_t if last_hit_t is not None else [0.0, 0.0]
+
+    @abstractmethod
+    def detect(self, kin: PoseKinematics, now: float) -> List[HitEvent]:
+        """이번 프레임에서 감지한 잽 이벤트 목록을 반환합니다."""
+
+    def reset(self) -> None:
+        """이전 프레임에 기대는 상태를 초기화합니다 (포즈를 잃었을 때). 쿨타임은 유지합니다."""
+
+    def _cooled_down(self, hand: int, now: float) -> bool:
+        return now - self.last_hit_t[hand] > self.refractory
+
+    def _emit(self, events: List[HitEvent], hand: int, kin: PoseKinematics, t_cross: float) -> None:
+        """잽 이벤트를 추가합니다. t_hit는 프레임 시각이 아니라 프레임 사이에서 보간한 조건 충족 시각입니다."""
+        # 직전 프레임에서 이미 조건을 만족했다면 쿨타임이 끝난 시각이 실제 시작 시각입니다.
+        t_hit = max(t_cross, self.last_hit_t[hand] + self.refractory)
+        t_hit = min(max(t_hit, kin.prev_t), kin.t)
+        events.append(HitEvent(JAB_TYPES[hand], t_hit))
+        self.last_hit_t[hand] = t_hit
+
+    @staticmethod
+    def _zone_entry_time(kin: PoseKinematics, hand: int) -> float:
+        """주먹 중심이 히트존 경계(반지름)를 안쪽으로 지난 시각"""
+        return kin.crossing_time(float(kin.prev_dist[hand]), float(kin.dist[hand]), kin.hit_zone_radius, rising=False)
+
+
+class VelocityJabPolicy(JabPolicy):
+    """일반 모드: 반경 속도가 임계값 이상이고 주먹이 히트존 안에 있으면 잽"""
+
+    def __init__(self, refractory: float, v_thresh: float, last_hit_t: Optional[List[float]] = None) -> None:
+        super().__init__(refractory, last_hit_t)
+        self.v_thresh = float(v_thresh)
+
+    def detect(self, kin: PoseKinematics, now: float) -> List[HitEvent]:
+        events: List[HitEvent] = []
+        if not kin.valid:
+            return events
+        for hand in (0, 1):
+            if kin.speed[hand] >= self.v_thresh and kin.in_zone[hand] and self._cooled_down(hand, now):
+                # 두 조건(속도 임계값 통과, 히트존 진입) 중 늦게 충족된 시각
+                t_speed = kin.crossing_time(float(kin.prev_speed[hand]), float(kin.speed[hand]), self.v_thresh)
+                self._emit(events, hand, kin, max(t_speed, self._zone_entry_time(kin, hand)))
+        return events
+
+
+class ReentryJabPolicy(JabPolicy):
+    """테스트 모드: 주먹이 히트존 밖으로 나갔다가 (해당 쪽 화면에서) 다시 들어오면 잽"""
+
+    def __init__(self, refractory: float, last_hit_t: Optional[List[float]] = None) -> None:
+        super().__init__(refractory, last_hit_t)
+        self.was_outside = [False, False]
+
+    def reset(self) -> None:
+        self.was_outside = [False, False]
+
+    def detect(self, kin: PoseKinematics, now: float) -> List[HitEvent]:
+        events: List[HitEvent] = []
+        if not kin.valid:
+            return events
+        for hand in (0, 1):
+            inside = bool(kin.in_zone[hand])
+            if not self.was_outside[hand] and not inside:
+                self.was_outside[hand] = True
+            elif self.was_outside[hand] and inside and kin.on_side[hand] and self._cooled_down(hand, now):
+                self._emit(events, hand, kin, self._zone_entry_time(kin, hand))
+                self.was_outside[hand] = False
+        return events
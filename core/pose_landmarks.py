@@ -0,0 +1,75 @@
+"""
+포즈 랜드마크 배열 모듈
+MediaPipe 포즈 결과를 (33, 4) float32 배열(x, y, z, visibility)로 다루기 위한 도우미를 제공합니다.
+PoseTracker는 프레임마다 이 배열을 한 번만 채우고, 모든 소비자(씬, 판정, 렌더러)가 같은 배열을 읽습니다.
+"""
+from typing import Optional
+
+import numpy as np
+
+
+NUM_LANDMARKS = 33
+
+# MediaPipe PoseLandmark 인덱스 (enum 조회 없이 배열을 바로 인덱싱하기 위한 상수)
+NOSE = 0
+LEFT_EYE_INNER = 1
+RIGHT_EYE_INNER = 4
+LEFT_EAR = 7
+RIGHT_EAR = 8
+MOUTH_LEFT = 9
+MOUTH_RIGHT = 10
+LEFT_SHOULDER = 11
+RIGHT_SHOULDER = 12
+LEFT_ELBOW = 13
+RIGHT_ELBOW = 14
+LEFT_WRIST = 15
+RIGHT_WRIST = 16
+LEFT_PINKY = 17
+RIGHT_PINKY = 18
+LEFT_INDEX = 19
+RIGHT_INDEX = 20
+LEFT_THUMB = 21
+RIGHT_THUMB = 22
+
+# 좌우 반전 시 서로 바뀌는 랜드마크 인덱스 (MediaPipe Pose 기준)
+# 0 = 코, 1~6 = 눈, 7~8 = 귀, 9~10 = 입, 11~32 = 몸통/팔/다리 (홀수 = 왼쪽, 짝수 = 오른쪽)
+MIRROR_INDEX = np.array(
+    [0, 4, 5, 6, 1, 2, 3, 8, 7, 10, 9]
+    + [i + 1 if i % 2 == 1 else i - 1 for i in range(11, NUM_LANDMARKS)],
+    dtype=np.intp,
+)
+
+
+def landmarks_to_array(pose_landmarks, out: np.ndarray) -> np.ndarray:
+    """MediaPipe NormalizedLandmarkList를 미리 할당된 (33, 4) 배열에 채웁니다."""
+    for i, lm in enumerate(pose_landmarks.landmark):
+        out[i, 0] = lm.x
+        out[i, 1] = lm.y
+        out[i, 2] = lm.z
+        out[i, 3] = lm.visibility
+    return out
+
+
+def to_pixel_landmarks(
+    src: np.ndarray,
+    width: float,
+    height: float,
+    out: Optional[np.ndarray] = None,
+    mirror: bool = False,
+) -> np.ndarray:
+    """정규화 랜드마크를 픽셀 좌표 (33, 4) 배열로 변환합니다.
+
+    x, z에는 width를, y에는 height를 곱합니다 (MediaPipe z는 x와 같은 스케일). visibility는 그대로 둡니다.
+    mirror=True면 프레임 픽셀을 뒤집어 추론한 결과와 같도록 x를 1 - x로 바꾸고 좌우 랜드마크 인덱스를 교환합니다.
+    """
+    if out is None:
+        out = np.empty_like(src)
+    if mirror:
+        np.take(src, MIRROR_INDEX, axis=0, out=out)
+        np.subtract(1.0, out[:, 0], out=out[:, 0])
+    else:
+        np.copyto(out, src)
+    out[:, 0] *= width
+    out[:, 1] *= height
+    out[:, 2] *= width
+    return out
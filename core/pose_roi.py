@@ -0,0 +1,135 @@
+"""
+관심 영역(ROI) 모듈
+직전 포즈 결과의 랜드마크를 감싸는 상자를 넓혀 다음 프레임의 추론 입력을 그 영역으로 자릅니다.
+플레이어가 광각 화면의 일부만 차지할 때 추론 입력 픽셀을 플레이어 주변으로 모으고, 변환/축소할 픽셀 수를 줄입니다.
+
+자른 영역은 추론 해상도와 같은 종횡비로 맞추고 고정 크기(output_size)로 축소하므로 버퍼 크기가 프레임마다 바뀌지 않습니다.
+결과는 비동기로 도착할 수 있으므로 제출한 프레임 순번마다 상자를 기록해 두고, 결과의 frame_seq로 찾아 원본 좌표로 되돌립니다.
+추적을 잃거나 신뢰도가 떨어지면 다음 프레임은 전체 화면으로 추론합니다.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from core.pose_landmarks import LEFT_WRIST, LEFT_SHOULDER, NOSE
+
+
+Box = Tuple[int, int, int, int]  # (x0, y0, x1, y1) 원본 프레임 픽셀 좌표 (반전 전)
+
+# 추적 신뢰도를 볼 상체 관절 (코, 어깨, 팔꿈치, 손목). 다리는 화면 밖에 있는 경우가 많아 제외합니다.
+CONFIDENCE_INDEX = np.array([NOSE] + list(range(LEFT_SHOULDER, LEFT_WRIST + 2)), dtype=np.intp)
+
+
+class PoseROI:
+    """이전 랜드마크 기반 추론 영역 선택기"""
+
+    HISTORY_SIZE = 8  # 결과를 기다리는 제출 프레임의 상자 기록 수
+
+    def __init__(
+        self,
+        cfg: Optional[Dict[str, Any]],
+        frame_size: Tuple[int, int],
+        inference_size: Tuple[int, int],
+        mirrored: bool = False,
+    ) -> None:
+        """
+        Args:
+            cfg: rules.json의 pose_inference.roi 설정
+            frame_size: 원본 프레임 (width, height)
+            inference_size: 전체 화면 추론 해상도 (width, height)
+            mirrored: 프레임 픽셀을 좌우 반전해 추론하는지 여부 (결과 x가 반전된 좌표계)
+        """
+        cfg = cfg or {}
+        self.enabled = bool(cfg.get("enabled", False))
+        self.padding = float(cfg.get("padding", 0.25))  # 랜드마크 상자 긴 변 대비 사방 여백 비율
+        self.min_visibility = float(cfg.get("min_visibility", 0.5))  # 상자에 포함할 랜드마크의 최소 visibility
+        self.min_confidence = float(cfg.get("min_confidence", 0.6))  # 상체 관절 평균 visibility가 이보다 낮으면 전체 화면으로
+        self.min_size = float(cfg.get("min_size", 0.3))  # 상자 최소 높이 (프레임 높이 대비)
+        self.max_area = float(cfg.get("max_area", 0.8))  # 상자가 프레임의 이 비율보다 크면 자르지 않음
+        output_scale = min(1.0, float(cfg.get("output_scale", 0.5)))  # 전체 화면 추론 해상도 대비 ROI 입력 크기
+
+        self.frame_w, self.frame_h = int(frame_size[0]), int(frame_size[1])
+        self.aspect = inference_size[0] / float(inference_size[1])
+        self.output_size = (
+            max(16, int(round(inference_size[0] * output_scale))),
+            max(16, int(round(inference_size[1] * output_scale))),
+        )
+        self.mirrored = mirrored
+
+        self._box: Optional[Box] = None  # 다음 프레임에 사용할 상자 (None = 전체 화면)
+        self._history = np.full((self.HISTORY_SIZE, 5), -1, dtype=np.int64)  # (frame_seq, x0, y0, x1, y1)
+        self.cropped_frames = 0
+        self.full_frames = 0
+
+    def reset(self) -> None:
+        """추적을 잃었을 때: 다음 프레임은 전체 화면으로 추론합니다."""
+        self._box = None
+
+    def next_box(self) -> Optional[Box]:
+        """다음 프레임에서 자를 상자. None이면 전체 화면."""
+        return self._box if self.enabled else None
+
+    def record(self, frame_seq: int, box: Optional[Box]) -> None:
+        """제출한 프레임 순번과 자른 상자를 기록합니다 (box=None이면 전체 화면)."""
+        row = self._history[frame_seq % self.HISTORY_SIZE]
+        row[0] = frame_seq
+        row[1:] = box if box is not None else (0, 0, self.frame_w, self.frame_h)
+        if box is None:
+            self.full_frames += 1
+        else:
+            self.cropped_frames += 1
+
+    def to_source(self, landmarks: np.ndarray, frame_seq: int) -> np.ndarray:
+        """자른 영역 기준 정규화 랜드마크 (33, 4)를 전체 프레임 기준 정규화 좌표로 바꿉니다 (제자리)."""
+        row = self._history[frame_seq % self.HISTORY_SIZE]
+        if row[0] != frame_seq:
+            return landmarks  # 기록이 없으면 전체 화면으로 제출된 프레임
+        x0, y0, x1, y1 = (int(v) for v in row[1:])
+        if (x0, y0, x1, y1) == (0, 0, self.frame_w, self.frame_h):
+            return landmarks
+        crop_w, crop_h = x1 - x0, y1 - y0
+        # 픽셀 반전 모드에서는 자른 영역을 뒤집어 추론하므로, 반전된 전체 프레임에서 영역의 왼쪽 끝은 W - x1입니다.
+        left = self.frame_w - x1 if self.mirrored else x0
+        sx = crop_w / float(self.frame_w)
+        landmarks[:, 0] = landmarks[:, 0] * sx + left / float(self.frame_w)
+        landmarks[:, 1] = landmarks[:, 1] * (crop_h / float(self.frame_h)) + y0 / float(self.frame_h)
+        landmarks[:, 2] *= sx
+        return landmarks
+
+    def observe(self, landmarks: Optional[np.ndarray]) -> None:
+        """전체 프레임 기준 정규화 랜드마크로 다음 프레임의 상자를 정합니다."""
+        if not self.enabled:
+            return
+        if landmarks is None:
+            self._box = None
+            return
+        visible = landmarks[:, 3] >= self.min_visibility
+        if float(landmarks[CONFIDENCE_INDEX, 3].mean()) < self.min_confidence or np.count_nonzero(visible) < 4:
+            self._box = None
+            return
+
+        xs = landmarks[visible, 0]
+        if self.mirrored:
+            xs = 1.0 - xs
+        xs = xs * self.frame_w
+        ys = landmarks[visible, 1] * self.frame_h
+        bx0, bx1 = float(xs.min()), float(xs.max())
+        by0, by1 = float(ys.min()), float(ys.max())
+
+        # 여백을 더하고, 추론 해상도와 같은 종횡비가 되도록 짧은 쪽을 늘립니다.
+        pad = self.padding * max(bx1 - bx0, by1 - by0)
+        w = bx1 - bx0 + 2.0 * pad
+        h = max(by1 - by0 + 2.0 * pad, self.min_size * self.frame_h)
+        if w / h > self.aspect:
+            h = w / self.aspect
+        else:
+            w = h * self.aspect
+        if w * h >= self.max_area * self.frame_w * self.frame_h or w >= self.frame_w or h >= self.frame_h:
+            self._box = None
+            return
+
+        # 중심을 유지하되 프레임 밖으로 나가면 안쪽으로 밀어 넣습니다.
+        cx, cy = 0.5 * (bx0 + bx1), 0.5 * (by0 + by1)
+        x0 = int(round(min(max(cx - 0.5 * w, 0.0), self.frame_w - w)))
+        y0 = int(round(min(max(cy - 0.5 * h, 0.0), self.frame_h - h)))
+        self._box = (x0, y0, min(self.frame_w, x0 + int(round(w))), min(self.frame_h, y0 + int(round(h))))
@@ -1,108 +1,135 @@
 #MediaPipe 로직, 캘리브레이션, 동작 감지(펀치/더킹)를 모두 캡슐화한 클래스
 import cv2
+import threading
 import time
-import math
 import numpy as np
 import mediapipe as mp
-from collections import deque
 
-# MediaPipe 포즈 솔루션 초기화
-mp_pose = mp.solutions.pose
+from core.frame_path import FramePath
+from core.inference_governor import InferenceGovernor
+from core.pose_analyzer import PoseAnalyzer
+from core.pose_backend import create_pose_backend
+from core.pose_roi import PoseROI
+from core.pose_landmarks import NUM_LANDMARKS, NOSE, LEFT_SHOULDER, RIGHT_SHOULDER, to_pixel_landmarks
+from core.pose_worker import PoseInferenceWorker
 
-class PoseTracker:
+class PoseTracker(PoseAnalyzer):
     def __init__(self, width, height, config_rules, config_ui):
-        self.pose = mp_pose.Pose(
-            model_complexity=2,  # 정확도 개선을 위해 1 -> 2로 변경
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5,
-            enable_segmentation=True # --- (수정) 배경 분리 기능 활성화 ---
-        )
-        
-        self.width = width
-        self.height = height
-        
-        # (기록용 deque들...)
-        self.hist_t = deque(maxlen=5)
-        self.hist_lw = deque(maxlen=5); self.hist_rw = deque(maxlen=5)
-        self.hist_ls = deque(maxlen=5); self.hist_rs = deque(maxlen=5)
-        self.hist_le = deque(maxlen=5); self.hist_re = deque(maxlen=5)
-
-        # 캘리브레이션 데이터 (기본값)
-        self.calib_data = {
-            "shoulder_w": 300,
-            "head_center": (int(width * 0.5), int(height * 0.35)),
-            "head_radius": int(width * 0.08),
-            "duck_line_y": int(height * 0.5)
+        inference_cfg = config_rules.get("pose_inference", {})
+        self.pose_options = {
+            "model_complexity": int(inference_cfg.get("model_complexity", 2)),  # 정확도 개선을 위해 1 -> 2로 변경
+            "min_detection_confidence": 0.5,
+            "min_tracking_confidence": 0.5,
+            # 세그멘테이션은 포즈 그래프와 분리해 필요한 씬에서만 별도로 계산합니다.
+            "enable_segmentation": False,
         }
         
-        rules = config_rules["action_thresholds"]
-        self.REFRACTORY = rules["action_refractory"]
-        self.V_THRESH = rules["action_v_thresh"]
-        self.ANG_THRESH = rules["action_ang_thresh"]
-        
-        self.test_mode = False
-        self.last_hit_t = {"L": 0.0, "R": 0.0}
-        
-        # config_rules 저장 (spatial_judge_mode 접근용)
-        self.config_rules = config_rules
-        
-        # 테스트 모드: 손이 히트존 밖에 있었는지 추적
-        self.left_was_outside_hit_zone = False
-        self.right_was_outside_hit_zone = False
-        
-        # 히트존 정보 가져오기
-        hud_styles = config_ui.get("styles", {}).get("hud", {})
-        hit_zone_pos_ratio = config_ui.get("positions", {}).get("hit_zone", {}).get("pos_ratio", [0.5, 0.3])
-        self.hit_zone_x = int(width * hit_zone_pos_ratio[0])
-        self.hit_zone_y = int(height * hit_zone_pos_ratio[1])
-        self.hit_zone_radius = int(hud_styles.get("hit_zone_radius", 100))
-        
-        # 랜드마크 스무딩 데이터 (Phase 1: 역할 확장)
-        self.smoothing_alpha = 0.7  # 스무딩 계수
-        self.calib_landmark_pos = {
-            "head_center": None, "nose": None, "left_eye_inner": None, "right_eye_inner": None,
-            "left_wrist": None, "right_wrist": None, 
-            "left_elbow": None, "right_elbow": None,
-            "shoulders": (None, None),
-            "left_ear": None, "right_ear": None,
-            "left_mouth": None, "right_mouth": None,
-            "left_index": None, "right_index": None,
-            "left_pinky": None, "right_pinky": None,
-            "left_thumb": None, "right_thumb": None
-        }
-        self.smoothed_landmark_pos = self.calib_landmark_pos.copy()
-        
-        # 주먹 중심점 (계산된 값)
-        self.left_fist_center = None
-        self.right_fist_center = None
-
-    def _angle(self, a, b, c):
-        # (1단계와 동일)
-        a = np.array(a); b = np.array(b); c = np.array(c)
-        ab = a - b; cb = c - b
-        denom = (np.linalg.norm(ab) * np.linalg.norm(cb) + 1e-6)
-        cosang = np.dot(ab, cb) / denom
-        return math.degrees(math.acos(np.clip(cosang, -1.0, 1.0)))
+        # 세그멘테이션 (Selfie Segmentation): 활성 씬이 요청할 때만, every_n_frames 프레임마다 계산하고
+        # 그 사이에는 마지막 마스크를 재사용합니다.
+        segmentation_cfg = inference_cfg.get("segmentation", {})
+        self.segmentation_available = bool(segmentation_cfg.get("enabled", True))
+        self.segmentation_every_n = max(1, int(segmentation_cfg.get("every_n_frames", 3)))
+        self.segmentation_options = {"model_selection": int(segmentation_cfg.get("model_selection", 0))}
+        self.segmentation_enabled = False
+        self.segmentation_mask = None
+        self.segmenter = None
+        self._segmentation_frame_count = 0
+        
+        # 분석 단계 (모션 기록, 캘리브레이션, 동작 감지, 랜드마크 스무딩/예측): core.pose_analyzer
+        super().__init__(width, height, config_rules, config_ui)
+        
+        # 추론 해상도: 프레임을 이 크기로 한 번 축소해 추론합니다.
+        # 랜드마크는 정규화 좌표이므로 self.width/height를 곱하면 원본(카메라) 좌표로 되돌아갑니다.
+        self.inference_size = self._resolve_inference_size(inference_cfg.get("inference_resolution"))
+        
+        # 추론 거버너: CPU 예산에 맞춰 모델 복잡도와 추론 FPS를 조절합니다.
+        self.governor = InferenceGovernor(inference_cfg.get("governor"), self.pose_options["model_complexity"])
+        self.pose_options["model_complexity"] = self.governor.complexity
+        
+        # 추론 모드: "inline" = 메인 스레드에서 동기 추론, "tasks" = PoseLandmarker LIVE_STREAM 비동기 추론,
+        # "process" = 별도 워커 프로세스에서 추론
+        self.inference_mode = inference_cfg.get("mode", "inline")
+        self.tasks_cfg = inference_cfg.get("tasks", {})
+        self.backend = None
+        self.inference_worker = None
+        if self.inference_mode == "process":
+            try:
+                self.inference_worker = PoseInferenceWorker(
+                    self.inference_size[0],
+                    self.inference_size[1],
+                    self.pose_options,
+                    int(inference_cfg.get("ring_size", 3)),
+                    self.segmentation_options,
+                )
+                self.inference_worker.start()
+            except Exception as e:
+                print(f"[경고] 포즈 추론 워커 시작 실패: {e}. 메인 스레드 추론을 사용합니다.")
+                self._fallback_to_inline()
+        if self.inference_worker is None and self.backend is None:
+            self.backend = create_pose_backend(self.inference_mode, self.pose_options, self.tasks_cfg)
+        
+        # 마지막 추론 결과 (비동기 모드에서 새 결과가 없을 때 재사용)
+        self.last_pose_landmarks = None
+        self.last_mask = None
+        self.last_frame_timestamp = None  # 마지막 결과에 해당하는 프레임의 캡처 시각
+        self.result_seq = 0  # 새 결과가 분석될 때마다 증가
+        
+        # 프레임 경로: 화면에 카메라 영상을 그리지 않으므로 기본적으로 픽셀 대신 랜드마크 좌표를 좌우 반전합니다.
+        # "pixels"로 설정하면 기존처럼 프레임을 뒤집어 추론합니다.
+        # 랜드마크 반전 모드에서 세그멘테이션 마스크는 카메라(반전 전) 좌표계 그대로입니다.
+        self.mirror_mode = inference_cfg.get("mirror_mode", "landmarks")
+        self.frame_path = FramePath(mirror_pixels=self.mirror_mode == "pixels")
+        
+        # 관심 영역(ROI): 직전 결과의 랜드마크 상자를 넓힌 영역만 잘라 추론하고, 결과를 원본 좌표로 되돌립니다.
+        # 추적을 잃거나 신뢰도가 낮으면, 또 세그멘테이션 마스크를 계산하는 프레임은 전체 화면으로 추론합니다.
+        self.roi = PoseROI(
+            inference_cfg.get("roi"), (width, height), self.inference_size, mirrored=self.mirror_mode == "pixels"
+        )
+        # 프레임당 하나의 픽셀 좌표 랜드마크 배열 (x, y, z, visibility). update_data와 씬이 모두 이 배열을 공유합니다.
+        self._landmarks_px = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+        
+        # 워밍업: 첫 추론의 그래프/모델 초기화 지연이 게임 중에 나오지 않도록, 메인 메뉴가 떠 있는 동안
+        # 백그라운드 스레드에서 추론 해상도의 더미 프레임을 미리 추론합니다. 끝날 때까지 실제 프레임은 추론하지 않습니다.
+        warmup_cfg = inference_cfg.get("warmup", {})
+        self.warmup_frames = max(1, int(warmup_cfg.get("frames", 3)))
+        self.warmup_timeout_s = float(warmup_cfg.get("timeout_s", 20.0))
+        self.warmup_ms = None  # 워밍업에 걸린 시간 (끝나기 전에는 None)
+        self._ready = threading.Event()
+        self._warmup_thread = None
+        if warmup_cfg.get("enabled", True):
+            self._warmup_thread = threading.Thread(target=self._warmup, name="PoseWarmup", daemon=True)
+            self._warmup_thread.start()
+        else:
+            self._ready.set()
+
+    def _resolve_inference_size(self, resolution):
+        """설정값(None, 높이, [너비, 높이])을 추론 해상도 (width, height)로 변환합니다. 확대는 하지 않습니다."""
+        if not resolution:
+            return (int(self.width), int(self.height))
+        if isinstance(resolution, (int, float)):
+            # 높이만 지정하면 원본 종횡비를 유지합니다.
+            height = int(resolution)
+            width = int(round(self.width * height / max(1, self.height)))
+        else:
+            width, height = int(resolution[0]), int(resolution[1])
+        if width >= self.width or height >= self.height:
+            return (int(self.width), int(self.height))
+        return (max(1, width), max(1, height))
 
     def calibrate_from_pose(self, pose_landmarks):
         """
         안정화된 단일 포즈(landmarks)를 기반으로 캘리브레이션을 수행합니다.
         """
         print("Calibrating from stable pose...")
-        if not pose_landmarks:
+        if pose_landmarks is None:
             print("Calibration Failed: No pose data provided. Using defaults.")
             return
 
-        lm = pose_landmarks.landmark
-        def P(i): return (lm[i].x * self.width, lm[i].y * self.height)
+        lm = pose_landmarks
 
         try:
-            L_SH = P(mp_pose.PoseLandmark.LEFT_SHOULDER)
-            R_SH = P(mp_pose.PoseLandmark.RIGHT_SHOULDER)
-            NOSE = P(mp_pose.PoseLandmark.NOSE)
-            
-            shoulder_w = np.linalg.norm(np.array(L_SH) - np.array(R_SH))
-            head_center = (int(NOSE[0]), int(NOSE[1]))
+            shoulder_w = float(np.linalg.norm(lm[LEFT_SHOULDER, :2] - lm[RIGHT_SHOULDER, :2]))
+            head_center = (int(lm[NOSE, 0]), int(lm[NOSE, 1]))
             head_radius = int(shoulder_w * 0.4) 
             duck_line_y = head_center[1] + head_radius
             
@@ -116,348 +143,238 @@ class PoseTracker:
         except Exception as e:
             print(f"Calibration Error: {e}. Using default values.")
 
-    def process_frame(self, frame, now):
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        res = self.pose.process(rgb)
-        hit_events = []
-        
-        # --- (수정) 마스크가 없을 때도 None 반환 ---
-        if not res.pose_landmarks:
-            return hit_events, None, None
-        # --- (수정 끝) ---
-        
-        lm = res.pose_landmarks.landmark
-        def P(i): return (lm[i].x * self.width, lm[i].y * self.height)
-        
-        try:
-            LW, RW = P(mp_pose.PoseLandmark.LEFT_WRIST),  P(mp_pose.PoseLandmark.RIGHT_WRIST)
-            LS, RS = P(mp_pose.PoseLandmark.LEFT_SHOULDER),P(mp_pose.PoseLandmark.RIGHT_SHOULDER)
-            LE, RE = P(mp_pose.PoseLandmark.LEFT_ELBOW),   P(mp_pose.PoseLandmark.RIGHT_ELBOW)
-            NOSE   = P(mp_pose.PoseLandmark.NOSE)
-        except Exception:
-            # --- (수정) 마스크 함께 반환 ---
-            return hit_events, res.pose_landmarks, res.segmentation_mask
-            # --- (수정 끝) ---
-
-        self.hist_t.append(now)
-        for h, v in [(self.hist_lw, LW), (self.hist_rw, RW), (self.hist_ls, LS), (self.hist_rs, RS), (self.hist_le, LE), (self.hist_re, RE)]:
-            h.append(v)
-            
-        if len(self.hist_t) < 2:
-            # --- (수정) 마스크 함께 반환 ---
-            return hit_events, res.pose_landmarks, res.segmentation_mask
-            # --- (수정 끝) ---
-
-        dt = self.hist_t[-1] - self.hist_t[-2]
-        sw = self.calib_data["shoulder_w"]
-
-        def radial_speed(S, W, prevW):
-            r_now = np.linalg.norm(np.array(W) - np.array(S)) / sw
-            r_prv = np.linalg.norm(np.array(prevW) - np.array(S)) / sw
-            return (r_now - r_prv) / max(1e-6, dt)
-            
-        vL = radial_speed(LS, LW, self.hist_lw[-2])
-        vR = radial_speed(RS, RW, self.hist_rw[-2])
-        angL = self._angle(LS, LE, LW); angR = self._angle(RS, RE, RW)
-        
-        hit_zone_x = self.width // 2
-        # MediaPipe는 반전된 프레임을 처리하므로, 랜드마크 좌표도 반전된 프레임 기준입니다.
-        # 화면에서 보이는 위치:
-        # - 화면 왼쪽에 보이는 손 = 사용자의 오른손 = RIGHT_WRIST
-        # - 화면 오른쪽에 보이는 손 = 사용자의 왼손 = LEFT_WRIST
-        # MediaPipe 좌표 기준으로는 (반전된 프레임 기준):
-        # - RIGHT_WRIST가 화면 왼쪽에 있으면 RW[0] < hit_zone_x
-        # - LEFT_WRIST가 화면 오른쪽에 있으면 LW[0] > hit_zone_x
-        left_zone_for_jab_l = RW[0] < hit_zone_x  # RIGHT_WRIST가 화면 왼쪽에 있으면
-        right_zone_for_jab_r = LW[0] > hit_zone_x  # LEFT_WRIST가 화면 오른쪽에 있으면
-
-        if self.test_mode:
-            # 테스트 모드: 손의 중심점이 히트존을 나갔다가 다시 들어온 것을 감지
-            # spatial_judge_mode에 따라 손의 중심점 계산
-            spatial_mode = self.config_rules.get("spatial_judge_mode", 2)
-            
-            # cv2.flip 고려: 화면 왼쪽 펀치(JAB_L)는 RIGHT_WRIST 사용, 화면 오른쪽 펀치(JAB_R)는 LEFT_WRIST 사용
-            # RIGHT_WRIST 중심점 계산 (JAB_L에 사용 - 화면 왼쪽에 보이는 손)
-            right_wrist = RW
-            right_pinky = P(mp_pose.PoseLandmark.RIGHT_PINKY) if spatial_mode == 2 else None
-            right_index = P(mp_pose.PoseLandmark.RIGHT_INDEX) if spatial_mode == 2 else None
-            right_thumb = P(mp_pose.PoseLandmark.RIGHT_THUMB) if spatial_mode == 2 else None
-            
-            if spatial_mode == 1:
-                right_center_for_jab_l = right_wrist
-            else:
-                right_points = [p for p in [right_wrist, right_pinky, right_index, right_thumb] if p is not None]
-                if right_points:
-                    right_center_for_jab_l = (np.mean([p[0] for p in right_points]), np.mean([p[1] for p in right_points]))
-                else:
-                    right_center_for_jab_l = None
-            
-            # LEFT_WRIST 중심점 계산 (JAB_R에 사용 - 화면 오른쪽에 보이는 손)
-            left_wrist = LW
-            left_pinky = P(mp_pose.PoseLandmark.LEFT_PINKY) if spatial_mode == 2 else None
-            left_index = P(mp_pose.PoseLandmark.LEFT_INDEX) if spatial_mode == 2 else None
-            left_thumb = P(mp_pose.PoseLandmark.LEFT_THUMB) if spatial_mode == 2 else None
-            
-            if spatial_mode == 1:
-                left_center_for_jab_r = left_wrist
-            else:
-                left_points = [p for p in [left_wrist, left_pinky, left_index, left_thumb] if p is not None]
-                if left_points:
-                    left_center_for_jab_r = (np.mean([p[0] for p in left_points]), np.mean([p[1] for p in left_points]))
-                else:
-                    left_center_for_jab_r = None
-            
-            # 히트존 안에 있는지 확인
-            def is_inside_hit_zone(center):
-                if center is None:
-                    return False
-                # MediaPipe 좌표는 이미 반전된 프레임 기준이므로 추가 반전 불필요
-                dist = np.sqrt((center[0] - self.hit_zone_x)**2 + (center[1] - self.hit_zone_y)**2)
-                return dist <= self.hit_zone_radius
-            
-            # JAB_L: RIGHT_WRIST(화면 왼쪽에 보이는 손)가 히트존을 나갔다가 다시 들어온 경우
-            if right_center_for_jab_l:
-                right_inside = is_inside_hit_zone(right_center_for_jab_l)
-                if not self.right_was_outside_hit_zone and not right_inside:
-                    # 히트존 밖으로 나감
-                    self.right_was_outside_hit_zone = True
-                elif self.right_was_outside_hit_zone and right_inside and left_zone_for_jab_l:
-                    # 히트존 밖에 있다가 다시 안으로 들어옴 (펀치 감지)
-                    if (now - self.last_hit_t["L"] > self.REFRACTORY):
-                        hit_events.append({"type": "JAB_L", "t_hit": now})
-                        self.last_hit_t["L"] = now
-                        self.right_was_outside_hit_zone = False
-            
-            # JAB_R: LEFT_WRIST(화면 오른쪽에 보이는 손)가 히트존을 나갔다가 다시 들어온 경우
-            if left_center_for_jab_r:
-                left_inside = is_inside_hit_zone(left_center_for_jab_r)
-                if not self.left_was_outside_hit_zone and not left_inside:
-                    # 히트존 밖으로 나감
-                    self.left_was_outside_hit_zone = True
-                elif self.left_was_outside_hit_zone and left_inside and right_zone_for_jab_r:
-                    # 히트존 밖에 있다가 다시 안으로 들어옴 (펀치 감지)
-                    if (now - self.last_hit_t["R"] > self.REFRACTORY):
-                        hit_events.append({"type": "JAB_R", "t_hit": now})
-                        self.last_hit_t["R"] = now
-                        self.left_was_outside_hit_zone = False
-        else:
-            # 일반 모드: 속도, hit zone 내부, 쿨타임 체크
-            # cv2.flip 고려: JAB_L은 RIGHT_WRIST(화면 왼쪽)의 속도 사용, JAB_R은 LEFT_WRIST(화면 오른쪽)의 속도 사용
-            # 주먹 중심점이 hit zone 안에 있는지 확인
-            spatial_mode = self.config_rules.get("spatial_judge_mode", 2)
-            
-            # JAB_L: RIGHT_WRIST 중심점 계산
-            right_wrist = RW
-            right_pinky = P(mp_pose.PoseLandmark.RIGHT_PINKY) if spatial_mode == 2 else None
-            right_index = P(mp_pose.PoseLandmark.RIGHT_INDEX) if spatial_mode == 2 else None
-            right_thumb = P(mp_pose.PoseLandmark.RIGHT_THUMB) if spatial_mode == 2 else None
-            
-            if spatial_mode == 1:
-                right_center_for_jab_l = right_wrist
-            else:
-                right_points = [p for p in [right_wrist, right_pinky, right_index, right_thumb] if p is not None]
-                if right_points:
-                    right_center_for_jab_l = (np.mean([p[0] for p in right_points]), np.mean([p[1] for p in right_points]))
-                else:
-                    right_center_for_jab_l = None
-            
-            # JAB_R: LEFT_WRIST 중심점 계산
-            left_wrist = LW
-            left_pinky = P(mp_pose.PoseLandmark.LEFT_PINKY) if spatial_mode == 2 else None
-            left_index = P(mp_pose.PoseLandmark.LEFT_INDEX) if spatial_mode == 2 else None
-            left_thumb = P(mp_pose.PoseLandmark.LEFT_THUMB) if spatial_mode == 2 else None
-            
-            if spatial_mode == 1:
-                left_center_for_jab_r = left_wrist
-            else:
-                left_points = [p for p in [left_wrist, left_pinky, left_index, left_thumb] if p is not None]
-                if left_points:
-                    left_center_for_jab_r = (np.mean([p[0] for p in left_points]), np.mean([p[1] for p in left_points]))
-                else:
-                    left_center_for_jab_r = None
-            
-            # 히트존 안에 있는지 확인하는 함수
-            def is_inside_hit_zone(center):
-                if center is None:
-                    return False
-                # MediaPipe 좌표는 이미 반전된 프레임 기준이므로 추가 반전 불필요
-                dist = np.sqrt((center[0] - self.hit_zone_x)**2 + (center[1] - self.hit_zone_y)**2)
-                return dist <= self.hit_zone_radius
-            
-            # JAB_L 판정 (각도 조건 제거, hit zone 체크 추가)
-            jab_l_conditions = {
-                "vR": vR >= self.V_THRESH,
-                "in_hit_zone": right_center_for_jab_l is not None and is_inside_hit_zone(right_center_for_jab_l),
-                "cooldown": (now - self.last_hit_t["L"] > self.REFRACTORY)
-            }
-            if all(jab_l_conditions.values()):
-                hit_events.append({"type": "JAB_L", "t_hit": now})
-                self.last_hit_t["L"] = now
-                if self.test_mode:
-                    print(f"[JAB_L HIT] vR={vR:.2f}, angR={angR:.1f}, RW[0]={RW[0]:.1f}, hit_zone_x={hit_zone_x}, in_zone=True")
-            elif self.test_mode and vR > 0.3:  # test mode에서만 조건이 거의 충족될 때 로그
-                failed = [k for k, v in jab_l_conditions.items() if not v]
-                in_zone = right_center_for_jab_l is not None and is_inside_hit_zone(right_center_for_jab_l)
-                print(f"[JAB_L FAIL] {failed} | vR={vR:.2f}/{self.V_THRESH}, angR={angR:.1f}, in_zone={in_zone}, RW[0]={RW[0]:.1f}, cooldown={(now-self.last_hit_t['L']):.2f}s")
-
-            # JAB_R 판정 (각도 조건 제거, hit zone 체크 추가)
-            jab_r_conditions = {
-                "vL": vL >= self.V_THRESH,
-                "in_hit_zone": left_center_for_jab_r is not None and is_inside_hit_zone(left_center_for_jab_r),
-                "cooldown": (now - self.last_hit_t["R"] > self.REFRACTORY)
-            }
-            if all(jab_r_conditions.values()):
-                hit_events.append({"type": "JAB_R", "t_hit": now})
-                self.last_hit_t["R"] = now
-                if self.test_mode:
-                    print(f"[JAB_R HIT] vL={vL:.2f}, angL={angL:.1f}, LW[0]={LW[0]:.1f}, hit_zone_x={hit_zone_x}, in_zone=True")
-            elif self.test_mode and vL > 0.3:  # test mode에서만 조건이 거의 충족될 때 로그
-                failed = [k for k, v in jab_r_conditions.items() if not v]
-                in_zone = left_center_for_jab_r is not None and is_inside_hit_zone(left_center_for_jab_r)
-                print(f"[JAB_R FAIL] {failed} | vL={vL:.2f}/{self.V_THRESH}, angL={angL:.1f}, in_zone={in_zone}, LW[0]={LW[0]:.1f}, cooldown={(now-self.last_hit_t['R']):.2f}s")
-
-        if NOSE[1] > self.calib_data["duck_line_y"]: 
-             hit_events.append({"type": "DUCK", "t_hit": now})
-
-        # Phase 1: 랜드마크 스무딩 및 주먹 중심점 계산
-        if res.pose_landmarks:
-            self.update_landmark_smoothing(res.pose_landmarks)
-            self.calculate_fist_centroids()
-
-        # --- (수정) 마스크 함께 반환 ---
-        return hit_events, res.pose_landmarks, res.segmentation_mask
-
-    def set_test_mode(self, enabled: bool) -> None:
-        """테스트 모드 토글 (실시간 디버그 용)."""
-        self.test_mode = bool(enabled)
-        # --- (수정 끝) ---
-    
-    def get_smoothed_landmarks(self):
-        """현재 스무딩된 모든 랜드마크를 반환합니다 (Phase 1)."""
-        return self.smoothed_landmark_pos.copy()
-    
-    def get_fist_centroids(self):
-        """주먹 중심점을 계산하여 반환합니다 (Phase 1).
-        
-        Returns:
-            (left_fist_center, right_fist_center): 
-            - left_fist_center: (x, y) 또는 None
-            - right_fist_center: (x, y) 또는 None
-        """
-        return (self.left_fist_center, self.right_fist_center)
-    
-    def update_landmark_smoothing(self, pose_landmarks):
-        """랜드마크 스무딩을 업데이트합니다 (Phase 1)."""
-        if not pose_landmarks:
-            return
-        
-        lm = pose_landmarks.landmark
-        def P(i): return (lm[i].x * self.width, lm[i].y * self.height)
-        
+    @property
+    def is_async(self):
+        """비동기(워커 프로세스, LIVE_STREAM)로 추론하는지 여부 (프레임이 없어도 결과를 폴링해야 함)."""
+        return self.inference_worker is not None or (self.backend is not None and self.backend.is_async)
+
+    @property
+    def ready(self):
+        """워밍업이 끝나 실제 프레임을 추론할 수 있는지 여부."""
+        return self._ready.is_set()
+
+    def _warmup(self):
+        """(워밍업 스레드) 더미 프레임으로 포즈/세그멘테이션 모델을 미리 초기화하고 걸린 시간을 기록합니다."""
+        start = time.perf_counter()
         try:
-            # 랜드마크 좌표 추출
-            raw_landmark_pos = {
-                "head_center": None, "nose": None, "left_eye_inner": None, "right_eye_inner": None,
-                "left_wrist": None, "right_wrist": None, 
-                "left_elbow": None, "right_elbow": None,
-                "shoulders": (None, None),
-                "left_ear": None, "right_ear": None,
-                "left_mouth": None, "right_mouth": None,
-                "left_index": None, "right_index": None,
-                "left_pinky": None, "right_pinky": None,
-                "left_thumb": None, "right_thumb": None
-            }
-            
-            NOSE = P(mp_pose.PoseLandmark.NOSE)
-            L_EYE_INNER = P(mp_pose.PoseLandmark.LEFT_EYE_INNER)
-            R_EYE_INNER = P(mp_pose.PoseLandmark.RIGHT_EYE_INNER)
-            HEAD_CENTER = ((L_EYE_INNER[0] + R_EYE_INNER[0]) / 2, (L_EYE_INNER[1] + R_EYE_INNER[1]) / 2)
-            
-            L_WRIST = P(mp_pose.PoseLandmark.LEFT_WRIST)
-            R_WRIST = P(mp_pose.PoseLandmark.RIGHT_WRIST)
-            L_ELBOW = P(mp_pose.PoseLandmark.LEFT_ELBOW)
-            R_ELBOW = P(mp_pose.PoseLandmark.RIGHT_ELBOW)
-            L_SHOULDER = P(mp_pose.PoseLandmark.LEFT_SHOULDER)
-            R_SHOULDER = P(mp_pose.PoseLandmark.RIGHT_SHOULDER)
-            LEFT_EAR = P(mp_pose.PoseLandmark.LEFT_EAR)
-            RIGHT_EAR = P(mp_pose.PoseLandmark.RIGHT_EAR)
-            LEFT_MOUTH = P(mp_pose.PoseLandmark.MOUTH_LEFT)
-            RIGHT_MOUTH = P(mp_pose.PoseLandmark.MOUTH_RIGHT)
-            L_PINKY = P(mp_pose.PoseLandmark.LEFT_PINKY)
-            R_PINKY = P(mp_pose.PoseLandmark.RIGHT_PINKY)
-            L_INDEX = P(mp_pose.PoseLandmark.LEFT_INDEX)
-            R_INDEX = P(mp_pose.PoseLandmark.RIGHT_INDEX)
-            L_THUMB = P(mp_pose.PoseLandmark.LEFT_THUMB)
-            R_THUMB = P(mp_pose.PoseLandmark.RIGHT_THUMB)
-            
-            raw_landmark_pos = {
-                "head_center": HEAD_CENTER, "nose": NOSE,
-                "left_eye_inner": L_EYE_INNER, "right_eye_inner": R_EYE_INNER,
-                "left_wrist": L_WRIST, "right_wrist": R_WRIST,
-                "left_elbow": L_ELBOW, "right_elbow": R_ELBOW,
-                "shoulders": (L_SHOULDER, R_SHOULDER),
-                "left_ear": LEFT_EAR, "right_ear": RIGHT_EAR,
-                "left_mouth": LEFT_MOUTH, "right_mouth": RIGHT_MOUTH,
-                "left_index": L_INDEX, "right_index": R_INDEX,
-                "left_pinky": L_PINKY, "right_pinky": R_PINKY,
-                "left_thumb": L_THUMB, "right_thumb": R_THUMB
-            }
-        except Exception:
+            if self.inference_worker is not None:
+                self._warmup_worker(start + self.warmup_timeout_s)
+            elif self.backend is not None:
+                self._warmup_backend(start + self.warmup_timeout_s)
+        except Exception as e:
+            print(f"[경고] 포즈 모델 워밍업 실패: {e}")
+        finally:
+            self.warmup_ms = (time.perf_counter() - start) * 1000.0
+            print(f"[PoseTracker] 워밍업 완료: {self.warmup_ms:.0f} ms ({self.inference_mode})")
+            self._ready.set()
+
+    @staticmethod
+    def _wait_result(poll, deadline):
+        """poll()이 결과를 돌려줄 때까지 기다립니다."""
+        while poll() is None:
+            if time.perf_counter() > deadline:
+                raise TimeoutError("워밍업 추론 결과를 기다리다 시간이 초과되었습니다")
+            time.sleep(0.005)
+
+    def _warmup_backend(self, deadline):
+        w, h = self.inference_size
+        dummy = np.zeros((h, w, 3), dtype=np.uint8)
+        for _ in range(self.warmup_frames):
+            self.backend.submit(dummy, time.time())
+            self._wait_result(self.backend.poll, deadline)
+        if self.segmentation_available:
+            if self.segmenter is None:
+                self.segmenter = mp.solutions.selfie_segmentation.SelfieSegmentation(**self.segmentation_options)
+            self.segmenter.process(dummy)
+
+    def _warmup_worker(self, deadline):
+        worker = self.inference_worker
+        for i in range(self.warmup_frames):
+            if not worker.is_alive:
+                raise RuntimeError("포즈 추론 워커가 종료되었습니다")
+            worker.next_frame_buffer().fill(0)
+            # 첫 프레임에서 세그멘테이션 모델도 함께 불러옵니다.
+            worker.submit(time.time(), want_mask=self.segmentation_available and i == 0)
+            self._wait_result(worker.poll, deadline)
+
+    def _fallback_to_inline(self):
+        """워커를 정리하고 메인 스레드 추론으로 전환합니다."""
+        if self.inference_worker is not None:
+            self.inference_worker.stop()
+            self.inference_worker = None
+        self.inference_mode = "inline"
+        if self.backend is None:
+            self.backend = create_pose_backend(self.inference_mode, self.pose_options)
+
+    def close(self):
+        """추론 자원(워커 프로세스, MediaPipe 그래프)을 해제합니다."""
+        if self._warmup_thread is not None and self._warmup_thread.is_alive():
+            self._warmup_thread.join(timeout=self.warmup_timeout_s)
+        if self.inference_worker is not None:
+            self.inference_worker.stop()
+            self.inference_worker = None
+        if self.backend is not None:
+            self.backend.close()
+            self.backend = None
+        if self.segmenter is not None:
+            self.segmenter.close()
+            self.segmenter = None
+
+    @property
+    def mask_mirrored(self):
+        """세그멘테이션 마스크가 화면 기준으로 좌우 반전되어 있지 않은지 여부 (랜드마크 반전 모드)."""
+        return self.mirror_mode != "pixels"
+
+    def set_segmentation_enabled(self, enabled):
+        """세그멘테이션 마스크 계산을 켜거나 끕니다 (실루엣을 그리는 씬만 켭니다)."""
+        enabled = bool(enabled) and self.segmentation_available
+        if enabled == self.segmentation_enabled:
             return
-        
-        # 스무딩 적용
-        for key in self.smoothed_landmark_pos.keys():
-            raw_pos = raw_landmark_pos.get(key)
-            prev_pos = self.smoothed_landmark_pos.get(key)
-            
-            if key == "shoulders":
-                raw_l, raw_r = raw_pos if raw_pos and None not in raw_pos else (None, None)
-                prev_l, prev_r = prev_pos if prev_pos and None not in prev_pos else (None, None)
-                
-                def smooth_point(raw, prev):
-                    if raw:
-                        if prev:
-                            x = prev[0] * (1.0 - self.smoothing_alpha) + raw[0] * self.smoothing_alpha
-                            y = prev[1] * (1.0 - self.smoothing_alpha) + raw[1] * self.smoothing_alpha
-                            return (x, y)
-                        return raw
-                    return None
-                    
-                self.smoothed_landmark_pos[key] = (smooth_point(raw_l, prev_l), smooth_point(raw_r, prev_r))
-                continue
-            
-            if raw_pos:
-                if prev_pos:
-                    new_x = prev_pos[0] * (1.0 - self.smoothing_alpha) + raw_pos[0] * self.smoothing_alpha
-                    new_y = prev_pos[1] * (1.0 - self.smoothing_alpha) + raw_pos[1] * self.smoothing_alpha
-                    self.smoothed_landmark_pos[key] = (new_x, new_y)
-                else:
-                    self.smoothed_landmark_pos[key] = raw_pos
-            else:
-                self.smoothed_landmark_pos[key] = None
-    
-    def calculate_fist_centroids(self):
-        """주먹 중심점을 계산합니다 (Phase 1)."""
-        mode = int(self.config_rules.get("spatial_judge_mode", 2))
-        if mode == 1:
-            left_keys = ["left_wrist"]
-            right_keys = ["right_wrist"]
-        else:
-            left_keys = ["left_wrist", "left_pinky", "left_index", "left_thumb"]
-            right_keys = ["right_wrist", "right_pinky", "right_index", "right_thumb"]
-        
-        def calc_centroid(keys):
-            pts = [self.smoothed_landmark_pos.get(k) for k in keys]
-            valid_points = [p for p in pts if p is not None]
-            if not valid_points:
-                return None
-            xs = [p[0] for p in valid_points]
-            ys = [p[1] for p in valid_points]
-            return (int(np.mean(xs)), int(np.mean(ys)))
-        
-        self.left_fist_center = calc_centroid(left_keys)
-        self.right_fist_center = calc_centroid(right_keys)
-    
+        self.segmentation_enabled = enabled
+        self._segmentation_frame_count = 0
+        if not enabled:
+            self.segmentation_mask = None
+            self.last_mask = None
+
+    def _segmentation_due(self):
+        """이번 추론 프레임에서 마스크를 새로 계산해야 하는지 확인합니다."""
+        if not self.segmentation_enabled:
+            return False
+        due = self._segmentation_frame_count % self.segmentation_every_n == 0
+        self._segmentation_frame_count += 1
+        return due
+
+    def process_frame(self, frame, now, captured_at=None):
+        """프레임을 추론하고 (hit_events, pose_landmarks, mask)를 반환합니다.
+
+        pose_landmarks는 픽셀 좌표 (33, 4) float32 배열(x, y, z, visibility)이며 다음 결과에서 재사용됩니다.
+
+        히트 이벤트의 t_hit는 추론이 끝난 시각이 아니라 프레임 캡처 시각(captured_at) 기준입니다.
+        잽은 직전 프레임과 현재 프레임 사이에서 속도 임계값/히트존 경계를 지난 시각을 보간해 사용합니다.
+        비동기(process, tasks) 모드에서는 frame이 None일 수 있으며, 이때는 새 결과만 확인합니다.
+        """
+        t_frame = captured_at if captured_at is not None else now
+        if not self._ready.is_set():
+            # 워밍업 스레드가 추론 그래프를 쓰는 동안에는 프레임을 추론하지 않습니다.
+            return [], self.last_pose_landmarks, self.last_mask
+        if frame is not None and not self.governor.should_infer(t_frame):
+            # 거버너가 추론 FPS를 낮춘 경우 이번 프레임은 건너뜁니다.
+            frame = None
+        if self.inference_worker is not None:
+            return self._process_frame_async(frame, t_frame)
+        return self._process_frame_backend(frame, t_frame)
+
+    def _process_frame_backend(self, frame, captured_at):
+        """메인 프로세스 백엔드로 추론합니다.
+
+        동기(inline) 백엔드는 submit에서 추론을 마치고 바로 결과를 돌려주며,
+        LIVE_STREAM(tasks) 백엔드는 프레임만 넘기고 이전 프레임들의 결과 중 새 것이 있으면 분석합니다.
+        세그멘테이션은 두 경우 모두 제출한 프레임으로 메인 스레드에서 계산합니다.
+        """
+        seg_ms = seg_cpu_ms = 0.0
+        if frame is not None:
+            want_mask = self._segmentation_due()
+            box = None if want_mask else self.roi.next_box()
+            rgb = self._inference_input(frame, box, self.inference_size)
+            self.roi.record(self.backend.submit(rgb, captured_at), box)
+            if want_mask:
+                start = time.perf_counter()
+                cpu_start = time.process_time()
+                if self.segmenter is None:
+                    self.segmenter = mp.solutions.selfie_segmentation.SelfieSegmentation(**self.segmentation_options)
+                self.segmentation_mask = self.segmenter.process(rgb).segmentation_mask
+                seg_ms = (time.perf_counter() - start) * 1000.0
+                seg_cpu_ms = (time.process_time() - cpu_start) * 1000.0
+
+        pose_result = self.backend.poll()
+        if pose_result is None:
+            return [], self.last_pose_landmarks, self.last_mask
+        self._govern(pose_result.inference_ms + seg_ms, pose_result.cpu_ms + seg_cpu_ms)
+
+        pose_landmarks = self._source_landmarks(pose_result)
+        result = self._analyze_pose(pose_landmarks, self.segmentation_mask, pose_result.timestamp)
+        self._store_result(result, pose_result.timestamp)
+        return result
+
+    def _govern(self, latency_ms, cpu_ms):
+        """추론 측정값을 거버너에 전달하고, 모델 복잡도가 바뀌면 적용합니다."""
+        now = time.perf_counter()
+        self.governor.record(now, latency_ms, cpu_ms)
+        new_complexity = self.governor.update(now)
+        if new_complexity is not None:
+            self._set_model_complexity(new_complexity)
+
+    def _set_model_complexity(self, complexity):
+        """포즈 모델 복잡도를 바꿉니다 (워커는 다음 요청부터, 메인 프로세스 백엔드는 그래프를 다시 생성)."""
+        self.pose_options["model_complexity"] = int(complexity)
+        if self.inference_worker is not None:
+            self.inference_worker.reconfigure(self.pose_options)
+        elif self.backend is not None:
+            self.backend.reconfigure(self.pose_options)
+
+    def _store_result(self, result, frame_timestamp):
+        """분석 결과와 해당 프레임의 캡처 시각을 보관합니다."""
+        self.last_pose_landmarks, self.last_mask = result[1], result[2]
+        self.last_frame_timestamp = frame_timestamp
+        self.result_seq += 1
+
+    def _inference_input(self, frame, box, size, dst=None):
+        """프레임(또는 ROI 상자 영역)을 추론 입력 RGB로 변환합니다. 상자 영역은 복사 없이 뷰로 잘라 축소합니다."""
+        if box is None:
+            return self.frame_path.to_rgb(frame, dst=dst, size=size)
+        x0, y0, x1, y1 = box
+        return self.frame_path.to_rgb(frame[y0:y1, x0:x1], dst=dst, size=self.roi.output_size, tag="_roi")
+
+    def _source_landmarks(self, pose_result):
+        """결과 랜드마크를 (ROI로 잘랐다면 전체 프레임 기준으로 되돌린 뒤) 픽셀 좌표로 바꾸고 다음 ROI를 정합니다."""
+        landmarks = pose_result.landmarks
+        if landmarks is not None:
+            self.roi.to_source(landmarks, pose_result.frame_seq)
+        self.roi.observe(landmarks)
+        return self._to_pixels(landmarks) if landmarks is not None else None
+
+    def _to_pixels(self, landmarks):
+        """정규화 랜드마크 배열을 (필요하면 좌우 반전하여) 공유 픽셀 좌표 배열에 씁니다."""
+        return to_pixel_landmarks(
+            landmarks, self.width, self.height, self._landmarks_px, mirror=self.mirror_mode != "pixels"
+        )
+
+    def _process_frame_async(self, frame, captured_at):
+        """프레임을 워커에 제출하고, 새 추론 결과가 있으면 분석합니다 (대기 없음)."""
+        worker = self.inference_worker
+        if not worker.is_alive:
+            print("[경고] 포즈 추론 워커가 종료되었습니다. 메인 스레드 추론으로 전환합니다.")
+            self._fallback_to_inline()
+            return self.process_frame(frame, captured_at)
+
+        if frame is not None and worker.can_submit():
+            # 공유 메모리 링 슬롯에 바로 (추론 해상도로 축소한, 또는 ROI를 자른) RGB 변환 결과를 씁니다.
+            want_mask = self._segmentation_due()
+            box = None if want_mask else self.roi.next_box()
+            size = (worker.width, worker.height) if box is None else self.roi.output_size
+            self._inference_input(frame, box, size, dst=worker.next_frame_buffer(size))
+            self.roi.record(worker.submit(captured_at, want_mask=want_mask, size=size), box)
+
+        pose_result = worker.poll()
+        if pose_result is None:
+            return [], self.last_pose_landmarks, self.last_mask
+        self._govern(pose_result.inference_ms, pose_result.cpu_ms)
+        if pose_result.mask is not None and self.segmentation_enabled:
+            self.segmentation_mask = pose_result.mask
+
+        pose_landmarks = self._source_landmarks(pose_result)
+        # 이벤트 시각은 결과가 도착한 시각이 아니라 프레임을 캡처한 시각을 사용합니다.
+        result = self._analyze_pose(pose_landmarks, self.segmentation_mask, pose_result.timestamp)
+        self._store_result(result, pose_result.timestamp)
+        return result
+
+    def _analyze_pose(self, pose_landmarks, segmentation_mask, now):
+        """추론 결과에서 히트 이벤트를 감지하고 스무딩을 갱신합니다."""
+        hit_events = self.analyze_landmarks(pose_landmarks, now)
+        if pose_landmarks is None:
+            return hit_events, None, None
+        return hit_events, pose_landmarks, segmentation_mask
+
     def check_calibration_position(self, calib_targets):
         """캘리브레이션 위치 확인 (Phase 4).
         
@@ -470,9 +387,6 @@ class PoseTracker:
             - (head_ok, left_fist_ok, right_fist_ok): 각 타겟 달성 여부
             - raw_landmark_pos: 원본 랜드마크 위치 딕셔너리
         """
-        import mediapipe as mp
-        mp_pose = mp.solutions.pose
-        
         positions = {
             "head_center": None, "nose": None, "left_eye_inner": None, "right_eye_inner": None,
             "left_wrist": None, "right_wrist": None, 
@@ -0,0 +1,331 @@
+"""
+포즈 추론 워커 모듈
+MediaPipe 포즈 추론을 별도 프로세스에서 실행합니다.
+프레임은 공유 메모리 링으로 전달하고, 랜드마크와 세그멘테이션 마스크는 두 번째 공유 버퍼로 돌려받습니다.
+세그멘테이션(Selfie Segmentation)은 요청한 프레임에서만 실행합니다.
+메인 프로세스는 추론을 기다리지 않으므로 Arcade 렌더링 중에 GIL을 점유하지 않습니다.
+"""
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from core.logger import get_logger
+from core.pose_landmarks import NUM_LANDMARKS, landmarks_to_array
+
+
+logger = get_logger()
+
+# 결과 헤더 필드 인덱스 (float64 배열)
+_HDR_WRITE_SEQ = 0  # seqlock 카운터 (홀수 = 워커가 쓰는 중)
+_HDR_FRAME_SEQ = 1  # 결과에 해당하는 프레임 순번
+_HDR_TIMESTAMP = 2  # 프레임 제출 시각
+_HDR_HAS_LANDMARKS = 3
+_HDR_HAS_MASK = 4
+_HDR_INFERENCE_MS = 5
+_HDR_CPU_MS = 6  # 추론 한 번에 워커 프로세스가 사용한 CPU 시간
+_HDR_SIZE = 8
+
+
+class PoseResult(NamedTuple):
+    """워커가 돌려준 추론 결과"""
+    frame_seq: int
+    timestamp: float
+    landmarks: Optional[np.ndarray]  # (33, 4) 정규화 x, y, z, visibility
+    mask: Optional[np.ndarray]  # (H, W) float32 세그멘테이션 마스크 (이번 프레임에서 계산하지 않았으면 None)
+    inference_ms: float
+    cpu_ms: float
+
+
+def _result_views(buf: Any, width: int, height: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """결과 공유 버퍼를 헤더/랜드마크/마스크 뷰로 나눕니다."""
+    header = np.ndarray((_HDR_SIZE,), dtype=np.float64, buffer=buf, offset=0)
+    lm_offset = _HDR_SIZE * 8
+    landmarks = np.ndarray((NUM_LANDMARKS, 4), dtype=np.float32, buffer=buf, offset=lm_offset)
+    mask_offset = lm_offset + NUM_LANDMARKS * 4 * 4
+    mask = np.ndarray((height, width), dtype=np.float32, buffer=buf, offset=mask_offset)
+    return header, landmarks, mask
+
+
+def _result_nbytes(width: int, height: int) -> int:
+    return _HDR_SIZE * 8 + NUM_LANDMARKS * 4 * 4 + width * height * 4
+
+
+def _slot_view(frames: np.ndarray, slot: int, size: Optional[Tuple[int, int]]) -> np.ndarray:
+    """링 슬롯의 (height, width, 3) 연속 뷰. size가 슬롯보다 작으면(ROI) 슬롯 앞부분을 그 크기로 봅니다."""
+    if size is None:
+        return frames[slot]
+    width, height = size
+    return frames[slot].reshape(-1)[: height * width * 3].reshape(height, width, 3)
+
+
+def _worker_main(
+    frame_shm_name: str,
+    result_shm_name: str,
+    width: int,
+    height: int,
+    ring_size: int,
+    pose_options: Dict[str, Any],
+    segmentation_options: Dict[str, Any],
+    requests: Any,
+    stop_event: Any,
+) -> None:
+    """워커 프로세스 본체. 요청 큐에서 링 슬롯 번호를 받아 추론하고 결과 버퍼에 씁니다."""
+    import mediapipe as mp
+
+    frame_shm = shared_memory.SharedMemory(name=frame_shm_name)
+    result_shm = shared_memory.SharedMemory(name=result_shm_name)
+    frames = np.ndarray((ring_size, height, width, 3), dtype=np.uint8, buffer=frame_shm.buf)
+    header, landmarks, mask = _result_views(result_shm.buf, width, height)
+    pose = mp.solutions.pose.Pose(**pose_options)
+    segmenter = None  # 처음 마스크를 요청받을 때 생성
+
+    try:
+        while not stop_event.is_set():
+            try:
+                request = requests.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if request is None:
+                break
+            if request[0] == "reconfigure":
+                # 모델 복잡도 등이 바뀌면 그래프를 다시 만듭니다.
+                pose.close()
+                pose = mp.solutions.pose.Pose(**request[1])
+                continue
+
+            slot, frame_seq, timestamp, want_mask, size = request
+            image = _slot_view(frames, slot, size)
+            start = time.perf_counter()
+            cpu_start = time.process_time()
+            res = pose.process(image)
+            segmentation_mask = None
+            if want_mask and size is None:
+                if segmenter is None:
+                    segmenter = mp.solutions.selfie_segmentation.SelfieSegmentation(**segmentation_options)
+                segmentation_mask = segmenter.process(image).segmentation_mask
+            inference_ms = (time.perf_counter() - start) * 1000.0
+            cpu_ms = (time.process_time() - cpu_start) * 1000.0
+
+            # seqlock: 쓰기 전후로 카운터를 증가시켜 메인 프로세스가 찢어진 결과를 읽지 않게 합니다.
+            header[_HDR_WRITE_SEQ] += 1
+            has_landmarks = res.pose_landmarks is not None
+            if has_landmarks:
+                landmarks_to_array(res.pose_landmarks, landmarks)
+            has_mask = segmentation_mask is not None
+            if has_mask:
+                np.copyto(mask, segmentation_mask)
+            header[_HDR_FRAME_SEQ] = frame_seq
+            header[_HDR_TIMESTAMP] = timestamp
+            header[_HDR_HAS_LANDMARKS] = 1.0 if has_landmarks else 0.0
+            header[_HDR_HAS_MASK] = 1.0 if has_mask else 0.0
+            header[_HDR_INFERENCE_MS] = inference_ms
+            header[_HDR_CPU_MS] = cpu_ms
+            header[_HDR_WRITE_SEQ] += 1
+    finally:
+        pose.close()
+        if segmenter is not None:
+            segmenter.close()
+        del frames, header, landmarks, mask
+        frame_shm.close()
+        result_shm.close()
+
+
+class PoseInferenceWorker:
+    """MediaPipe 포즈 추론을 전담하는 프로세스와 공유 메모리 버퍼를 관리하는 클래스"""
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        pose_options: Dict[str, Any],
+        ring_size: int = 3,
+        segmentation_options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Args:
+            width: 프레임 너비
+            height: 프레임 높이
+            pose_options: mp.solutions.pose.Pose 생성 인자
+            ring_size: 프레임 링 슬롯 수 (최소 2)
+            segmentation_options: mp.solutions.selfie_segmentation.SelfieSegmentation 생성 인자
+        """
+        self.width = int(width)
+        self.height = int(height)
+        self.pose_options = dict(pose_options)
+        self.segmentation_options = dict(segmentation_options or {})
+        self.ring_size = max(2, int(ring_size))
+
+        self._frame_shm: Optional[shared_memory.SharedMemory] = None
+        self._result_shm: Optional[shared_memory.SharedMemory] = None
+        self._frames: Optional[np.ndarray] = None
+        self._header: Optional[np.ndarray] = None
+        self._landmarks: Optional[np.ndarray] = None
+        self._mask: Optional[np.ndarray] = None
+
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._requests: Any = None
+        self._stop_event: Any = None
+
+        self._submitted_seq: int = 0
+        self._completed_seq: int = 0
+        self._last_write_seq: float = 0.0
+
+        # 메인 측 결과 사본 (재사용 버퍼). 복사는 scratch에 하고 검증 후 교체하여,
+        # 찢어진 읽기가 이미 반환한 결과를 덮어쓰지 않게 합니다.
+        self._landmarks_out = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+        self._landmarks_scratch = np.zeros_like(self._landmarks_out)
+        self._mask_out = np.zeros((self.height, self.width), dtype=np.float32)
+        self._mask_scratch = np.zeros_like(self._mask_out)
+
+        self.last_inference_ms: float = 0.0
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """공유 메모리를 할당하고 워커 프로세스를 시작합니다."""
+        if self._process is not None:
+            return
+        frame_nbytes = self.ring_size * self.height * self.width * 3
+        self._frame_shm = shared_memory.SharedMemory(create=True, size=frame_nbytes)
+        self._result_shm = shared_memory.SharedMemory(create=True, size=_result_nbytes(self.width, self.height))
+        self._frames = np.ndarray(
+            (self.ring_size, self.height, self.width, 3), dtype=np.uint8, buffer=self._frame_shm.buf
+        )
+        self._header, self._landmarks, self._mask = _result_views(self._result_shm.buf, self.width, self.height)
+        self._header[:] = 0.0
+
+        # mediapipe는 fork 이후 안전하지 않으므로 spawn 컨텍스트를 사용합니다.
+        ctx = multiprocessing.get_context("spawn")
+        self._requests = ctx.Queue()
+        self._stop_event = ctx.Event()
+        self._process = ctx.Process(
+            target=_worker_main,
+            name="PoseInferenceWorker",
+            args=(
+                self._frame_shm.name,
+                self._result_shm.name,
+                self.width,
+                self.height,
+                self.ring_size,
+                self.pose_options,
+                self.segmentation_options,
+                self._requests,
+                self._stop_event,
+            ),
+            daemon=True,
+        )
+        self._process.start()
+        logger.info(f"포즈 추론 워커 시작 (pid={self._process.pid}, {self.width}x{self.height}, ring={self.ring_size})")
+
+    def can_submit(self) -> bool:
+        """워커가 새 프레임을 받을 수 있는지 확인합니다.
+
+        처리 중인 프레임 외에 대기 프레임은 최대 1개만 허용하여, 링 슬롯이 읽히는 도중 덮어쓰이지 않게 합니다.
+        """
+        return self._submitted_seq - self._completed_seq < self.ring_size - 1
+
+    def next_frame_buffer(self, size: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        """다음 제출에 사용할 링 슬롯 (RGB, H x W x 3) 뷰를 반환합니다.
+
+        size (width, height)를 주면 슬롯보다 작은 입력(ROI)용 연속 뷰를 반환하며, submit에도 같은 size를 넘겨야 합니다.
+        """
+        assert self._frames is not None
+        return _slot_view(self._frames, (self._submitted_seq + 1) % self.ring_size, self._slot_size(size))
+
+    def _slot_size(self, size: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+        if size is None or (int(size[0]), int(size[1])) == (self.width, self.height):
+            return None
+        if size[0] * size[1] > self.width * self.height:
+            raise ValueError(f"입력 크기 {size}가 링 슬롯 ({self.width}, {self.height})보다 큽니다")
+        return (int(size[0]), int(size[1]))
+
+    def submit(self, timestamp: float, want_mask: bool = False, size: Optional[Tuple[int, int]] = None) -> int:
+        """next_frame_buffer()에 채운 프레임을 워커에 제출하고 프레임 순번을 반환합니다.
+
+        want_mask가 True인 프레임에서만 세그멘테이션 마스크를 계산합니다 (전체 크기 입력일 때만).
+        """
+        self._submitted_seq += 1
+        slot = self._submitted_seq % self.ring_size
+        self._requests.put((slot, self._submitted_seq, timestamp, bool(want_mask), self._slot_size(size)))
+        return self._submitted_seq
+
+    def reconfigure(self, pose_options: Dict[str, Any]) -> None:
+        """워커의 포즈 모델 설정(모델 복잡도 등)을 바꿉니다. 이미 제출된 프레임은 이전 설정으로 처리됩니다."""
+        self.pose_options = dict(pose_options)
+        if self._requests is not None:
+            self._requests.put(("reconfigure", self.pose_options))
+
+    def poll(self) -> Optional[PoseResult]:
+        """새 결과가 있으면 반환합니다. 대기하지 않습니다."""
+        if self._header is None:
+            return None
+        write_seq = self._header[_HDR_WRITE_SEQ]
+        if write_seq == self._last_write_seq or int(write_seq) % 2 == 1:
+            return None
+
+        frame_seq = int(self._header[_HDR_FRAME_SEQ])
+        timestamp = float(self._header[_HDR_TIMESTAMP])
+        has_landmarks = self._header[_HDR_HAS_LANDMARKS] > 0.5
+        has_mask = self._header[_HDR_HAS_MASK] > 0.5
+        inference_ms = float(self._header[_HDR_INFERENCE_MS])
+        cpu_ms = float(self._header[_HDR_CPU_MS])
+        if has_landmarks:
+            np.copyto(self._landmarks_scratch, self._landmarks)
+        if has_mask:
+            np.copyto(self._mask_scratch, self._mask)
+
+        # 복사하는 동안 워커가 다시 썼다면 이번 결과는 버리고 다음 업데이트에서 다시 읽습니다.
+        if self._header[_HDR_WRITE_SEQ] != write_seq:
+            return None
+
+        if has_landmarks:
+            self._landmarks_out, self._landmarks_scratch = self._landmarks_scratch, self._landmarks_out
+        if has_mask:
+            self._mask_out, self._mask_scratch = self._mask_scratch, self._mask_out
+        self._last_write_seq = write_seq
+        self._completed_seq = max(self._completed_seq, frame_seq)
+        self.last_inference_ms = inference_ms
+        return PoseResult(
+            frame_seq,
+            timestamp,
+            self._landmarks_out if has_landmarks else None,
+            self._mask_out if has_mask else None,
+            inference_ms,
+            cpu_ms,
+        )
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """워커 프로세스를 종료하고 공유 메모리를 해제합니다."""
+        if self._process is not None:
+            self._stop_event.set()
+            try:
+                self._requests.put_nowait(None)
+            except Exception:
+                pass
+            self._process.join(timeout)
+            if self._process.is_alive():
+                logger.warning("포즈 추론 워커가 제시간에 종료되지 않아 강제 종료합니다.")
+                self._process.terminate()
+                self._process.join(timeout)
+            self._process = None
+
+        self._frames = None
+        self._header = None
+        self._landmarks = None
+        self._mask = None
+        for shm in (self._frame_shm, self._result_shm):
+            if shm is None:
+                continue
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._frame_shm = None
+        self._result_shm = None
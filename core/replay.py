@@ -0,0 +1,343 @@
+"""
+리플레이 모듈
+기록된 플레이(히트 이벤트 또는 픽셀 좌표 랜드마크 스트림)를 비트맵과 함께 창/렌더링/오디오 없이 다시 판정해
+판정 기록과 점수 변화를 만듭니다. 판정 규칙을 바꿨을 때의 회귀 확인, 서버에서 기록을 일괄 재채점하는 용도입니다.
+
+GameScene과 같은 NoteManager / JudgmentProcessor / JudgmentScheduler / ScoreManager / GameState를 그대로 쓰고,
+이펙트와 좌표/색상 변환만 빈 구현으로 바꿉니다. 시간은 기록된 시각으로만 진행하므로 (벽시계를 읽지 않음)
+같은 입력이면 항상 같은 결과가 나오고, 프레임 사이를 기다리지 않으므로 실제 시간보다 빠르게 끝납니다.
+
+- 이벤트 스트림: tick_s 간격의 가상 프레임마다 t_hit가 지난 이벤트를 전달합니다.
+- 랜드마크 스트림: 프레임마다 PoseAnalyzer(PoseTracker의 분석 단계)로 이벤트를 감지하고,
+  같은 분석기를 판정의 pose_tracker로 넘겨 위빙/유지 동작도 게임과 같은 방식으로 판정합니다.
+
+사용법:
+    python -m core.replay session.json [--level Normal] [--timeline]
+"""
+import argparse
+import json
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.beatmap_loader import BeatmapLoader
+from core.config_manager import ConfigManager
+from core.game_state import GameState
+from core.judgment_processor import JudgmentProcessor
+from core.judgment_records import PHASE_EXIT, HitEvent, Judgment, NoteType
+from core.judgment_scheduler import JudgmentScheduler
+from core.note_manager import NoteManager
+from core.pose_analyzer import PoseAnalyzer
+from core.score_manager import ScoreManager
+
+
+class ReplaySession(NamedTuple):
+    """기록된 플레이 한 판
+
+    시각은 게임과 같은 기준(time.time())의 절대 시각입니다. song_start_time은 0보다 커야 합니다.
+    events와 frames 중 하나를 씁니다 (frames가 있으면 frames에서 이벤트를 감지).
+    """
+    beatmap: List[Dict[str, Any]]
+    song_start_time: float
+    events: List[HitEvent] = []
+    frames: List[Tuple[float, Optional[np.ndarray]]] = []  # (캡처 시각, 픽셀 좌표 랜드마크 (33, 4) 또는 None)
+    frame_size: Tuple[int, int] = (640, 480)
+    calib_data: Optional[Dict[str, Any]] = None
+    level: Optional[str] = None
+
+
+class ScorePoint(NamedTuple):
+    """판정 직후의 점수 상태"""
+    game_time: float
+    score: int
+    combo: int
+
+
+class ReplayResult(NamedTuple):
+    """리플레이 결과"""
+    judgments: List[Judgment]  # 판정 순서 (Judgment.t는 절대 시각)
+    scores: List[ScorePoint]  # judgments와 같은 순서 (같은 프레임의 판정은 그 프레임이 끝난 뒤의 상태)
+    score: int
+    max_combo: int
+    game_seconds: float  # 재생한 게임 시간
+    wall_seconds: float  # 재생에 걸린 실제 시간
+
+    def counts(self) -> Dict[str, int]:
+        """판정 결과별 개수"""
+        counts: Dict[str, int] = {}
+        for judgment in self.judgments:
+            counts[judgment.result] = counts.get(judgment.result, 0) + 1
+        return counts
+
+
+class _NullEffects:
+    """히트 이펙트를 만들지 않는 HitEffectSystem 대체"""
+
+    def spawn_effect(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _emitted_at(event: HitEvent) -> float:
+    """동작 감지기가 이벤트를 낸 시각 (종료 이벤트는 유지가 끝난 시각)"""
+    return event.t_hit + event.duration if event.phase == PHASE_EXIT else event.t_hit
+
+
+class ReplayEngine:
+    """헤드리스 판정/채점 엔진"""
+
+    def __init__(
+        self,
+        config_rules: Dict[str, Any],
+        config_ui: Dict[str, Any],
+        judge_timing: Dict[str, float],
+        pre_spawn_time: float,
+        score_multiplier: float = 1.0,
+        tick_s: float = 1.0 / 60.0,
+    ) -> None:
+        """
+        Args:
+            config_rules: rules.json 설정
+            config_ui: ui.json 설정 (히트존 위치)
+            judge_timing: 판정 창 (perfect/great/good)
+            pre_spawn_time: 노트가 판정 시각보다 먼저 생성되는 시간
+            score_multiplier: 난이도 점수 배율
+            tick_s: 이벤트 스트림을 재생할 때의 가상 프레임 간격
+        """
+        self.config_rules = config_rules
+        self.config_ui = config_ui
+        self.judge_timing = judge_timing
+        self.pre_spawn_time = pre_spawn_time
+        self.score_multiplier = score_multiplier
+        self.tick_s = tick_s
+        self.timing_offset = float(config_rules.get("timing_offset", 0.0))
+        self.score_values: Dict[str, int] = config_rules.get("score_base", {})
+
+    @classmethod
+    def from_config(cls, config: ConfigManager, level: Optional[str] = None, **kwargs: Any) -> "ReplayEngine":
+        """설정 파일과 난이도로 엔진을 만듭니다 (GameScene과 같은 판정 창/점수 배율)."""
+        level = level or config.difficulty.get("default", "Normal")
+        difficulty = config.get_difficulty_settings(level)
+        return cls(
+            config.rules,
+            config.ui,
+            config.get_judge_timing(level),
+            float(difficulty.get("pre_spawn_time", 1.2)),
+            float(difficulty.get("score_multiplier", 1.0)),
+            **kwargs,
+        )
+
+    def run(self, session: ReplaySession) -> ReplayResult:
+        """세션 하나를 처음부터 끝까지 판정합니다."""
+        if session.song_start_time <= 0:
+            raise ValueError("song_start_time은 0보다 큰 절대 시각이어야 합니다.")
+        started = time.perf_counter()
+        run = _ReplayRun(self, session)
+        if session.frames:
+            run.play_frames(session.frames)
+        else:
+            run.play_events(session.events)
+        run.finish()
+        state = run.game_state
+        return ReplayResult(
+            run.judgments,
+            run.scores,
+            state.score,
+            state.max_combo,
+            run.now - session.song_start_time,
+            time.perf_counter() - started,
+        )
+
+
+class _ReplayRun:
+    """세션 한 번의 재생 상태 (GameScene.update의 판정 부분과 같은 순서로 진행)"""
+
+    def __init__(self, engine: ReplayEngine, session: ReplaySession) -> None:
+        self.engine = engine
+        self.session = session
+        self.beatmap = sorted(session.beatmap, key=lambda item: item.get("t", 0.0))
+        self.beatmap_index = 0
+        self.song_start_time = session.song_start_time
+        self.now = session.song_start_time
+
+        width, height = session.frame_size
+        hit_ratio = engine.config_ui.get("positions", {}).get("hit_zone", {}).get("pos_ratio", [0.5, 0.3])
+        hit_zone_camera = (int(width * hit_ratio[0]), int(height * hit_ratio[1]))
+        self.hit_zone_camera = hit_zone_camera
+
+        self.pose: Optional[PoseAnalyzer] = None
+        if session.frames:
+            self.pose = PoseAnalyzer(width, height, engine.config_rules, engine.config_ui)
+            if session.calib_data:
+                self.pose.calib_data.update(session.calib_data)
+
+        self.game_state = GameState()
+        self.game_state.song_start_time = session.song_start_time
+        self.note_manager = NoteManager(width, height, engine.pre_spawn_time, {}, engine.judge_timing, False)
+        self.score_manager = ScoreManager(engine.score_values, engine.score_multiplier, self.game_state)
+        # 창 크기 = 원본 크기 (x_scale = y_scale = 1)로 판정합니다. 위빙 영역은 카메라 좌표로 환산되므로 창 크기와 무관합니다.
+        self.processor = JudgmentProcessor(
+            engine.judge_timing,
+            self.score_manager,
+            _NullEffects(),
+            None,
+            self.pose,
+            width,
+            height,
+            _identity,
+            _identity,
+            {},
+            hit_zone_camera,
+            note_index=self.note_manager.index,
+            config_rules=engine.config_rules,
+        )
+        self.scheduler = JudgmentScheduler(self.processor, self.note_manager)
+
+        self.judgments: List[Judgment] = []
+        self.scores: List[ScorePoint] = []
+        # HUD용 judge_log는 최근 몇 개만 남기므로, 판정 기록은 GameState의 리스너로 빠짐없이 받습니다.
+        self._pending: List[Judgment] = []
+        self.game_state.judgement_listener = self._pending.append
+
+    # ------------------------------------------------------------------ #
+    # 진행
+    # ------------------------------------------------------------------ #
+    def play_events(self, events: Sequence[HitEvent]) -> None:
+        """tick_s 간격으로 시간을 진행하며 발생 시각이 지난 이벤트를 전달합니다. 곡 시작 전(카운트다운) 이벤트는 버립니다.
+
+        유지형 동작의 종료 이벤트는 t_hit가 시작 시각이므로 시작 시각 + 유지 시간에 전달합니다.
+        """
+        events = sorted((e for e in events if e.t_hit >= self.song_start_time), key=_emitted_at)
+        tick = self.engine.tick_s
+        i = 0
+        frame = 0
+        while i < len(events):
+            now = self.song_start_time + frame * tick
+            frame += 1
+            start = i
+            while i < len(events) and _emitted_at(events[i]) <= now:
+                i += 1
+            self.step(now, events[start:i])
+
+    def play_frames(self, frames: Iterable[Tuple[float, Optional[np.ndarray]]]) -> None:
+        """기록된 프레임마다 동작을 감지하고 판정합니다. 곡 시작 전 프레임은 추적만 갱신합니다."""
+        for timestamp, landmarks in frames:
+            hit_events = self.pose.analyze_landmarks(landmarks, timestamp)
+            if timestamp >= self.song_start_time:
+                self.step(timestamp, hit_events)
+
+    def finish(self) -> None:
+        """입력이 끝난 뒤 남은 노트가 모두 판정될 때까지 시간을 진행합니다 (치지 않은 노트는 MISS/AVOID)."""
+        tick = self.engine.tick_s
+        while not self.note_manager.is_chart_completed(self.beatmap_index, len(self.beatmap)):
+            self.step(self.now + tick, [])
+
+    def step(self, now: float, hit_events: List[HitEvent]) -> None:
+        """가상 프레임 하나: 노트 생성 → 판정 → 새 판정 기록 수집"""
+        self.now = max(self.now, now)
+        game_time = self.now - self.song_start_time
+        self._spawn_notes(game_time)
+        self.scheduler.update(game_time, hit_events, self.song_start_time, self.engine.timing_offset, self.now)
+        if self._pending:
+            self.judgments.extend(self._pending)
+            point = ScorePoint(game_time, self.game_state.score, self.game_state.combo)
+            self.scores.extend([point] * len(self._pending))
+            self._pending.clear()
+
+    def _spawn_notes(self, game_time: float) -> None:
+        pre_spawn = self.engine.pre_spawn_time
+        while self.beatmap_index < len(self.beatmap):
+            item = self.beatmap[self.beatmap_index]
+            if game_time < item.get("t", 0.0) - pre_spawn:
+                break
+            self.note_manager.spawn_note(item, *self.session.frame_size, self.hit_zone_camera)
+            self.beatmap_index += 1
+
+
+# ---------------------------------------------------------------------- #
+# 세션 파일 (JSON)
+# ---------------------------------------------------------------------- #
+def load_session(path: str, config: Optional[ConfigManager] = None) -> ReplaySession:
+    """세션 JSON을 읽습니다.
+
+    {
+      "song_start_time": 1700000000.0,
+      "beatmap": "assets/beatmaps/song1" 또는 [{"t": 1.0, "type": "JAB_L"}, ...],
+      "level": "Normal", "frame_size": [640, 480], "calib": {"shoulder_w": 220, "duck_line_y": 300},
+      "events": [{"type": "JAB_L", "t_hit": 1700000001.02}, ...],
+      "frames": [[1700000000.5, [[x, y, z, visibility] x 33] 또는 null], ...]
+    }
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    beatmap = data.get("beatmap", [])
+    if isinstance(beatmap, str):
+        config = config or ConfigManager()
+        beatmap = BeatmapLoader(config.difficulty).load_beatmap(beatmap)
+    events = [
+        HitEvent(NoteType.parse(e["type"]), float(e["t_hit"]), e.get("phase"), float(e.get("duration", 0.0)))
+        for e in data.get("events", [])
+    ]
+    frames = [
+        (float(t), np.asarray(landmarks, dtype=np.float32) if landmarks is not None else None)
+        for t, landmarks in data.get("frames", [])
+    ]
+    return ReplaySession(
+        beatmap,
+        float(data["song_start_time"]),
+        events,
+        frames,
+        tuple(data.get("frame_size", (640, 480))),
+        data.get("calib"),
+        data.get("level"),
+    )
+
+
+def dump_session(session: ReplaySession, path: str) -> None:
+    """세션을 load_session이 읽는 JSON으로 저장합니다."""
+    data = {
+        "song_start_time": session.song_start_time,
+        "beatmap": session.beatmap,
+        "level": session.level,
+        "frame_size": list(session.frame_size),
+        "calib": session.calib_data,
+        "events": [
+            {"type": e.type.name, "t_hit": e.t_hit, "phase": e.phase, "duration": e.duration}
+            for e in session.events
+        ],
+        "frames": [[t, landmarks.tolist() if landmarks is not None else None] for t, landmarks in session.frames],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="기록된 플레이를 헤드리스로 다시 판정/채점")
+    parser.add_argument("sessions", nargs="+", help="세션 JSON 파일")
+    parser.add_argument("--config", default="config")
+    parser.add_argument("--level", default=None, help="난이도 (기본: 세션에 기록된 난이도, 없으면 설정 기본값)")
+    parser.add_argument("--timeline", action="store_true", help="판정 기록을 함께 출력")
+    args = parser.parse_args()
+
+    config = ConfigManager(args.config)
+    engines: Dict[Optional[str], ReplayEngine] = {}
+    for path in args.sessions:
+        session = load_session(path, config)
+        level = args.level or session.level
+        if level not in engines:
+            engines[level] = ReplayEngine.from_config(config, level)
+        result = engines[level].run(session)
+        speed = result.game_seconds / result.wall_seconds if result.wall_seconds > 0 else float("inf")
+        counts = " ".join(f"{k}={v}" for k, v in sorted(result.counts().items()))
+        print(f"{path}: score={result.score} max_combo={result.max_combo} {counts} ({speed:.0f}x realtime)")
+        if args.timeline:
+            for judgment, point in zip(result.judgments, result.scores):
+                print(f"  {judgment.t - session.song_start_time:8.3f}s {judgment} score={point.score} combo={point.combo}")
+
+
+if __name__ == "__main__":
+    main()
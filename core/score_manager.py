@@ -5,6 +5,7 @@
 from typing import Dict, Optional
 
 from core.game_state import GameState
+from core.judgment_records import NoteType
 
 
 class ScoreManager:
@@ -23,7 +24,7 @@ class ScoreManager:
     def register_hit(
         self,
         judgement: str,
-        note_type: str,
+        note_type: NoteType,
         delta: float,
         now: float
     ) -> int:
@@ -52,7 +53,7 @@ class ScoreManager:
         
         return gained
     
-    def register_miss(self, note_type: str, now: float) -> None:
+    def register_miss(self, note_type: NoteType, now: float) -> None:
         """
         미스 판정을 등록합니다.
         
@@ -62,4 +63,17 @@ class ScoreManager:
         """
         self.game_state.record_judgement("MISS", note_type, 0.0, now)
         self.game_state.update_combo("MISS")
-
+    
+    def register_penalty(self, label: str, note_type: NoteType, points: int, now: float) -> None:
+        """
+        감점 판정(예: 폭탄)을 등록합니다. 콤보는 끊기고 점수는 0 아래로 내려가지 않습니다.
+        
+        Args:
+            label: 판정 표시 (예: "BOMB!")
+            note_type: 노트 타입
+            points: 점수 변화량 (음수)
+            now: 현재 시간
+        """
+        self.game_state.record_judgement(label, note_type, 0.0, now)
+        self.game_state.update_combo("MISS")
+        self.game_state.score = max(0, self.game_state.score + int(points))
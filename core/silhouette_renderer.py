@@ -1,6 +1,7 @@
 """
 실루엣 렌더러 모듈
 MediaPipe 세그멘테이션 마스크를 사용하여 실루엣 외곽선을 그립니다.
+마스크가 없을 때는 랜드마크 볼록 껍질(convex hull)로 간단한 외곽선을 그립니다.
 """
 from typing import Callable, Optional, Tuple
 
@@ -19,7 +20,9 @@ class SilhouetteRenderer:
         window_width: int,
         window_height: int,
         color: Tuple[int, int, int] = arcade.color.WHITE,
-        line_width: int = 3
+        line_width: int = 3,
+        source_size: Optional[Tuple[int, int]] = None,
+        flip_x: bool = False
     ) -> None:
         """
         세그멘테이션 마스크에서 실루엣 외곽선을 추출하여 그립니다.
@@ -31,6 +34,9 @@ class SilhouetteRenderer:
             window_height: 윈도우 높이
             color: 외곽선 색상
             line_width: 외곽선 두께
+            source_size: 카메라 좌표계 크기 (width, height). 마스크가 추론 해상도로 축소되어 있으면
+                외곽선 좌표를 이 크기로 환산합니다.
+            flip_x: 마스크가 카메라(반전 전) 좌표계이면 True. 화면 기준으로 좌우 반전합니다.
         """
         if mask is None:
             return
@@ -63,11 +69,20 @@ class SilhouetteRenderer:
             # 가장 큰 외곽선 선택 (인물 전체 실루엣)
             largest_contour = max(contours, key=cv2.contourArea)
             
+            # 마스크 좌표 -> 카메라 좌표 배율 (추론 해상도가 원본과 다를 때)
+            scale_x = scale_y = 1.0
+            if source_size:
+                scale_x = source_size[0] / mask.shape[1]
+                scale_y = source_size[1] / mask.shape[0]
+            
             # OpenCV 좌표를 Arcade 좌표로 변환
             arcade_points = []
+            mask_width = mask.shape[1]
             for point in largest_contour:
                 x_cam, y_cam = point[0]
-                x_arc, y_arc = coord_converter((x_cam, y_cam))
+                if flip_x:
+                    x_cam = mask_width - 1 - x_cam
+                x_arc, y_arc = coord_converter((x_cam * scale_x, y_cam * scale_y))
                 arcade_points.append((x_arc, y_arc))
             
             # 외곽선 그리기
@@ -80,3 +95,33 @@ class SilhouetteRenderer:
             # 실루엣 렌더링 실패는 게임에 치명적이지 않으므로 조용히 처리
             pass
 
+    @staticmethod
+    def draw_landmark_hull(
+        landmarks: Optional[np.ndarray],
+        coord_converter: Callable[[Tuple[float, float]], Tuple[float, float]],
+        color: Tuple[int, int, int] = arcade.color.WHITE,
+        line_width: int = 3,
+        min_visibility: float = 0.5
+    ) -> None:
+        """
+        세그멘테이션 마스크 없이 랜드마크의 볼록 껍질로 실루엣 외곽선을 그립니다.
+        
+        Args:
+            landmarks: 픽셀 좌표 (33, 4) 랜드마크 배열 (x, y, z, visibility)
+            coord_converter: 카메라 좌표를 Arcade 좌표로 변환하는 함수
+            color: 외곽선 색상
+            line_width: 외곽선 두께
+            min_visibility: 외곽선에 포함할 랜드마크의 최소 visibility
+        """
+        if landmarks is None:
+            return
+        
+        visible = landmarks[landmarks[:, 3] >= min_visibility, :2]
+        if len(visible) < 3:
+            return
+        
+        hull = cv2.convexHull(np.ascontiguousarray(visible, dtype=np.float32))
+        
+        arcade_points = [coord_converter((x, y)) for x, y in hull[:, 0].tolist()]
+        arcade_points.append(arcade_points[0])
+        arcade.draw_line_strip(arcade_points, color, line_width)
@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 import sys
 
@@ -9,8 +10,8 @@ if os.path.isdir(DEPS_PATH) and DEPS_PATH not in sys.path:
     sys.path.insert(0, DEPS_PATH)
 
 import arcade
-import cv2
 
+from core.frame_path import LatencyMonitor, get_allocation_counter
 from core.game_factory import GameFactory, resource_path
 from scenes.calibration_scene import CalibrationScene
 from scenes.game_scene import GameScene
@@ -19,6 +20,7 @@ from scenes.result_scene import ResultScene
 
 if TYPE_CHECKING:
     from core.audio_manager import AudioManager
+    from core.frame_source import FrameSource
     from core.pose_tracker import PoseTracker
 
 
@@ -33,7 +35,7 @@ class GameWindow(arcade.Window):
         config: Dict[str, Any],
         audio_manager: Optional[Any],
         pose_tracker: Optional[Any],
-        capture: Optional[cv2.VideoCapture],
+        frame_source: Optional["FrameSource"],
         source_width: int,
         source_height: int,
     ) -> None:
@@ -41,9 +43,13 @@ class GameWindow(arcade.Window):
         self.app_config = config
         self.audio_manager = audio_manager
         self.pose_tracker = pose_tracker
-        self.capture = capture
+        self.frame_source = frame_source
         self.source_width = source_width
         self.source_height = source_height
+        self._last_frame_seq: int = 0
+        self._last_result_seq: int = 0
+        # 프레임 캡처 시각 → 판정(현재 씬 업데이트 완료)까지의 지연
+        self.pipeline_latency = LatencyMonitor()
 
         self.update_data: Dict[str, Any] = {
             "frame": None,
@@ -51,6 +57,8 @@ class GameWindow(arcade.Window):
             "landmarks": None,
             "mask": None,
             "now": time.time(),
+            "frame_alloc_bytes": 0,
+            "pipeline_latency_ms": 0.0,
         }
         self._current_scene_name: Optional[str] = None
 
@@ -107,26 +115,34 @@ class GameWindow(arcade.Window):
     # ---------------------------------------------------------------------- #
     def on_update(self, delta_time: float) -> None:
         """카메라 프레임과 포즈 정보를 갱신하고 현재 뷰에 전달합니다."""
-        frame = None
+        frame = self.update_data["frame"]
         hit_events = []
-        landmarks = None
-        mask = None
+        landmarks = self.update_data["landmarks"]
+        mask = self.update_data["mask"]
         now = time.time()
 
-        if self.capture is not None:
-            ret, source_frame = self.capture.read()
-            if ret:
-                frame = cv2.flip(source_frame, 1)
-            else:
-                print("[경고] 카메라 프레임을 읽지 못했습니다.")
-
-        if self.pose_tracker is not None and frame is not None:
+        # 프레임 소스의 최신 프레임만 가져옵니다 (대기 없음). 새 프레임이 없으면 이전 결과를 유지합니다.
+        new_frame = None
+        captured_at = None
+        captured = self.frame_source.latest() if self.frame_source is not None else None
+        if captured is not None and captured.seq != self._last_frame_seq:
+            self._last_frame_seq = captured.seq
+            # 화면에 카메라 영상을 그리지 않으므로 프레임을 복사/반전하지 않고 그대로 넘깁니다.
+            # 좌우 반전은 PoseTracker가 랜드마크 좌표에서 처리합니다.
+            frame = captured.image
+            new_frame = frame
+            captured_at = captured.timestamp
+
+        # 비동기(워커 프로세스) 추론은 새 프레임이 없어도 결과를 폴링합니다.
+        if self.pose_tracker is not None and (new_frame is not None or self.pose_tracker.is_async):
             try:
-                pose_frame = frame.copy()
-                hit_events, landmarks, mask = self.pose_tracker.process_frame(pose_frame, now)
+                hit_events, landmarks, mask = self.pose_tracker.process_frame(new_frame, now, captured_at)
             except Exception as exc:
                 print(f"[경고] PoseTracker 업데이트 실패: {exc}")
 
+        if new_frame is not None:
+            self.update_data["frame_alloc_bytes"] = get_allocation_counter().end_frame()
+
         self.update_data.update(
             {
                 "frame": frame,
@@ -142,6 +158,7 @@ class GameWindow(arcade.Window):
             return
 
         current_view.update(delta_time, **self.update_data)
+        self._record_pipeline_latency()
 
         next_scene = getattr(current_view, "next_scene_name", None)
         if next_scene:
@@ -150,6 +167,17 @@ class GameWindow(arcade.Window):
                 persistent = current_view.cleanup()  # type: ignore[assignment]
             self._switch_scene(next_scene, persistent)
 
+    def _record_pipeline_latency(self) -> None:
+        """새 포즈 결과가 이번 업데이트에서 판정되었다면 캡처→판정 지연을 기록합니다."""
+        pose_tracker = self.pose_tracker
+        if pose_tracker is None or pose_tracker.result_seq == self._last_result_seq:
+            return
+        self._last_result_seq = pose_tracker.result_seq
+        if pose_tracker.last_frame_timestamp is None:
+            return
+        self.pipeline_latency.record((time.time() - pose_tracker.last_frame_timestamp) * 1000.0)
+        self.update_data["pipeline_latency_ms"] = self.pipeline_latency.last_ms
+
     def on_key_press(self, symbol: int, modifiers: int) -> None:
         if symbol == arcade.key.ESCAPE:
             print("[GameWindow] ESC pressed. Closing window.")
@@ -160,9 +188,12 @@ class GameWindow(arcade.Window):
             current_view.on_key_press(symbol, modifiers)
 
     def on_close(self) -> None:
-        if self.capture is not None:
-            self.capture.release()
-            self.capture = None
+        if self.frame_source is not None:
+            self.frame_source.stop()
+            self.frame_source = None
+        if self.pose_tracker is not None:
+            self.pose_tracker.close()
+            self.pose_tracker = None
         super().on_close()
 
 
@@ -183,8 +214,8 @@ def main() -> None:
     # 오디오 초기화
     audio_manager = GameFactory.create_audio_manager()
 
-    # 카메라 초기화
-    capture, source_width, source_height = GameFactory.create_camera()
+    # 프레임 소스 초기화 (카메라 / 영상 파일 / 합성 프레임)
+    frame_source, source_width, source_height = GameFactory.create_frame_source(config["rules"])
 
     # PoseTracker 초기화
     pose_tracker = GameFactory.create_pose_tracker(source_width, source_height, config)
@@ -199,7 +230,7 @@ def main() -> None:
         config=config,
         audio_manager=audio_manager,
         pose_tracker=pose_tracker,
-        capture=capture,
+        frame_source=frame_source,
         source_width=source_width,
         source_height=source_height,
     )
@@ -208,4 +239,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # PyInstaller 빌드에서 포즈 추론 워커 프로세스(spawn)를 지원합니다.
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
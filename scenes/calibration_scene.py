@@ -67,7 +67,7 @@ class CalibrationScene(BaseScene):
             return
 
         landmarks = kwargs.get("landmarks")
-        if not landmarks:
+        if landmarks is None:
             self.status_text = "신체 전체가 프레임 안에 들어오도록 서 주세요."
             self.hold_start = None
             self.last_nose_pos = None
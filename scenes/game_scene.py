@@ -17,6 +17,7 @@ from core.note_manager import NoteManager
 from core.beatmap_loader import BeatmapLoader
 from core.score_manager import ScoreManager
 from core.judgment_processor import JudgmentProcessor
+from core.judgment_scheduler import JudgmentScheduler
 from core.silhouette_renderer import SilhouetteRenderer
 from core.logger import get_logger
 from scenes.base_scene import BaseScene
@@ -77,6 +78,7 @@ class GameScene(BaseScene):
         self.note_manager: Optional[NoteManager] = None
         self.score_manager: Optional[ScoreManager] = None
         self.judgment_processor: Optional[JudgmentProcessor] = None
+        self.judgment_scheduler: Optional[JudgmentScheduler] = None
         self.hit_effect_system: HitEffectSystem = HitEffectSystem()
         self.last_update_time: float = 0.0
 
@@ -89,12 +91,17 @@ class GameScene(BaseScene):
         self.last_nose_pos: Optional[Tuple[float, float]] = None
         self.last_left_fist: Optional[Tuple[float, float]] = None
         self.last_right_fist: Optional[Tuple[float, float]] = None
+        self.last_mask = None
+        self.last_landmarks = None
 
     def on_resize(self, width: int, height: int) -> None:
         """창 크기 변경 시 배경을 다시 설정합니다."""
         super().on_resize(width, height)
         self.background_configured = False
         self._configure_background()
+        if self.judgment_processor:
+            # 판정 전략이 캐시한 화면 기하(위빙 라인 등)를 다시 계산
+            self.judgment_processor.set_viewport(width, height, self.x_scale, self.y_scale)
 
     def set_source_dimensions(self, width: int, height: int) -> None:
         super().set_source_dimensions(width, height)
@@ -136,10 +143,12 @@ class GameScene(BaseScene):
             
         # Initialize game
         self.beatmap_index = 0
-            self._update_strategy()
+        self._update_strategy()
             
         if self.pose_tracker:
             self.pose_tracker.set_test_mode(self.game_state.test_mode)
+            # 실루엣은 이 씬에서만 그리므로 세그멘테이션도 이 씬에서만 켭니다.
+            self.pose_tracker.set_segmentation_enabled(True)
         
         if self.audio_manager:
             music_path = os.path.join("assets", "beatmaps", "song1", "music.mp3")
@@ -180,8 +189,13 @@ class GameScene(BaseScene):
             self.hit_zone_camera,
             self.game_state.test_mode,
             self.x_scale,
-            self.y_scale
+            self.y_scale,
+            note_index=self.note_manager.index,
+            config_rules=self.config_rules
         )
+        
+        # Judgment Scheduler (히트 이벤트/위빙/유지 동작/미스를 한 번의 패스로 판정)
+        self.judgment_scheduler = JudgmentScheduler(self.judgment_processor, self.note_manager)
 
     def cleanup(self) -> Dict[str, Any]:
         self.persistent_data.update({
@@ -191,6 +205,8 @@ class GameScene(BaseScene):
             "final_score": self.game_state.score,
             "test_mode": self.game_state.test_mode,
         })
+        if self.pose_tracker:
+            self.pose_tracker.set_segmentation_enabled(False)
         return super().cleanup()
     
     def on_key_press(self, symbol: int, modifiers: int) -> None:
@@ -219,6 +235,8 @@ class GameScene(BaseScene):
         landmarks = kwargs.get("landmarks")
         mask = kwargs.get("mask")
         now = kwargs.get("now", time.time())
+        self.last_mask = mask
+        self.last_landmarks = landmarks
 
         # Update pose tracking
         if self.pose_tracker and frame is not None:
@@ -274,27 +292,15 @@ class GameScene(BaseScene):
         if self.mode_strategy and hit_events:
             self.mode_strategy.on_hit_events(hit_events, now)
         
-        if self.judgment_processor:
-            active_notes = self.note_manager.get_active_notes() if self.note_manager else []
-            self.judgment_processor.process_hit_events(
+        if self.judgment_scheduler:
+            # 판정된 노트는 스케줄러가 NoteManager에서 바로 제거합니다.
+            self.judgment_scheduler.update(
                 game_time,
                 hit_events,
-                active_notes,
                 self.game_state.song_start_time,
                 self.timing_offset,
                 now
             )
-            # 창 크기가 변경되었을 수 있으므로 스케일 업데이트
-            if self.judgment_processor:
-                self.judgment_processor.x_scale = self.x_scale
-                self.judgment_processor.y_scale = self.y_scale
-            
-            self.judgment_processor.process_weave_judgments(game_time, active_notes, now)
-            self.judgment_processor.process_misses(game_time, active_notes, now)
-        
-        # Cleanup hit notes
-        if self.note_manager:
-            self.note_manager.cleanup_hit_notes()
 
         # Update hit effect system
         if self.last_update_time > 0:
@@ -337,6 +343,9 @@ class GameScene(BaseScene):
         scaled_thickness = self.hit_zone_thickness * scale
         arcade.draw_circle_outline(hit_zone_x, hit_zone_y, int(scaled_radius), hit_color, int(scaled_thickness))
 
+        # Draw silhouette
+        self._draw_silhouette()
+
         # Draw Dodge lines
         self._draw_dodge_lines(width, height)
 
@@ -380,18 +389,40 @@ class GameScene(BaseScene):
             self.mode_strategy.draw_hud()
             self.mode_strategy.draw_additional(time.time())
 
+    def _draw_silhouette(self) -> None:
+        """세그멘테이션 마스크(없으면 랜드마크 외곽)로 플레이어 실루엣을 그립니다."""
+        if not self.source_width or not self.source_height:
+            return
+        if self.last_mask is not None:
+            SilhouetteRenderer.draw_silhouette(
+                self.last_mask,
+                self.to_arcade_xy,
+                self.window.width,
+                self.window.height,
+                source_size=(self.source_width, self.source_height),
+                flip_x=bool(self.pose_tracker and self.pose_tracker.mask_mirrored),
+            )
+        elif self.last_landmarks is not None:
+            SilhouetteRenderer.draw_landmark_hull(self.last_landmarks, self.to_arcade_xy)
+
     def _draw_pose_markers(self) -> None:
         """캘리브레이션 화면과 동일한 스타일로 랜드마크를 그립니다."""
         marker_radius = 8 * max(self.x_scale, self.y_scale, 1.0)
 
-        if self.last_nose_pos:
-            self._draw_marker(self.last_nose_pos, arcade.color.GOLD, marker_radius)
+        nose, right_fist, left_fist = self.last_nose_pos, self.last_right_fist, self.last_left_fist
+        # 포즈 결과는 파이프라인 지연만큼 늦으므로, 그리는 시각으로 예측한 위치를 사용합니다.
+        predicted = self.pose_tracker.predict(time.time()) if self.pose_tracker and nose else None
+        if predicted:
+            nose, right_fist, left_fist = predicted["nose"], predicted["right_fist"], predicted["left_fist"]
+
+        if nose:
+            self._draw_marker(nose, arcade.color.GOLD, marker_radius)
 
-        if self.last_right_fist:
-            self._draw_marker(self.last_right_fist, arcade.color.LIGHT_SKY_BLUE, marker_radius)
+        if right_fist:
+            self._draw_marker(right_fist, arcade.color.LIGHT_SKY_BLUE, marker_radius)
 
-        if self.last_left_fist:
-            self._draw_marker(self.last_left_fist, arcade.color.SALMON, marker_radius)
+        if left_fist:
+            self._draw_marker(left_fist, arcade.color.SALMON, marker_radius)
 
     def _draw_marker(self, pos: Tuple[float, float], color: Tuple[int, int, int], radius: float) -> None:
         """마커를 그립니다."""
@@ -12,6 +12,7 @@ class MainMenuScene(BaseScene):
         super().__init__(window, audio_manager, config, pose_tracker)
         self.title_text = "BEAT BOXER"
         self.start_text = "Press SPACE to Start"
+        self.loading_text = "Loading pose model..."
         self.key_press_time: float = 0.0
         self.title_color = arcade.color.WHITE
         self.start_color = arcade.color.WHITE
@@ -24,6 +25,10 @@ class MainMenuScene(BaseScene):
 
     def on_key_press(self, symbol: int, modifiers: int) -> None:
         if symbol == arcade.key.SPACE:
+            if not self._pose_ready():
+                # 포즈 모델 워밍업이 끝나기 전에는 캘리브레이션으로 넘어가지 않습니다 (첫 추론 지연 방지).
+                print("MainMenu: SPACE pressed while pose model is warming up. Ignored.")
+                return
             if self.pose_tracker is not None:
                 print("MainMenu: SPACE pressed. Switching to CALIBRATION scene.")
                 self.next_scene_name = "CALIBRATION"
@@ -33,6 +38,9 @@ class MainMenuScene(BaseScene):
             self.key_press_time = time.time()
             self.start_color = self.start_pressed_color
 
+    def _pose_ready(self) -> bool:
+        return self.pose_tracker is None or self.pose_tracker.ready
+
     def update(self, delta_time: float, **kwargs):
         super().update(delta_time, **kwargs)
         now = kwargs.get("now", time.time())
@@ -54,7 +62,7 @@ class MainMenuScene(BaseScene):
             anchor_y="center",
         )
         arcade.draw_text(
-            self.start_text,
+            self.start_text if self._pose_ready() else self.loading_text,
             width / 2,
             height / 2 - 40,
             self.start_color,
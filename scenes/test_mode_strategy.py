@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import arcade
 import mediapipe as mp
+import numpy as np
 
+from core.judgment_records import PHASE_EXIT
 from scenes.game_mode_strategy import GameModeStrategy
 
 mp_pose = mp.solutions.pose
@@ -15,13 +17,15 @@ class TestModeStrategy(GameModeStrategy):
         super().__init__(game_scene)
         self.event_history: list[tuple[str, float]] = []
         self.max_history = 20
-        self.last_judge_log_size = 0  # 판정 로그 크기 추적
+        self.judge_log_seen = 0  # 이벤트 히스토리에 반영한 판정 기록 누적 수
 
     def handle_hits(self, hit_events, t_game, now, **kwargs) -> None:
         """히트 이벤트를 받아서 이벤트 히스토리에 추가합니다."""
         if hit_events:
             for ev in hit_events:
-                event_type = ev.get("type", "UNKNOWN")
+                event_type = ev.type.name
+                if ev.phase == PHASE_EXIT:
+                    event_type = f"{event_type} end ({ev.duration:.2f}s)"
                 self.event_history.append((event_type, now))
             # 최대 개수 제한
             if len(self.event_history) > self.max_history:
@@ -40,6 +44,36 @@ class TestModeStrategy(GameModeStrategy):
             anchor_y="top",
             bold=True,
         )
+        # 프레임 경로 할당량 (정상 상태에서는 0이어야 함) / 캡처→판정 지연 / 랜드마크 예측 잔차 / 프레임당 판정 시간
+        alloc_bytes = self.game_scene.latest_inputs.get("frame_alloc_bytes", 0)
+        latency_ms = self.game_scene.latest_inputs.get("pipeline_latency_ms", 0.0)
+        head_resid, hand_resid = (
+            self.game_scene.pose_tracker.prediction_residual_px if self.game_scene.pose_tracker else (0.0, 0.0)
+        )
+        scheduler = self.game_scene.judgment_scheduler
+        judge_ms = scheduler.mean_ms if scheduler else 0.0
+        arcade.draw_text(
+            f"frame alloc: {alloc_bytes} B | capture->judge: {latency_ms:.0f} ms | "
+            f"predict resid head/hand: {head_resid:.0f}/{hand_resid:.0f} px | judge: {judge_ms:.2f} ms",
+            width / 2,
+            height - 70,
+            arcade.color.LIGHT_GRAY,
+            font_size=12,
+            anchor_x="center",
+            anchor_y="top",
+        )
+        # 동작 감지기별 평균 소요 시간
+        if self.game_scene.pose_tracker:
+            timings = self.game_scene.pose_tracker.gestures.timings_us
+            arcade.draw_text(
+                "gestures: " + " | ".join(f"{name} {us:.0f}us" for name, us in timings.items()),
+                width / 2,
+                height - 88,
+                arcade.color.LIGHT_GRAY,
+                font_size=12,
+                anchor_x="center",
+                anchor_y="top",
+            )
 
     def get_hit_zone_color(self, default_color):
         inside_left = self.game_scene.is_point_inside_hit_zone(self.game_scene.last_left_fist)
@@ -305,32 +339,22 @@ class TestModeStrategy(GameModeStrategy):
         )
         
         # 판정 로그 변경 사항을 이벤트 히스토리에 추가 (WEAVE_L, WEAVE_R 등 판정 결과 포함)
-        current_judge_log_size = len(game_scene.game_state.judge_log)
-        if current_judge_log_size > self.last_judge_log_size:
-            # 새로운 판정이 추가됨
-            judge_log_list = list(game_scene.game_state.judge_log)
-            new_entries = judge_log_list[self.last_judge_log_size:]
-            for entry in new_entries:
-                # 판정 로그 형식: "PERFECT (JAB_L) Δ=0.106" 또는 "MISS (WEAVE_R) Δ=0.000"
-                # 이벤트 히스토리에 추가 (간단한 형식으로)
-                if "(" in entry and ")" in entry:
-                    try:
-                        event_type = entry.split("(")[1].split(")")[0]
-                        self.event_history.append((event_type, now))
-                    except (IndexError, ValueError):
-                        # 파싱 실패 시 전체 항목 추가
-                        self.event_history.append((entry.split()[0] if entry.split() else "UNKNOWN", now))
-            self.last_judge_log_size = current_judge_log_size
+        judge_log = game_scene.game_state.judge_log
+        if judge_log.total != self.judge_log_seen:
+            # 새 판정 기록의 노트 타입을 이벤트 히스토리에 추가 (재시작으로 기록이 비워졌으면 처음부터)
+            if judge_log.total < self.judge_log_seen:
+                self.judge_log_seen = 0
+            for entry in judge_log.since(self.judge_log_seen):
+                self.event_history.append((entry.note_type.name, now))
+            self.judge_log_seen = judge_log.total
             # 최대 개수 제한
             if len(self.event_history) > self.max_history:
                 self.event_history = self.event_history[-self.max_history :]
         
-        # judge_log는 deque이므로 list로 변환
-        judge_log_list = list(game_scene.game_state.judge_log)
         # 헤더 영문이 log_start_y - 50이므로, 그 아래 여유 공간을 확보하여 더 아래로
-        for idx, entry in enumerate(judge_log_list):
+        for idx, entry in enumerate(judge_log):
             arcade.draw_text(
-                entry,
+                str(entry),
                 panel_start_x + 10,
                 log_start_y - 80 - idx * log_line_height,  # 헤더(한글+영문 2줄)와 간격 조정, 겹침 방지
                 arcade.color.LIGHT_GREEN,
@@ -397,7 +421,7 @@ class TestModeStrategy(GameModeStrategy):
         update_data = getattr(game_scene.window, 'update_data', {})
         landmarks = update_data.get('landmarks')
         
-        if not landmarks or not landmarks.landmark:
+        if landmarks is None:
             return
         
         # 스켈레톤 박스 설정 (중앙)
@@ -415,39 +439,18 @@ class TestModeStrategy(GameModeStrategy):
         ]
         arcade.draw_polygon_filled(box_points, (0, 0, 0, 180))  # 반 투명 검은색
         
-        # 랜드마크 추출
-        lm = landmarks.landmark
+        # 픽셀 좌표 랜드마크 배열 -> 스켈레톤 박스 내 좌표 (33개 한 번에 변환, visibility 체크 없음)
+        # 스케일 팩터를 조정하여 전체 몸이 보이도록, 박스 중앙 정렬 + 상하 반전
+        scale_factor = 0.25
+        xs = skeleton_box_x + skeleton_box_width / 2 + (landmarks[:, 0] - game_scene.source_width / 2) * scale_factor
+        ys = skeleton_box_y - skeleton_box_height / 2 - (landmarks[:, 1] - game_scene.source_height / 2) * scale_factor
         
-        # 좌표 변환 함수 (카메라 좌표 -> 스켈레톤 박스 내 좌표)
-        def to_skeleton_box(landmark):
-            if landmark is None:
-                return None
-            # visibility 체크 제거 - 가려진 랜드마크도 표시
-            # 랜드마크를 스켈레톤 박스 크기에 맞게 스케일링
-            # MediaPipe 좌표는 0-1 범위이므로 카메라 크기로 변환 후 박스 크기로 스케일
-            x_cam = landmark.x * game_scene.source_width
-            y_cam = landmark.y * game_scene.source_height
-            
-            # 박스 내부 좌표로 변환 (중앙 정렬, 상하 반전)
-            # 스케일 팩터를 조정하여 전체 몸이 보이도록
-            scale_factor = 0.25
-            x_box = skeleton_box_x + skeleton_box_width / 2 + (x_cam - game_scene.source_width / 2) * scale_factor
-            y_box = skeleton_box_y - skeleton_box_height / 2 - (y_cam - game_scene.source_height / 2) * scale_factor
-            
-            # 박스 범위 내로 제한
-            x_box = max(skeleton_box_x + 5, min(skeleton_box_x + skeleton_box_width - 5, x_box))
-            y_box = max(skeleton_box_y - skeleton_box_height + 5, min(skeleton_box_y - 5, y_box))
-            
-            # visibility 정보도 함께 반환
-            return (x_box, y_box, landmark.visibility)
+        # 박스 범위 내로 제한
+        xs = np.clip(xs, skeleton_box_x + 5, skeleton_box_x + skeleton_box_width - 5)
+        ys = np.clip(ys, skeleton_box_y - skeleton_box_height + 5, skeleton_box_y - 5)
         
-        # 모든 랜드마크를 박스 좌표로 변환 (33개 랜드마크 모두, visibility 체크 없음)
-        points = {}
-        for idx in range(len(lm)):
-            landmark = lm[idx]
-            result = to_skeleton_box(landmark)
-            if result:
-                points[idx] = result  # (x, y, visibility) 튜플
+        # (x, y, visibility) 튜플
+        points = dict(enumerate(zip(xs.tolist(), ys.tolist(), landmarks[:, 3].tolist())))
         
         # MediaPipe Pose 표준 연결 구조 사용 (33개 랜드마크 전체 연결)
         connections = mp_pose.POSE_CONNECTIONS
@@ -0,0 +1,31 @@
+"""
+테스트 공용 설정
+판정/동작 감지 로직은 창/카메라 없이 돌아가므로 실제 설정 파일로 그대로 검증합니다.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from core.config_manager import ConfigManager  # noqa: E402
+from core.replay import ReplayEngine  # noqa: E402
+
+# 리플레이 세션의 곡 시작 시각 (0이면 '시작 전'으로 취급되므로 임의의 양수 절대 시각)
+SONG_START = 1000.0
+
+
+@pytest.fixture(scope="session")
+def config() -> ConfigManager:
+    return ConfigManager(os.path.join(ROOT, "config"))
+
+
+@pytest.fixture
+def engine(config: ConfigManager) -> ReplayEngine:
+    engine = ReplayEngine.from_config(config, "Normal")
+    # timing_offset은 기기별 고정 지연 보정값이므로, 판정 규칙 테스트는 보정 없이 기록된 시각 그대로 판정합니다.
+    engine.timing_offset = 0.0
+    return engine
@@ -0,0 +1,102 @@
+"""동작 감지기 (훅/어퍼컷은 모션 기록의 손목 속도 사용)"""
+import numpy as np
+import pytest
+
+from core.gestures import GestureDetector, GestureFrame, HoldState, HookDetector, UppercutDetector
+from core.judgment_records import PHASE_ENTER, PHASE_EXIT, NoteType
+from core.motion_history import MotionHistory
+from core.pose_kinematics import PoseKinematics
+from core.pose_landmarks import NUM_LANDMARKS, RIGHT_ELBOW, RIGHT_SHOULDER, RIGHT_WRIST
+
+WIDTH, HEIGHT = 640, 480
+DT = 1 / 30
+
+
+def _frame():
+    kin = PoseKinematics(WIDTH, (320, 144), 100, 1)
+    history = MotionHistory.from_config(None)
+    return GestureFrame(kin, history, {"shoulder_w": 200.0, "duck_line_y": 400}, WIDTH, HEIGHT)
+
+
+def _run(detector, wrist_path):
+    """화면 왼쪽 손(RIGHT_WRIST)을 wrist_path를 따라 움직이며 감지된 이벤트 타입을 모읍니다."""
+    frame = _frame()
+    found = []
+    for i, wrist in enumerate(wrist_path):
+        lm = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+        lm[RIGHT_SHOULDER, :2] = (200, 200)
+        lm[RIGHT_ELBOW, :2] = (200, 300)
+        lm[RIGHT_WRIST, :2] = wrist
+        now = 10.0 + i * DT
+        frame.history.push(lm[:, :2], now)
+        if frame.kinematics.update(lm, now, 200.0):
+            frame.landmarks = lm
+            frame.now = now
+            found.extend(event.type for event in detector.detect(frame))
+    return found
+
+
+def test_hook_on_fast_inward_swing():
+    detector = HookDetector({}, {})
+    # 팔꿈치를 굽힌 채 (마지막 프레임들에서 60~65도) 중앙 쪽(+x)으로 프레임당 30px (= 4.5 어깨 너비/초)
+    assert _run(detector, [(200 + 30 * i, 300 - 100) for i in range(8)]) == [NoteType.HOOK_L]
+
+
+def test_no_hook_on_slow_swing():
+    detector = HookDetector({}, {})
+    assert _run(detector, [(200 + 5 * i, 300 - 100) for i in range(8)]) == []
+
+
+def test_single_frame_jitter_is_smoothed():
+    """한 프레임만 튄 랜드마크는 두 프레임 차분이면 임계값을 넘지만 모션 기록 미분으로는 넘지 않음"""
+    path = [(380, 250)] * 8  # 팔꿈치 각도 약 74도
+    path[-1] = (398, 250)  # 두 프레임 차분 2.7 어깨 너비/초
+    assert _run(HookDetector({}, {}), path) == []
+
+
+def test_uppercut_on_fast_upward_motion():
+    detector = UppercutDetector({}, {})
+    assert _run(detector, [(280, 260 - 30 * i) for i in range(8)]) == [NoteType.UPPERCUT_L]
+
+
+def test_wrist_velocity_computed_once_per_frame():
+    frame = _frame()
+    lm = np.zeros((NUM_LANDMARKS, 2), dtype=np.float32)
+    frame.history.push(lm, 0.0)
+    lm[RIGHT_WRIST] = (20, 0)
+    frame.history.push(lm, DT)
+    frame.now = DT
+    first = frame.wrist_velocity()
+    assert first[0, 0] > 0
+    assert frame.wrist_velocity() is first
+
+
+def test_hold_state_debounces_enter_and_exit():
+    hold = HoldState(enter_debounce_s=0.05, exit_debounce_s=0.1)
+    assert hold.update(True, 1.00) is None
+    assert hold.update(True, 1.06) == PHASE_ENTER
+    assert hold.active and hold.started_at == 1.00
+    assert hold.update(False, 1.50) is None
+    assert hold.update(True, 1.55) is None  # 종료 디바운스 전에 돌아오면 계속 유지
+    assert hold.update(False, 1.60) is None
+    assert hold.update(False, 1.71) == PHASE_EXIT
+    assert not hold.active
+    assert hold.duration == pytest.approx(0.60)
+
+
+def test_hold_state_ignores_short_blip_and_reset():
+    hold = HoldState(enter_debounce_s=0.05, exit_debounce_s=0.1)
+    hold.update(True, 1.00)
+    assert hold.update(False, 1.02) is None
+    assert hold.update(True, 1.04) is None
+    assert hold.update(True, 1.08) is None  # 다시 처음 충족된 1.04부터 셈
+    hold.reset()
+    assert hold.update(True, 1.20) is None and not hold.active
+
+
+def test_detector_without_detect_cannot_be_constructed():
+    class Incomplete(GestureDetector):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete({}, {})
@@ -0,0 +1,85 @@
+"""노트 타입별 판정 전략 (리플레이 엔진으로 실제 판정 경로를 그대로 실행)"""
+import numpy as np
+
+from core.judgment_records import PHASE_ENTER, PHASE_EXIT, HitEvent, NoteType
+from core.pose_landmarks import NOSE, NUM_LANDMARKS
+from core.replay import ReplaySession
+from tests.conftest import SONG_START
+
+
+def _results(engine, beatmap, events):
+    session = ReplaySession(beatmap, SONG_START, [HitEvent(typ, SONG_START + t) for typ, t in events])
+    return [(j.result, j.note_type) for j in engine.run(session).judgments]
+
+
+def test_weave_event_inside_weave_window(engine):
+    results = _results(engine, [{"t": 1.0, "type": "WEAVE_L"}], [(NoteType.WEAVE_L, 1.15)])
+    assert results == [("GREAT", NoteType.WEAVE_L)]
+
+
+def test_weave_event_outside_weave_window_is_not_matched(engine):
+    """위빙 이벤트는 일반 매칭 창(펀치)이 아니라 위빙 판정 창(JUDGMENT_WINDOW) 안에서만 노트와 매칭"""
+    results = _results(engine, [{"t": 1.0, "type": "WEAVE_L"}], [(NoteType.WEAVE_L, 0.7)])
+    assert results == [("MISS", NoteType.WEAVE_L)]
+
+
+def test_punch_keeps_general_match_window(engine):
+    results = _results(engine, [{"t": 1.0, "type": "JAB_L"}], [(NoteType.JAB_L, 0.7)])
+    assert results == [("GOOD", NoteType.JAB_L)]
+
+
+def _duck_frames(duck_from, duck_until=2.0, fps=30.0):
+    """코가 duck_from ~ duck_until 동안 더킹 라인(높이 480의 절반) 아래에 있는 랜드마크 스트림"""
+    frames = []
+    for i in range(int(2.5 * fps)):
+        t = i / fps
+        landmarks = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+        landmarks[NOSE, :2] = (320, 300 if duck_from <= t < duck_until else 100)
+        frames.append((SONG_START + t, landmarks))
+    return frames
+
+
+def _duck_judgments(engine, duck_from, duck_until=2.0):
+    session = ReplaySession([{"t": 1.0, "type": "DUCK"}], SONG_START, frames=_duck_frames(duck_from, duck_until))
+    return [(j.result, round(j.delta, 3), j.t - SONG_START) for j in engine.run(session).judgments]
+
+
+def _duck_results(engine, duck_from, duck_until=2.0):
+    return [(result, delta) for result, delta, _ in _duck_judgments(engine, duck_from, duck_until)]
+
+
+def test_early_hold_judged_when_note_arrives_if_still_held(engine):
+    """이른 더킹은 시작 이벤트로 매칭되든(매칭 창 안) 유지 경로로 보든(매칭 창 밖) 노트 시각에 유지 중이면 같은 판정"""
+    by_event = _duck_judgments(engine, 0.85)
+    by_hold = _duck_judgments(engine, 0.2)
+    assert [j[:2] for j in by_event] == [j[:2] for j in by_hold] == [("PERFECT", 0.0)]
+    assert by_event[0][2] >= 1.0 and by_hold[0][2] >= 1.0  # 노트 시각 전에 판정하지 않음
+
+
+def test_early_hold_released_before_note_is_not_perfect(engine):
+    """매칭 창 안에서 시작했지만 노트 시각 전에 풀면 유지한 것이 아님"""
+    assert _duck_results(engine, 0.7, duck_until=0.8) == [("MISS", 0.0)]
+
+
+def test_hold_started_late_graded_by_lateness(engine):
+    assert _duck_results(engine, 1.09) == [("GREAT", 0.1)]  # 첫 더킹 프레임 1.1초
+
+
+def test_hold_released_long_before_note_misses(engine):
+    assert _duck_results(engine, 0.1, duck_until=0.3) == [("MISS", 0.0)]
+
+
+def _duck_event_results(engine, start, duration=None):
+    """포즈 없이 기록된 더킹 시작(/종료) 이벤트로 판정"""
+    events = [HitEvent(NoteType.DUCK, SONG_START + start, PHASE_ENTER)]
+    if duration is not None:
+        events.append(HitEvent(NoteType.DUCK, SONG_START + start, PHASE_EXIT, duration))
+    session = ReplaySession([{"t": 1.0, "type": "DUCK"}], SONG_START, events)
+    return [(j.result, round(j.delta, 3)) for j in engine.run(session).judgments]
+
+
+def test_duck_events_without_pose_use_same_rule(engine):
+    assert _duck_event_results(engine, 0.85) == [("PERFECT", 0.0)]
+    assert _duck_event_results(engine, 0.85, duration=0.5) == [("PERFECT", 0.0)]
+    assert _duck_event_results(engine, 0.7, duration=0.1) == [("MISS", 0.0)]
+    assert _duck_event_results(engine, 1.1, duration=0.3) == [("GREAT", 0.1)]
@@ -0,0 +1,56 @@
+"""MotionHistory 원형 버퍼 / Savitzky-Golay 미분"""
+import numpy as np
+import pytest
+
+from core.motion_history import MotionHistory
+
+
+def _linear(history, n, velocity, accel=0.0, dt=1 / 30):
+    for i in range(n):
+        t = i * dt
+        history.push(np.full((1, 2), velocity * t + 0.5 * accel * t * t, dtype=np.float32), t)
+    return (n - 1) * dt
+
+
+def test_wraps_around_and_keeps_latest():
+    history = MotionHistory(capacity=4, num_points=1)
+    for i in range(6):
+        history.push(np.full((1, 2), i, dtype=np.float32), float(i))
+    assert len(history) == 4
+    assert history.latest()[0, 0] == 5
+    assert history.latest_time(3) == 2.0
+    assert history.latest(4) is None
+    times, _ = history.window_since(3.5)
+    assert times.tolist() == [4.0, 5.0]
+
+
+def test_velocity_of_linear_motion():
+    history = MotionHistory(num_points=1)
+    _linear(history, 10, 120.0)
+    assert history.velocity()[0] == pytest.approx([120.0, 120.0], rel=1e-3)
+
+
+def test_acceleration_of_quadratic_motion():
+    history = MotionHistory(num_points=1)
+    _linear(history, 10, 10.0, accel=300.0)
+    assert history.acceleration()[0] == pytest.approx([300.0, 300.0], rel=1e-2)
+
+
+def test_derivative_needs_enough_samples():
+    history = MotionHistory(num_points=1)
+    assert history.velocity() is None
+    _linear(history, 1, 1.0)
+    assert history.velocity() is None
+    history.clear()
+    _linear(history, 2, 1.0)
+    assert history.velocity() is not None
+    assert history.acceleration() is None
+    history.clear()
+    assert len(history) == 0 and history.velocity() is None
+
+
+def test_duplicate_timestamps_give_no_derivative():
+    history = MotionHistory(num_points=1)
+    for _ in range(3):
+        history.push(np.zeros((1, 2), dtype=np.float32), 1.0)
+    assert history.velocity() is None
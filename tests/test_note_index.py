@@ -0,0 +1,60 @@
+"""NoteIndex / NoteManager 정리"""
+from core.judgment_records import NoteType
+from core.note_index import NoteIndex
+from core.note_manager import NoteManager
+
+JUDGE_TIMING = {"perfect": 0.1, "great": 0.2, "good": 0.3}
+
+
+def _manager():
+    return NoteManager(640, 480, 1.2, {}, JUDGE_TIMING, False)
+
+
+def _spawn(manager, *items):
+    return [manager.spawn_note({"t": t, "type": typ}, 640, 480, (320, 144)) for t, typ in items]
+
+
+def test_nearest_picks_closest_unjudged_note_within_window():
+    manager = _manager()
+    a, b, c = _spawn(manager, (1.0, "JAB_L"), (1.5, "JAB_L"), (1.6, "JAB_R"))
+    index = manager.index
+    assert index.nearest(NoteType.JAB_L, 1.2, 0.5) is a
+    assert index.nearest(NoteType.JAB_L, 1.3, 0.5) is b
+    assert index.nearest(NoteType.JAB_L, 2.5, 0.5) is None
+    assert index.nearest(NoteType.WEAVE_L, 1.0, 0.5) is None
+    a.hit = True
+    assert index.nearest(NoteType.JAB_L, 1.0, 0.6) is b
+    assert index.nearest(NoteType.JAB_L, 1.0, 0.4) is None
+
+
+def test_out_of_order_add_keeps_time_order():
+    manager = _manager()
+    late, early, middle = _spawn(manager, (3.0, "DUCK"), (1.0, "DUCK"), (2.0, "DUCK"))
+    index = manager.index
+    assert list(index.until(NoteType.DUCK, 10.0)) == [early, middle, late]
+    assert list(index.window(NoteType.DUCK, 1.5, 3.0)) == [middle, late]
+    assert list(index.expired(NoteType.DUCK, 2.0)) == [early]
+
+
+def test_compact_advances_cursor_and_trims():
+    manager = _manager()
+    notes = _spawn(manager, *[(i * 0.1, "JAB_L") for i in range(NoteIndex.COMPACT_MIN * 2)])
+    index = manager.index
+    for note in notes[:NoteIndex.COMPACT_MIN]:
+        note.hit = True
+    index.compact()
+    assert list(index.until(NoteType.JAB_L, 100.0)) == notes[NoteIndex.COMPACT_MIN:]
+    assert len(index._notes[NoteType.JAB_L]) == NoteIndex.COMPACT_MIN
+    assert index._head[NoteType.JAB_L] == 0
+
+
+def test_retire_removes_only_judged_notes_in_order():
+    manager = _manager()
+    notes = _spawn(manager, *[(i * 0.1, "JAB_L" if i % 2 else "JAB_R") for i in range(10)])
+    judged = notes[1::3]
+    for note in judged:
+        note.hit = True
+    manager.retire(judged)
+    assert manager.get_active_notes() == [n for n in notes if n not in judged]
+    manager.retire([])
+    assert len(manager.get_active_notes()) == len(notes) - len(judged)
@@ -0,0 +1,30 @@
+"""Tasks 백엔드 모델 파일 내려받기 (mediapipe 없이 확인 가능한 부분)"""
+import json
+
+from core import pose_backend
+from tests.conftest import ROOT
+
+
+def test_configured_model_paths_have_download_urls():
+    with open(f"{ROOT}/config/rules.json", encoding="utf-8") as f:
+        model_paths = json.load(f)["pose_inference"]["tasks"]["model_paths"]
+    assert model_paths
+    for path in model_paths:
+        assert path.rsplit("/", 1)[-1] in pose_backend.TASKS_MODEL_URLS
+
+
+def test_download_skips_existing_and_fetches_missing(tmp_path, monkeypatch):
+    source = tmp_path / "source.task"
+    source.write_bytes(b"model")
+    monkeypatch.setitem(pose_backend.TASKS_MODEL_URLS, "pose_landmarker_lite.task", source.as_uri())
+    monkeypatch.setitem(pose_backend.TASKS_MODEL_URLS, "pose_landmarker_full.task", source.as_uri())
+    existing = tmp_path / "models" / "pose_landmarker_full.task"
+    existing.parent.mkdir()
+    existing.write_bytes(b"old")
+    missing = tmp_path / "models" / "pose_landmarker_lite.task"
+
+    downloaded = pose_backend.download_tasks_models([str(missing), str(existing)])
+    assert downloaded == [str(missing)]
+    assert missing.read_bytes() == b"model"
+    assert existing.read_bytes() == b"old"
+    assert not (tmp_path / "models" / "pose_landmarker_lite.task.part").exists()
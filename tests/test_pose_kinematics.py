@@ -0,0 +1,145 @@
+"""PoseKinematics / 잽 정책 / 포즈를 잃었을 때의 상태 초기화"""
+import numpy as np
+import pytest
+
+from core.judgment_records import NoteType
+from core.pose_analyzer import PoseAnalyzer
+from core.pose_kinematics import JabPolicy, PoseKinematics
+from core.pose_landmarks import (
+    NUM_LANDMARKS, NOSE, LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_ELBOW, RIGHT_ELBOW, LEFT_WRIST, RIGHT_WRIST,
+    LEFT_PINKY, RIGHT_PINKY, LEFT_INDEX, RIGHT_INDEX, LEFT_THUMB, RIGHT_THUMB,
+)
+from core.replay import ReplaySession
+from tests.conftest import SONG_START
+
+WIDTH, HEIGHT = 640, 480
+FPS = 30.0
+JAB_TYPES = (NoteType.JAB_L, NoteType.JAB_R)
+
+
+def _pose(right_hand):
+    """화면 왼쪽 손(JAB_L = RIGHT_WRIST)만 right_hand 위치에 둔 픽셀 좌표 랜드마크 (33, 4)"""
+    lm = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+    lm[:, 3] = 1.0
+    lm[NOSE, :2] = (320, 100)
+    lm[RIGHT_SHOULDER, :2] = (260, 240)
+    lm[LEFT_SHOULDER, :2] = (380, 240)
+    lm[RIGHT_ELBOW, :2] = (240, 300)
+    lm[LEFT_ELBOW, :2] = (400, 300)
+    for index in (LEFT_WRIST, LEFT_PINKY, LEFT_INDEX, LEFT_THUMB):
+        lm[index, :2] = (390, 250)
+    for index in (RIGHT_WRIST, RIGHT_PINKY, RIGHT_INDEX, RIGHT_THUMB):
+        lm[index, :2] = right_hand
+    return lm
+
+
+GUARD = _pose((250, 230))  # 어깨 옆, 히트존(중심 (320, 144), 반지름 100) 밖
+PUNCH = _pose((300, 150))  # 히트존 안, 어깨에서 멀어짐
+
+
+def _kinematics():
+    return PoseKinematics(WIDTH, (320, 144), 100, 2)
+
+
+def test_first_frame_has_no_velocity():
+    kin = _kinematics()
+    assert kin.update(GUARD, 0.0, 200.0) is False
+    assert kin.update(PUNCH, 1 / FPS, 200.0) is True
+    assert kin.speed[0] > 1.0
+    assert kin.in_zone[0] and not kin.in_zone[1]
+
+
+def test_reset_invalidates_previous_frame():
+    kin = _kinematics()
+    kin.update(GUARD, 0.0, 200.0)
+    kin.reset()
+    assert kin.update(PUNCH, 0.1, 200.0) is False
+    assert kin.speed[0] == 0.0
+
+
+def test_crossing_time_interpolates_between_frames():
+    kin = _kinematics()
+    kin.prev_t, kin.t = 1.0, 2.0
+    assert kin.crossing_time(0.0, 4.0, 1.0) == pytest.approx(1.25)
+    assert kin.crossing_time(10.0, 0.0, 5.0, rising=False) == pytest.approx(1.5)
+
+
+def test_crossing_time_already_met_returns_previous_frame():
+    kin = _kinematics()
+    kin.prev_t, kin.t = 1.0, 2.0
+    assert kin.crossing_time(3.0, 4.0, 1.0) == 1.0
+    assert kin.crossing_time(0.0, 5.0, 5.0, rising=False) == 1.0
+    assert kin.crossing_time(2.0, 2.0, 1.0) == 1.0
+
+
+def _analyzer(config):
+    analyzer = PoseAnalyzer(WIDTH, HEIGHT, config.rules, config.ui)
+    analyzer.calib_data["shoulder_w"] = 200
+    return analyzer
+
+
+def _jabs(events):
+    return [event for event in events if event.type in JAB_TYPES]
+
+
+def test_jab_detected_between_consecutive_frames(config):
+    analyzer = _analyzer(config)
+    analyzer.analyze_landmarks(GUARD, 10.0)
+    events = _jabs(analyzer.analyze_landmarks(PUNCH, 10.0 + 1 / FPS))
+    assert [event.type for event in events] == [NoteType.JAB_L]
+
+
+@pytest.mark.parametrize("test_mode", [False, True])
+def test_no_jab_from_frames_across_tracking_gap(config, test_mode):
+    """포즈를 잃기 전 프레임과 되찾은 뒤 프레임 사이에서 속도/재진입을 계산하지 않음"""
+    analyzer = _analyzer(config)
+    analyzer.set_test_mode(test_mode)
+    analyzer.analyze_landmarks(GUARD, 10.0)
+    analyzer.analyze_landmarks(GUARD, 10.0 + 1 / FPS)
+    analyzer.analyze_landmarks(None, 10.0 + 2 / FPS)
+    analyzer.analyze_landmarks(None, 10.0 + 3 / FPS)
+    assert _jabs(analyzer.analyze_landmarks(PUNCH, 10.0 + 4 / FPS)) == []
+    assert _jabs(analyzer.analyze_landmarks(PUNCH, 10.0 + 5 / FPS)) == []
+
+
+def _frames(gap):
+    """1초 지점 JAB_L 노트에 맞춰 가드 → (gap이면 2프레임 추적 끊김) → 펀치"""
+    frames = []
+    for i in range(int(1.5 * FPS)):
+        t = SONG_START + i / FPS
+        if i < 28:
+            frames.append((t, GUARD))
+        elif i < 30 and gap:
+            frames.append((t, None))
+        else:
+            frames.append((t, PUNCH if i >= 30 else GUARD))
+    return frames
+
+
+def _session(gap):
+    return ReplaySession(
+        [{"t": 1.0, "type": "JAB_L"}],
+        SONG_START,
+        frames=_frames(gap),
+        frame_size=(WIDTH, HEIGHT),
+        calib_data={"shoulder_w": 200},
+    )
+
+
+def test_replay_jab_hits_without_gap(engine):
+    result = engine.run(_session(gap=False))
+    assert [j.result for j in result.judgments] == ["PERFECT"]
+
+
+def test_replay_tracking_gap_does_not_fake_jab(engine):
+    """추적이 끊긴 구간을 사이에 둔 두 프레임으로 잽이 감지되어 끊긴 구간 안의 시각으로 판정되면 안 됨"""
+    result = engine.run(_session(gap=True))
+    assert [j.result for j in result.judgments] == ["MISS"]
+
+
+def test_jab_policy_without_detect_cannot_be_constructed():
+    class Incomplete(JabPolicy):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete(0.25)
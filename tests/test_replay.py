@@ -0,0 +1,78 @@
+"""ReplayEngine: 헤드리스 판정/채점"""
+import pytest
+
+from core.judgment_records import PHASE_ENTER, HitEvent, JudgmentJournal, Judgment, NoteType
+from core.replay import ReplaySession, dump_session, load_session
+from tests.conftest import SONG_START
+
+
+def _session(beatmap, events):
+    return ReplaySession(beatmap, SONG_START, [HitEvent(typ, SONG_START + t, *rest) for typ, t, *rest in events])
+
+
+def test_every_judgment_in_a_frame_is_recorded(engine):
+    """한 프레임에 판정이 HUD 기록 길이(10개)보다 많이 나와도 모두 기록"""
+    beatmap = [{"t": 1.0, "type": "JAB_L"} for _ in range(30)]
+    result = engine.run(_session(beatmap, []))
+    assert result.counts() == {"MISS": 30}
+    assert len(result.scores) == 30
+
+
+def test_scores_follow_judgments(engine):
+    beatmap = [{"t": 1.0, "type": "JAB_L"}, {"t": 2.0, "type": "JAB_R"}, {"t": 3.0, "type": "JAB_L"}]
+    result = engine.run(_session(beatmap, [(NoteType.JAB_L, 1.0), (NoteType.JAB_R, 2.0)]))
+    assert [j.result for j in result.judgments] == ["PERFECT", "PERFECT", "MISS"]
+    assert [(p.score, p.combo) for p in result.scores] == [(300, 1), (600, 2), (600, 0)]
+    assert result.score == 600 and result.max_combo == 2
+
+
+def test_bomb_hit_penalizes_and_avoided_bomb_is_not_judged(engine):
+    beatmap = [
+        {"t": 1.0, "type": "JAB_L"},
+        {"t": 2.0, "type": "BOMB", "lane": "L"},
+        {"t": 3.0, "type": "BOMB", "lane": "R"},
+    ]
+    result = engine.run(_session(beatmap, [(NoteType.JAB_L, 1.0), (NoteType.JAB_L, 2.0)]))
+    assert [(j.result, j.note_type) for j in result.judgments] == [
+        ("PERFECT", NoteType.JAB_L), ("BOMB!", NoteType.BOMB),
+    ]
+    assert result.score == 0  # 300 - 500, 0 아래로 내려가지 않음
+    assert result.scores[-1].combo == 0
+
+
+def test_events_before_song_start_are_ignored(engine):
+    result = engine.run(_session([{"t": 0.2, "type": "JAB_L"}], [(NoteType.JAB_L, -0.1)]))
+    assert [j.result for j in result.judgments] == ["MISS"]
+
+
+def test_replay_is_deterministic_and_round_trips(engine, tmp_path):
+    beatmap = [{"t": 0.5 + 0.25 * i, "type": ("JAB_L", "JAB_R", "DUCK", "WEAVE_L")[i % 4]} for i in range(40)]
+    events = [(NoteType.parse(item["type"]), item["t"] + 0.03 * ((i % 5) - 2)) for i, item in enumerate(beatmap)]
+    events = [(typ, t, PHASE_ENTER) if typ == NoteType.DUCK else (typ, t) for typ, t in events]
+    session = _session(beatmap, events)
+    first = engine.run(session)
+    assert engine.run(session)[:4] == first[:4]
+
+    path = tmp_path / "session.json"
+    dump_session(session, str(path))
+    loaded = load_session(str(path))
+    assert loaded.events == session.events
+    assert engine.run(loaded)[:4] == first[:4]
+
+
+def test_rejects_song_start_at_zero(engine):
+    with pytest.raises(ValueError):
+        engine.run(ReplaySession([], 0.0))
+
+
+def test_journal_keeps_latest_and_reports_new_entries():
+    journal = JudgmentJournal(maxlen=3)
+    for i in range(5):
+        journal.record(Judgment("MISS", NoteType.JAB_L, 0.0, float(i)))
+    assert journal.total == 5
+    assert [j.t for j in journal] == [4.0, 3.0, 2.0]
+    assert [j.t for j in journal.since(3)] == [3.0, 4.0]
+    assert [j.t for j in journal.since(0)] == [2.0, 3.0, 4.0]  # 최대 maxlen개
+    assert journal.since(5) == []
+    journal.clear()
+    assert journal.total == 0 and len(journal) == 0